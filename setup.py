@@ -9,6 +9,7 @@ setup(name='validity',
       license='GPL',
       packages=['validity'],
       zip_safe=False,
+      extras_require={'numpy': ['numpy']},
       test_suite='nose.collector',
       tests_require=['nose'],
       )
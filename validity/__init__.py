@@ -35,6 +35,8 @@ Validators, implemented in validity module
 +----------------------------+--------------------------------------------------------------------------------+
 | :class:`.Between`          | **between min and max values** comparator.                                     |
 +----------------------------+--------------------------------------------------------------------------------+
+| :class:`.InIntervals`      | **in set of intervals** comparator.                                            |
++----------------------------+--------------------------------------------------------------------------------+
 | :class:`.TypeIs`           | **check value type**                                                           |
 +----------------------------+--------------------------------------------------------------------------------+
 | :class:`.IsNone`           | **check if value is None**                                                     |
@@ -74,7 +76,26 @@ Main features of *validators*
     - Any *validator* can be called as function (see :meth:`~.Base.__call__`).
     - Any *validator* can check if all given values is valid with :meth:`~.Base.all_is_valid`.
     - Any *validator* can split pack of values to valid and not_valid lists with :meth:`~.Base.filter_values` method.
+    - Any *validator* can lazily check stream of values with :meth:`~.Base.iter_partition`, :meth:`~.Base.iter_valid`, :meth:`~.Base.iter_invalid` and :meth:`~.Base.route_values` methods.
     - Any *validator* can be represented as human-readable logical condition with :meth:`~.Base.get_condition_text` method
+    - Any *validator* can return lazy error object, that renders (and truncates) condition text only when needed, with ``get_error(value, lazy=True)``
+    - Any *validator* can explain result with leaves, that decided it, checking value only once, with :meth:`~.Base.explain` method
+    - Any *validator* can be compiled to plain python function with :meth:`~.Base.compile` method
+    - Any *validator* can check large batch of values in pool of processes with :meth:`~.Base.filter_values_parallel` method
+    - Any *validator* can be checked in event loop with :meth:`~.Base.ais_valid`, asynchronous operands of logical operators are checked concurrently
+    - Blocking comparators (see :attr:`.BaseComparator.blocking`) check values in thread pool
+    - Calls, results and time of each node of validators tree can be recorded with :func:`.profile`
+    - Validators can be serialized to compact JSON or binary data, cached on disk and loaded lazily (see :mod:`validity.serialization`)
+    - Any *validator* can memoize validation results with :meth:`~.Base.cached` method
+    - Comparators and logical operators are compared structurally, equal subtrees can be shared with :class:`.InternPool`
+    - Many named *validators* can be matched against one value with indexed :class:`.RuleSet`
+    - :class:`.TypeIs` checks many types (or their subclasses) with one indexed lookup, :class:`.Or` merges type checks of operands
+    - Records (dicts) can be checked with :class:`.Schema` of item *validators*, errors of all items can be collected with :meth:`.Schema.get_errors`
+    - Values, sorted by numeric key in :class:`.SortedIndex`, can be selected with numeric *validators* by bisect (see :func:`.select`)
+    - Numeric *validators* can be reduced to set of disjoint intervals with :meth:`~.Base.simplify` method
+    - Nested logical operators can be flattened, double negations removed and repeated operands deduplicated with :meth:`~.Base.normalize` method
+    - Any *validator* can check numpy array and return boolean mask with :meth:`~.Base.is_valid_array` method
+    - Columns of numpy structured arrays can be checked with validators of fields by :func:`.validate_columns`
 
 Any validator extends one of :ref:`base_classes`. This means that all of validators implements:
 
@@ -140,21 +161,45 @@ More complex example
 
 """
 
+import sys
+
 from validity.comparator import BaseComparator, \
     GT, GTE, LT, LTE, EQ, NotEQ, \
     Any, \
-    Between, \
+    Between, InIntervals, \
     TypeIs, IsNone, \
     Len, Count
 from validity.logical_operator import Base, BaseLogicalOperator, Or, And, Not
+from validity.cache import Cached
+from validity.intern import InternPool, Shared
+from validity.ruleset import RuleSet
+from validity.schema import Key, Optional, Schema
+from validity.interval import IntervalSet
+from validity.sorted_index import SortedIndex, select
+from validity.error import Error, Explanation
+from validity.profiling import profile, Profile
 
 __all__ = [
     # comparators
     'BaseComparator',
     'GT', 'GTE', 'LT', 'LTE', 'EQ', 'NotEQ',
     'Any',
-    'Between',
+    'Between', 'InIntervals',
     'TypeIs', 'IsNone',
     'Len', 'Count',
     # logical operators
-    'Base', 'BaseLogicalOperator', 'Or', 'And', 'Not']
+    'Base', 'BaseLogicalOperator', 'Or', 'And', 'Not',
+    # wrappers
+    'Cached', 'Shared',
+    # records
+    'Key', 'Optional', 'Schema',
+    # selection
+    'SortedIndex', 'select',
+    # helpers
+    'IntervalSet', 'Error', 'Explanation', 'InternPool', 'RuleSet',
+    # profiling
+    'profile', 'Profile']
+
+if sys.version_info >= (3, 7):
+    from validity.aio import AsyncBaseComparator
+    __all__.append('AsyncBaseComparator')
@@ -0,0 +1,152 @@
+"""
+
+Asynchronous validation (python 3.7+).
+
+Validators, that wait for I/O (cache lookup, database query, etc.), can be implemented as
+:class:`.AsyncBaseComparator` with ``async def ais_valid(self, value)`` method.
+Any *validator* can be checked in event loop with ``await validator.ais_valid(value)``
+(see :meth:`~.Base.ais_valid`)::
+
+    >>> import asyncio
+    >>> from validity import AsyncBaseComparator, And, TypeIs, GT
+    >>>
+    >>> class IsRegistered(AsyncBaseComparator):
+    ...     _condition_template = "must be registered in {operand}"
+    ...     async def ais_valid(self, value):
+    ...         await asyncio.sleep(0.1)  # some I/O
+    ...         return value in (1, 2, 3)
+    ...
+    >>> test = And(TypeIs(int), GT(0), IsRegistered('users'), IsRegistered('admins'))
+    >>> asyncio.run(test.ais_valid(2))  # both lookups are made concurrently, in 0.1 second
+    True
+
+:class:`.And` and :class:`.Or` check synchronous operands first (one by one, in order of operands),
+then run asynchronous operands concurrently. As soon as result is decided
+(one of :class:`.Or` operands is valid, or one of :class:`.And` operands is not valid),
+remaining asynchronous operands are cancelled.
+
+"""
+
+import asyncio
+
+from validity.comparator import BaseComparator, Len
+from validity.logical_operator import And, Or, Not
+
+__docformat__ = 'reStructuredText'
+
+
+def _checks_as(validator, klass):
+    return isinstance(validator, klass) and type(validator).is_valid == klass.is_valid
+
+
+async def ais_valid(validator, value):
+    """
+    Check value with validator in event loop (see :meth:`~.Base.ais_valid`).
+
+    Synchronous validators (without :class:`.AsyncBaseComparator` inside) are checked with
+    :meth:`~.Base.is_valid` directly. Other validators, that are not :class:`.And`, :class:`.Or`,
+    :class:`.Not`, :class:`.Len` or :class:`.AsyncBaseComparator`, are checked in default executor of event loop.
+
+    :param validator: any validator
+    :type validator: Base
+    :param value: value for check
+    :return: result of validation
+    :rtype: bool
+    """
+    if not validator.is_async():
+        return validator.is_valid(value)
+    if isinstance(validator, AsyncBaseComparator):
+        return bool(await validator.ais_valid(value))
+    if _checks_as(validator, Or):
+        return await _any_valid(validator.operands, value, True)
+    if _checks_as(validator, And):
+        return await _any_valid(validator.operands, value, False)
+    if _checks_as(validator, Not):
+        return not await ais_valid(validator.operands[0], value)
+    if _checks_as(validator, Len):
+        try:
+            length = len(value)
+        except TypeError:
+            length = None  # items of iterable are counted in executor
+        if length is not None:
+            return await ais_valid(validator.operand, length)
+    return await asyncio.get_running_loop().run_in_executor(None, validator.is_valid, value)
+
+
+async def _any_valid(operands, value, decisive_result):
+    """
+    Check operands of logical operator, until one of them returns decisive_result.
+
+    :param operands: operands of logical operator
+    :type operands: tuple
+    :param value: value for check
+    :param decisive_result: result of operand, that decides result of operator (True for Or, False for And)
+    :type decisive_result: bool
+    :return: decisive_result if any of operands returned it, otherwise not decisive_result
+    :rtype: bool
+    """
+    waiting = []
+    for operand in operands:
+        if operand.is_async():
+            waiting.append(operand)
+        elif bool(operand.is_valid(value)) is decisive_result:
+            return decisive_result
+
+    pending = set(asyncio.ensure_future(ais_valid(operand, value)) for operand in waiting)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if bool(task.result()) is decisive_result:
+                    return decisive_result
+        return not decisive_result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class AsyncBaseComparator(BaseComparator):
+    """
+    Base class for asynchronous comparators.
+    Child classes must implement ``async def ais_valid(self, value)`` method.
+
+    Synchronous :meth:`is_valid` runs :meth:`ais_valid` in new event loop,
+    so it can not be called while event loop is running (use :meth:`ais_valid` there).
+    """
+
+    __slots__ = ()
+
+    _condition_template = 'Base async comparator. operand={operand}'
+
+    def is_async(self):
+        """
+        :return: True
+        :rtype: bool
+        """
+        return True
+
+    async def ais_valid(self, value):
+        """
+        Check if given value is valid.
+
+        :param value: value for validating
+        :return: True if value is valid, otherwise - False
+        :rtype: bool
+        :raises ~exceptions.NotImplementedError: child class must implement 'ais_valid(self, value)' method
+        """
+        raise NotImplementedError("async comparator must implement 'ais_valid(self, value)' method")
+
+    def is_valid(self, value):
+        """
+        Run :meth:`ais_valid` in new event loop.
+
+        :param value: value for validating
+        :return: result of :meth:`ais_valid`
+        :rtype: bool
+        :raises ~exceptions.RuntimeError: if it is called from running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.ais_valid(value))
+        raise RuntimeError("is_valid can not be called from running event loop, use ais_valid")
@@ -0,0 +1,322 @@
+"""
+
+Benchmarks of *validators*.
+
+Module can be run as script, it measures speed of validation and prints JSON report,
+so results of different versions of library (or different rules) can be compared::
+
+    $ python -m validity.benchmarks --sizes 1000 1000000 --output before.json
+    $ python -m validity.benchmarks --groups trees batches --min-time 1
+
+Benchmarks are split to groups:
+
+    - ``comparators`` - :meth:`~.Base.is_valid` of each comparator for valid and not valid value,
+    - ``trees`` - :class:`.And`, :class:`.Or` and :class:`.Not` trees of different depth and width,
+      built so, that each leaf is checked,
+    - ``batches`` - :meth:`~.Base.filter_values` and :meth:`~.Base.all_is_valid` for batches of given sizes,
+    - ``errors`` - rendering of condition text and errors.
+
+Each result is dictionary with keys:
+
+    - ``group``, ``name`` - what is measured,
+    - ``size`` - count of values, checked by one call,
+    - ``calls`` - count of calls in one measurement,
+    - ``seconds`` - best time of all calls (of ``repeat`` measurements),
+    - ``per_call`` - latency of one call, in seconds,
+    - ``per_second`` - throughput, checked values (or rendered texts) per second,
+
+and other keys, that describe measured case (like ``depth`` and ``width`` of tree).
+
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+
+from validity.comparator import GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, InIntervals, TypeIs, IsNone, Len, Count
+from validity.interval import IntervalSet
+from validity.logical_operator import And, Or, Not
+
+__docformat__ = 'reStructuredText'
+
+
+GROUPS = ('comparators', 'trees', 'batches', 'errors')
+"""names of benchmark groups in order of running"""
+
+default_sizes = (1000, 10000, 100000)
+"""batch sizes, used if they are not given (up to 10 ** 7 can be given in command line)"""
+
+
+def measure(function, min_time=0.2, repeat=3):
+    """
+    Measure time of function calls.
+    Count of calls is increased (1, 2, 5, 10, 20, 50, ...) until they take at least ``min_time``,
+    then calls are measured ``repeat`` times and best time is taken.
+
+    :param function: function without arguments
+    :type function: callable
+    :param min_time: minimal time of one measurement, in seconds
+    :type min_time: float
+    :param repeat: count of measurements
+    :type repeat: int
+    :return: (calls, seconds)
+    :rtype: tuple
+    """
+    timer = timeit.Timer(function)
+    calls = 1
+    multipliers = (2, 2.5, 2)
+    step = 0
+    while True:
+        seconds = timer.timeit(calls)
+        if seconds >= min_time:
+            break
+        calls = int(calls * multipliers[step % len(multipliers)])
+        step += 1
+    for _ in range(1, repeat):
+        seconds = min(seconds, timer.timeit(calls))
+    return calls, seconds
+
+
+def build_tree(operators, depth, width, valid=True):
+    """
+    Build tree of logical operators, where value ``0`` is checked by each leaf
+    (all operands of :class:`.Or` except last are not valid, all operands of :class:`.And` except last are valid).
+
+    :param operators: operators of levels, they are repeated cyclically from root (like ``(And, Or)``)
+    :type operators: tuple
+    :param depth: count of levels of operators
+    :type depth: int
+    :param width: count of operands of each operator
+    :type width: int
+    :param valid: expected result of tree for ``0``
+    :type valid: bool
+    :return: tree with ``width ** depth`` leaves (:class:`.GT` and :class:`.LT`)
+    :rtype: Base
+    """
+    if depth == 0:
+        return GT(-1) if valid else LT(-1)
+    operator = operators[0]
+    rest = operators[1:] + operators[:1]
+    decisive_result = operator is Or
+    operands = [build_tree(rest, depth - 1, width, not decisive_result) for _ in range(width - 1)]
+    operands.append(build_tree(rest, depth - 1, width, valid))
+    return operator(*operands)
+
+
+def build_not_chain(depth):
+    """
+    :param depth: count of nested :class:`.Not`
+    :type depth: int
+    :return: ``Not(Not(...GT(-1)))``
+    :rtype: Base
+    """
+    validator = GT(-1)
+    for _ in range(depth):
+        validator = Not(validator)
+    return validator
+
+
+def comparator_cases():
+    """
+    :return: list of (name, comparator, valid value, not valid value)
+    :rtype: list
+    """
+    return [
+        ('GT', GT(5), 10, 1),
+        ('GTE', GTE(5), 5, 1),
+        ('LT', LT(5), 1, 10),
+        ('LTE', LTE(5), 5, 10),
+        ('EQ', EQ(42), 42, 41),
+        ('NotEQ', NotEQ(42), 41, 42),
+        ('Any', Any(*range(0, 100)), 50, 500),
+        ('Between', Between(0, 100), 50, 500),
+        ('InIntervals', InIntervals(IntervalSet.between(0, 10).union(IntervalSet.between(20, 30))), 25, 15),
+        ('TypeIs', TypeIs(int), 1, 'a'),
+        ('IsNone', IsNone(), None, 1),
+        ('Len', Len(LT(5)), 'abc', 'abcdefgh'),
+        ('Count', Count(LT(5)), [1, 2, 3], list(range(0, 8))),
+    ]
+
+
+def tree_cases(depths=(1, 2, 3, 4), widths=(2, 4, 8), max_leaves=4096):
+    """
+    :param depths: depths of trees
+    :type depths: tuple
+    :param widths: count of operands of each operator
+    :type widths: tuple
+    :param max_leaves: trees with more leaves are skipped
+    :type max_leaves: int
+    :return: list of (name, tree, value, case description)
+    :rtype: list
+    """
+    cases = []
+    for depth in depths:
+        for width in widths:
+            if width ** depth > max_leaves:
+                continue
+            for name, operators in (('And', (And, )), ('Or', (Or, )), ('And/Or', (And, Or))):
+                tree = build_tree(operators, depth, width, operators[0] is And)
+                cases.append(('{name} depth={depth} width={width}'.format(name=name, depth=depth, width=width),
+                              tree, 0, {'depth': depth, 'width': width, 'leaves': width ** depth}))
+        cases.append(('Not depth={depth}'.format(depth=depth), build_not_chain(depth), 0,
+                      {'depth': depth, 'width': 1, 'leaves': 1}))
+    return cases
+
+
+def _result(group, name, size, calls, seconds, **details):
+    result = {
+        'group': group,
+        'name': name,
+        'size': size,
+        'calls': calls,
+        'seconds': seconds,
+        'per_call': seconds / calls,
+        'per_second': calls * size / seconds if seconds else None,
+    }
+    result.update(details)
+    return result
+
+
+def bench_comparators(min_time=0.2, repeat=3):
+    """
+    :return: results of ``comparators`` group
+    :rtype: list
+    """
+    results = []
+    for name, comparator, valid, not_valid in comparator_cases():
+        for value, expected in ((valid, True), (not_valid, False)):
+            assert bool(comparator.is_valid(value)) is expected, name
+            calls, seconds = measure(lambda: comparator.is_valid(value), min_time, repeat)
+            results.append(_result('comparators', name, 1, calls, seconds, result=expected))
+    return results
+
+
+def bench_trees(min_time=0.2, repeat=3, depths=(1, 2, 3, 4), widths=(2, 4, 8)):
+    """
+    :return: results of ``trees`` group
+    :rtype: list
+    """
+    results = []
+    for name, tree, value, details in tree_cases(depths, widths):
+        calls, seconds = measure(lambda: tree.is_valid(value), min_time, repeat)
+        results.append(_result('trees', name, 1, calls, seconds, **details))
+        compiled = tree.compile()
+        calls, seconds = measure(lambda: compiled(value), min_time, repeat)
+        results.append(_result('trees', name + ' compiled', 1, calls, seconds, **details))
+    return results
+
+
+def bench_batches(sizes=default_sizes, min_time=0.2, repeat=3):
+    """
+    :param sizes: counts of values in batch
+    :type sizes: tuple
+    :return: results of ``batches`` group
+    :rtype: list
+    """
+    results = []
+    validator = And(TypeIs(int), Between(0, 10 ** 9), NotEQ(-1))
+    for size in sizes:
+        values = list(range(0, size))
+        not_valid = values[:-1] + [-1]
+        for name, function in (('filter_values', lambda: validator.filter_values(*values)),
+                               ('all_is_valid', lambda: validator.all_is_valid(*values)),
+                               ('all_is_valid last not valid', lambda: validator.all_is_valid(*not_valid))):
+            calls, seconds = measure(function, min_time, repeat)
+            results.append(_result('batches', name, size, calls, seconds))
+    return results
+
+
+def bench_errors(min_time=0.2, repeat=3):
+    """
+    :return: results of ``errors`` group
+    :rtype: list
+    """
+    results = []
+    tree = build_tree((And, Or), 3, 4)
+    nodes = [tree]
+    for node in nodes:
+        nodes.extend(node.get_children())
+
+    def render():
+        for node in nodes:  # drop cached texts of all validators
+            node.invalidate()
+        return tree.get_condition_text()
+
+    for name, function in (('get_condition_text', render),
+                           ('get_error cached', lambda: tree.get_error(-5)),
+                           ('get_error lazy', lambda: tree.get_error(-5, lazy=True)),
+                           ('lazy error text truncated', lambda: tree.get_error(-5, lazy=True).get_text(80))):
+        calls, seconds = measure(function, min_time, repeat)
+        results.append(_result('errors', name, 1, calls, seconds, nodes=4 ** 3 + 4 ** 2 + 4 + 1))
+    return results
+
+
+def run(groups=GROUPS, sizes=default_sizes, min_time=0.2, repeat=3):
+    """
+    Run benchmarks.
+
+    :param groups: names of groups (see :data:`GROUPS`)
+    :type groups: tuple
+    :param sizes: counts of values in batches
+    :type sizes: tuple
+    :param min_time: minimal time of one measurement, in seconds
+    :type min_time: float
+    :param repeat: count of measurements of each case
+    :type repeat: int
+    :return: report: environment and list of results
+    :rtype: dict
+    :raises ~exceptions.ValueError: if group is unknown
+    """
+    unknown = [group for group in groups if group not in GROUPS]
+    if unknown:
+        raise ValueError("unknown benchmark group '{group}'".format(group=unknown[0]))
+    results = []
+    for group in GROUPS:
+        if group not in groups:
+            continue
+        if group == 'batches':
+            results.extend(bench_batches(sizes, min_time, repeat))
+        else:
+            results.extend(globals()['bench_' + group](min_time, repeat))
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'min_time': min_time,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def main(argv=None):
+    """
+    Command line entry point (``python -m validity.benchmarks --help``).
+
+    :param argv: command line arguments (``sys.argv[1:]`` if None)
+    :type argv: list
+    :return: report (see :func:`run`)
+    :rtype: dict
+    """
+    parser = argparse.ArgumentParser(prog='python -m validity.benchmarks', description='Benchmarks of validators')
+    parser.add_argument('--groups', nargs='+', choices=GROUPS, default=list(GROUPS), help='groups of benchmarks')
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(default_sizes),
+                        help='counts of values in batches (1000 ... 10000000)')
+    parser.add_argument('--min-time', type=float, default=0.2, help='minimal time of one measurement, in seconds')
+    parser.add_argument('--repeat', type=int, default=3, help='count of measurements of each case')
+    parser.add_argument('--output', help='file for JSON report (standard output if not given)')
+    args = parser.parse_args(argv)
+
+    report = run(tuple(args.groups), tuple(args.sizes), args.min_time, args.repeat)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
+    return report
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+
+Thread pool execution of blocking *validators*.
+
+Comparator, that waits for files, network or C extension, which releases GIL,
+can be marked as blocking with :attr:`.BaseComparator.blocking` class attribute.
+:meth:`~.Base.filter_values` and :meth:`~.Base.all_is_valid` of validators,
+that contain blocking comparators (see :meth:`~.Base.is_blocking`), check values concurrently in thread pool.
+Other validators check values one by one in current thread, as before::
+
+    >>> import time
+    >>> from validity import BaseComparator, And, TypeIs
+    >>>
+    >>> class FileExists(BaseComparator):
+    ...     _condition_template = "file must exist in {operand}"
+    ...     blocking = True
+    ...     def is_valid(self, value):
+    ...         time.sleep(0.1)  # waits for file system
+    ...         return value.startswith(self.operand)
+    ...
+    >>> test = And(TypeIs(str), FileExists('/tmp'))
+    >>> test.filter_values(*['/tmp/{0}'.format(index) for index in range(0, 8)] + ['/var/a'])  # 0.1 second
+    (['/tmp/0', '/tmp/1', '/tmp/2', '/tmp/3', '/tmp/4', '/tmp/5', '/tmp/6', '/tmp/7'], ['/var/a'])
+
+Each value is checked by whole validator in one thread of pool.
+Count of values, that are submitted to pool, but not checked yet, is bounded (see :func:`.set_blocking_executor`).
+
+Thread pool (:py:class:`concurrent.futures.ThreadPoolExecutor`) is created on first use.
+
+"""
+
+from collections import deque
+from threading import Lock
+
+__docformat__ = 'reStructuredText'
+
+
+default_max_workers = 16
+"""count of threads in default thread pool"""
+
+_STATE = {'executor': None, 'max_workers': None, 'max_pending': None, 'owned': False}
+_LOCK = Lock()
+
+
+def set_blocking_executor(executor=None, max_workers=None, max_pending=None):
+    """
+    Configure thread pool for blocking validators.
+    Previous default thread pool is shut down (executors, given by user, are not).
+
+    :param executor: any :py:class:`concurrent.futures.Executor`. If None, ThreadPoolExecutor is created on first use.
+    :param max_workers: count of threads in created thread pool (:data:`default_max_workers` if None)
+    :type max_workers: int
+    :param max_pending: maximum count of values, submitted to executor at once (twice count of threads if None)
+    :type max_pending: int
+    :raises ~exceptions.ValueError: if max_workers or max_pending is not positive
+    """
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be positive")
+    if max_pending is not None and max_pending <= 0:
+        raise ValueError("max_pending must be positive")
+    with _LOCK:
+        previous = _STATE['executor'] if _STATE['owned'] else None
+        _STATE['executor'] = executor
+        _STATE['owned'] = False
+        _STATE['max_workers'] = max_workers
+        _STATE['max_pending'] = max_pending
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def get_blocking_executor():
+    """
+    Get thread pool for blocking validators, create it if it is not configured.
+
+    :return: (executor, max_pending)
+    :rtype: tuple
+    """
+    with _LOCK:
+        max_workers = _STATE['max_workers'] or default_max_workers
+        if _STATE['executor'] is None:
+            from concurrent.futures import ThreadPoolExecutor
+            _STATE['executor'] = ThreadPoolExecutor(max_workers=max_workers)
+            _STATE['owned'] = True
+        return _STATE['executor'], _STATE['max_pending'] or 2 * max_workers
+
+
+def iter_results(validator, values):
+    """
+    Check values with validator in thread pool (see :func:`get_blocking_executor`).
+    Values are submitted lazily, so not more than ``max_pending`` values are checked at once.
+    If iteration is stopped, not started checks are cancelled.
+
+    :param validator: validator to check values with
+    :type validator: Base
+    :param values: iterable of values
+    :return: iterator of pairs (value, result of :meth:`~.Base.is_valid`) in order of values
+    """
+    executor, max_pending = get_blocking_executor()
+    pending = deque()
+    try:
+        for value in values:
+            pending.append((value, executor.submit(validator.is_valid, value)))
+            if len(pending) >= max_pending:
+                value, future = pending.popleft()
+                yield value, future.result()
+        while pending:
+            value, future = pending.popleft()
+            yield value, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
@@ -0,0 +1,185 @@
+"""
+
+Memoization of validation results.
+
+Any *validator* can be wrapped with :class:`.Cached` (see :meth:`~.Base.cached`),
+so results of :meth:`~.Base.is_valid` (and :meth:`~.Base.get_error`, which depends on it)
+are stored for hashable values and reused when same value is checked again::
+
+    >>> from validity import Any, TypeIs, Len, EQ
+    >>>
+    >>> country = (TypeIs(str) & Len(EQ(2)) & Any('UA', 'PL', 'DE')).cached(maxsize=1000)
+    >>> country.is_valid('UA'), country.is_valid('UA'), country.is_valid('US')
+    (True, True, False)
+    >>> country.cache_info()
+    CacheInfo(hits=1, misses=2, evictions=0, maxsize=1000, currsize=2)
+
+"""
+
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+from validity.logical_operator import Base
+from validity.vectorized import operand_mask
+
+__docformat__ = 'reStructuredText'
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+"""Cache statistics, returned by :meth:`.Cached.cache_info`"""
+
+
+class Cached(Base):
+    """
+    Validator wrapper with bounded LRU cache of validation results.
+
+    Results are stored by value and it's type (so ``1``, ``1.0`` and ``True`` are cached separately).
+    Unhashable values are always checked by wrapped validator.
+    Cache is protected with lock, so same instance can be used from multiple threads.
+    Cached results are dropped, when wrapped validator (or any validator nested in it) is changed
+    (see :meth:`~.Base.invalidate`).
+
+    .. warning::
+        Use cache only for validators, which results depend on checked value only.
+    """
+
+    def __init__(self, validator, maxsize=1024):
+        """
+        :param validator: validator to wrap
+        :type validator: Base
+        :param maxsize: maximum count of cached results
+        :type maxsize: int
+        :raises ~exceptions.ValueError: if validator is not instance of Base
+        :raises ~exceptions.ValueError: if maxsize is not positive
+        """
+        if not isinstance(validator, Base):
+            raise ValueError("validator must be instances of validity.Base class")
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.validator = validator
+        self.maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    __slots__ = ('validator', 'maxsize', '_hits', '_misses', '_evictions', '_results', '_lock')
+
+    _transient = Base._transient + ('_hits', '_misses', '_evictions', '_results', '_lock')
+    """cached results and statistics are not pickled"""
+
+    def __setstate__(self, state):
+        """
+        Unpickled validator has empty cache.
+
+        :param state: attributes of validator
+        :type state: dict
+        """
+        super(Cached, self).__setstate__(state)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    def is_valid(self, value):
+        """
+        Get cached result for value or check value with wrapped validator and store result.
+
+        :param value: value for check
+        :return: result of wrapped validator :meth:`~.Base.is_valid`
+        :rtype: bool
+        """
+        key = (type(value), value)
+        try:
+            hash(key)
+        except TypeError:
+            return self.validator.is_valid(value)
+
+        results = self._results
+        with self._lock:
+            if key in results:
+                result = results.pop(key)
+                results[key] = result
+                self._hits += 1
+                return result
+
+        result = self.validator.is_valid(value)
+        self._register()  # changes of wrapped validator drop results (see _reset_cache)
+        with self._lock:
+            self._misses += 1
+            results[key] = result
+            if len(results) > self.maxsize:
+                results.popitem(last=False)
+                self._evictions += 1
+        return result
+
+    def cache_info(self):
+        """
+        Get cache statistics.
+
+        :return: (hits, misses, evictions, maxsize, currsize)
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions, self.maxsize, len(self._results))
+
+    def cache_clear(self):
+        """
+        Remove all cached results and reset statistics.
+        """
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _reset_cache(self):
+        """
+        Drop cached results too (statistics are kept).
+        """
+        with self._lock:
+            self._results.clear()
+        super(Cached, self)._reset_cache()
+
+    def get_children(self):
+        """
+        :return: wrapped validator
+        :rtype: tuple
+        """
+        return (self.validator, )
+
+    def replace_children(self, children):
+        """
+        :param children: new wrapped validator
+        :type children: tuple
+        :return: new cached validator with same maxsize (cache is not copied)
+        :rtype: Cached
+        """
+        return Cached(children[0], self.maxsize)
+
+    def get_mask(self, values):
+        """
+        Arrays are checked by wrapped validator, without cache.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        return operand_mask(self.validator, values)
+
+    def get_condition_text(self):
+        """
+        :return: condition text of wrapped validator
+        :rtype: str
+        """
+        return self.validator.get_cached_condition_text()
+
+    def get_nested_condition(self):
+        """
+        :return: nested condition text of wrapped validator
+        :rtype: str
+        """
+        return self.validator.get_nested_condition()
@@ -74,8 +74,37 @@ Available comparators
 
 __docformat__ = 'reStructuredText'
 
+import math
+from bisect import bisect_right
+from itertools import chain, islice
 
-from validity.logical_operator import Base
+from validity.interval import IntervalSet, get_intervals, is_orderable, is_number
+from validity.logical_operator import _MISSING, _set_attribute, Base
+from validity.vectorized import require_numpy, is_comparable, is_numeric, loop_mask
+
+try:
+    _INTEGER_TYPES = (int, long)  # pylint: disable=undefined-variable
+except NameError:
+    _INTEGER_TYPES = (int, )
+
+
+def _get_typed_value(value):
+    """
+    Get value with types of it and of it's items (see :meth:`.BaseComparator.get_structure`),
+    so values, that are equal only after conversion (like ``(1, 2)`` and ``(1.0, 2.0)``), are not equal.
+
+    :param value: operand or it's item
+    :return: (type, value) or (type, typed items) for tuples, lists and frozensets
+    :rtype: tuple
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        return (value_type, tuple([_get_typed_value(item) for item in value]))
+    if value_type is list:  # stays unhashable
+        return (value_type, [_get_typed_value(item) for item in value])
+    if value_type is frozenset:
+        return (value_type, frozenset([_get_typed_value(item) for item in value]))
+    return (value_type, value)
 
 
 class BaseComparator(Base):
@@ -120,10 +149,15 @@ class BaseComparator(Base):
     Must contains {operand} placeholder, if :meth:`get_condition_text` is not implemented in child class.
     """
 
-    operand = None
-    """Operand to compare with when :py:meth:`is_valid` called.
+    __slots__ = {
+        'operand': """Operand to compare with when :py:meth:`is_valid` called.
     Initial value must be given in :py:meth:`__init__`
-    """
+    """,
+    }
+
+    blocking = False
+    """True for comparators, that wait for I/O or run code, which releases GIL,
+    so values can be checked concurrently in thread pool (see :mod:`validity.blocking`)"""
 
     def __init__(self, operand):
         """comparator initialization.
@@ -131,7 +165,7 @@ class BaseComparator(Base):
         :param operand: value to compare with when :py:meth:`is_valid` called
 
         """
-        self.operand = operand
+        _set_attribute(self, 'operand', operand)  # new validator is not registered (see :meth:`~.Base.__setattr__`)
 
     def is_valid(self, value):
         """
@@ -162,6 +196,29 @@ class BaseComparator(Base):
         return self._condition_template.format(
             operand=("`{}`" if isinstance(self.operand, (str, )) else "{}").format(self.operand))
 
+    def is_blocking(self):
+        """
+        :return: :attr:`blocking` or True if any of nested validators is blocking
+        :rtype: bool
+        """
+        return self.blocking or super(BaseComparator, self).is_blocking()
+
+    def get_structure(self):
+        """
+        Comparators are equal, if they have same type and equal :attr:`operand` of same type,
+        items of tuple operands are compared with their types too
+        (so ``EQ(1) == EQ(1)``, but ``EQ(1) != EQ(True)`` and ``Any(1, 2) != Any(1.0, 2.0)``).
+
+        .. note::
+            Structure is used only by classes, that set :attr:`~.Base.structural` (built-in comparators do it).
+            Child classes, that store validation rule not only in :attr:`operand`, must override this method
+            before setting it.
+
+        :return: (type, (operand type, operand))
+        :rtype: tuple
+        """
+        return (type(self), _get_typed_value(self.operand))
+
 
 class GT(BaseComparator):
     """
@@ -195,6 +252,10 @@ class GT(BaseComparator):
 
     """
 
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must be greater than {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
@@ -208,6 +269,42 @@ class GT(BaseComparator):
         """
         return value > self.operand
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value > operand``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} > {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_mask(self, values):
+        """
+        Check array with ``values > operand``.
+        Elements are checked one by one if array can not be compared with operand (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_comparable(values, self.operand):
+            return loop_mask(self, values)
+        return values > self.operand
+
+    def get_intervals(self):
+        """
+        :return: set of numbers greater than operand, if operand is number
+        :rtype: validity.interval.IntervalSet
+        """
+        if not is_orderable(self.operand):
+            return None
+        return IntervalSet.greater(self.operand)
+
 
 class GTE(BaseComparator):
     """
@@ -231,6 +328,10 @@ class GTE(BaseComparator):
 
     """
 
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must be greater than or equal to {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
@@ -244,6 +345,42 @@ class GTE(BaseComparator):
         """
         return value >= self.operand
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value >= operand``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} >= {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_mask(self, values):
+        """
+        Check array with ``values >= operand``.
+        Elements are checked one by one if array can not be compared with operand (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_comparable(values, self.operand):
+            return loop_mask(self, values)
+        return values >= self.operand
+
+    def get_intervals(self):
+        """
+        :return: set of numbers greater than or equal to operand, if operand is number
+        :rtype: validity.interval.IntervalSet
+        """
+        if not is_orderable(self.operand):
+            return None
+        return IntervalSet.greater(self.operand, closed=True)
+
 
 class LT(BaseComparator):
     """
@@ -276,6 +413,11 @@ class LT(BaseComparator):
         True
 
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must be less than {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
@@ -289,6 +431,42 @@ class LT(BaseComparator):
         """
         return value < self.operand
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value < operand``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} < {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_mask(self, values):
+        """
+        Check array with ``values < operand``.
+        Elements are checked one by one if array can not be compared with operand (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_comparable(values, self.operand):
+            return loop_mask(self, values)
+        return values < self.operand
+
+    def get_intervals(self):
+        """
+        :return: set of numbers less than operand, if operand is number
+        :rtype: validity.interval.IntervalSet
+        """
+        if not is_orderable(self.operand):
+            return None
+        return IntervalSet.less(self.operand)
+
 
 class LTE(BaseComparator):
     """
@@ -312,6 +490,10 @@ class LTE(BaseComparator):
 
     """
 
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must be less than or equal to {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
@@ -325,6 +507,42 @@ class LTE(BaseComparator):
         """
         return value <= self.operand
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value <= operand``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} <= {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_mask(self, values):
+        """
+        Check array with ``values <= operand``.
+        Elements are checked one by one if array can not be compared with operand (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_comparable(values, self.operand):
+            return loop_mask(self, values)
+        return values <= self.operand
+
+    def get_intervals(self):
+        """
+        :return: set of numbers less than or equal to operand, if operand is number
+        :rtype: validity.interval.IntervalSet
+        """
+        if not is_orderable(self.operand):
+            return None
+        return IntervalSet.less(self.operand, closed=True)
+
 
 class EQ(BaseComparator):
     """
@@ -351,12 +569,60 @@ class EQ(BaseComparator):
 
 
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must be equal to {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
     def is_valid(self, value):
         return value == self.operand
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value == operand``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} == {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_mask(self, values):
+        """
+        Check array with ``values == operand``.
+        Elements are checked one by one if array can not be compared with operand (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_comparable(values, self.operand):
+            return loop_mask(self, values)
+        return values == self.operand
+
+    def get_intervals(self):
+        """
+        :return: set of single number, if operand is number
+        :rtype: validity.interval.IntervalSet
+        """
+        if not is_orderable(self.operand):
+            return None
+        return IntervalSet.between(self.operand, self.operand)
+
+    def get_negation(self):
+        """
+        :return: ``NotEQ(operand)``
+        :rtype: NotEQ
+        """
+        return NotEQ(self.operand)
+
 
 class NotEQ(BaseComparator):
     """
@@ -378,6 +644,10 @@ class NotEQ(BaseComparator):
 
     """
 
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must NOT be equal to {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
@@ -391,6 +661,135 @@ class NotEQ(BaseComparator):
         """
         return not value == self.operand
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``not value == operand``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "(not {value} == {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_mask(self, values):
+        """
+        Check array with ``~(values == operand)``.
+        Elements are checked one by one if array can not be compared with operand (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_comparable(values, self.operand):
+            return loop_mask(self, values)
+        return ~(values == self.operand)
+
+    def get_intervals(self):
+        """
+        :return: set of all numbers (and NaN) except operand, if operand is number
+        :rtype: validity.interval.IntervalSet
+        """
+        if not is_orderable(self.operand):
+            return None
+        return ~IntervalSet.between(self.operand, self.operand)
+
+    def get_negation(self):
+        """
+        :return: ``EQ(operand)``
+        :rtype: EQ
+        """
+        return EQ(self.operand)
+
+
+class MembershipIndex(object):
+    """
+    Index of allowed values, used by :class:`.Any` for checking if value is in list of allowed values.
+
+    - hashable values are stored in :py:class:`frozenset`,
+    - integers are compressed to sorted ranges of consecutive numbers and checked with bisect,
+      if it takes at most :attr:`range_ratio` of integers count,
+    - unhashable values are checked with linear scan.
+
+    Lookup result is always same as ``value in values``.
+
+    Example::
+
+        >>> index = MembershipIndex(list(range(0, 50000)) + ['a', 'b', [1, 2]])
+        >>> index.ranges
+        ((0, 49999),)
+        >>> 42 in index, 42.0 in index, 'a' in index, [1, 2] in index, 50000 in index
+        (True, True, True, True, False)
+
+    """
+
+    __slots__ = ('source', 'hashable', 'ranges', 'unhashable', '_starts', '_ends')
+
+    range_ratio = 0.25
+    """maximum ratio of ranges count to integers count, when integers are stored as ranges"""
+
+    def __init__(self, values):
+        """
+        :param values: allowed values (they are kept in :attr:`source` as is)
+        :type values: tuple or list
+        """
+        hashable = []
+        integers = set()
+        unhashable = []
+        for item in values:
+            try:
+                hash(item)
+            except TypeError:
+                unhashable.append(item)
+                continue
+            if type(item) in _INTEGER_TYPES:  # pylint: disable=unidiomatic-typecheck
+                integers.add(item)
+            else:
+                hashable.append(item)
+
+        ranges = []
+        for item in sorted(integers):
+            if ranges and ranges[-1][1] == item - 1:
+                ranges[-1][1] = item
+            else:
+                ranges.append([item, item])
+        if len(ranges) > self.range_ratio * len(integers):
+            hashable.extend(integers)
+            ranges = []
+
+        self.source = values
+        self.hashable = frozenset(hashable)
+        self.ranges = tuple(tuple(item) for item in ranges)
+        self.unhashable = tuple(unhashable)
+        self._starts = [start for start, _ in ranges]
+        self._ends = [end for _, end in ranges]
+
+    def __contains__(self, value):
+        try:
+            if value in self.hashable:
+                return True
+        except TypeError:
+            # unhashable value can be equal to any of allowed values
+            return value in self.source
+        if self._starts and self._in_ranges(value):
+            return True
+        return value in self.unhashable if self.unhashable else False
+
+    def _in_ranges(self, value):
+        if type(value) not in _INTEGER_TYPES:  # pylint: disable=unidiomatic-typecheck
+            try:
+                integer = int(value)
+            except (TypeError, ValueError, OverflowError):
+                return False
+            if integer != value:
+                return False
+            value = integer
+        index = bisect_right(self._starts, value) - 1
+        return index >= 0 and value <= self._ends[index]
+
 
 class Any(BaseComparator):
     """
@@ -414,9 +813,18 @@ class Any(BaseComparator):
         must be any of (1, 2, 3, 4)
 
     """
+
+    structural = True
+
     _condition_template = "must be any of ({operands})"
     """used for creating text representation of comparator (:py:meth:`get_condition_text`)"""
 
+    __slots__ = {
+        'max_text_values': """maximum count of allowed values in text representation (:py:meth:`get_condition_text`).
+    None (default) means no limit.""",
+        '_index': "index of allowed values (see :meth:`get_index`)",
+    }
+
     def __init__(self, *values):
         """
         :param values: allowed values. If given only one value and it is instance of list or tuple, then it is used as list of valid values.
@@ -427,31 +835,133 @@ class Any(BaseComparator):
         if len(values) == 1 and isinstance(values[0], (list, tuple)):
             if not values[0]:
                 raise ValueError("at least one value must be specified")
-            values = values[0]
+            values = tuple(values[0])
         elif not values:
             raise ValueError("at least one value must be specified")
         super(Any, self).__init__(operand=values)
 
+    _transient = BaseComparator._transient + ('_index', )
+    """index of allowed values is not pickled, it is rebuilt by :meth:`get_index`"""
+
+    def __getattr__(self, name):
+        """
+        :attr:`max_text_values` is not stored, until it is set, so validators with default value are compact
+        (in memory and serialized).
+        """
+        if name == 'max_text_values':
+            return None
+        raise AttributeError("'{klass}' object has no attribute '{name}'".format(klass=type(self).__name__,
+                                                                                  name=name))
+
+    def get_index(self):
+        """
+        Get index of allowed values. Index is built on first check and rebuilt if :attr:`operand` was replaced.
+
+        :return: index of :attr:`operand` values
+        :rtype: MembershipIndex
+        """
+        try:
+            index = self._index
+        except AttributeError:  # not built yet
+            index = None
+        if index is None or index.source is not self.operand:
+            index = self._index = MembershipIndex(self.operand)
+        return index
+
     def is_valid(self, value):
         """
         Check if given value in :attr:`operand`.
+        Lookup is made with :class:`.MembershipIndex`, so it does not depend on allowed values count.
 
         :param value: value for check
         :return: True if value if list of allowed values, otherwise False
         :rtype: bool
         """
-        return value in self.operand
+        return value in self.get_index()
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value in index`` (see :meth:`get_index`).
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} in {operand})".format(value=value, operand=compiler.bind(self.get_index()))
+
+    def get_mask(self, values):
+        """
+        Check array with ``numpy.isin``, if both array and allowed values are numbers,
+        or array contains strings (bytes) and all allowed values are strings (bytes),
+        and array can be compared with each of allowed values (see :func:`.is_comparable`).
+        Otherwise elements are checked one by one.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        numpy = require_numpy()
+        allowed_values = self.get_index().source
+        if is_numeric(values):
+            if all(not isinstance(item, (str, bytes)) and is_comparable(values, item) for item in allowed_values):
+                return numpy.isin(values, list(allowed_values))
+        elif values.dtype.kind in 'SU':
+            item_type = bytes if values.dtype.kind == 'S' else str
+            if all(type(item) is item_type and is_comparable(values, item) for item in allowed_values):
+                return numpy.isin(values, list(allowed_values))
+        return loop_mask(self, values)
 
     def get_condition_text(self):
         """
         Get condition text representation.
         Formats :attr:`._condition_template` with :attr:`operand` and returns result.
-        Allowed  values are joined with coma.
+        Allowed  values are joined with coma. If there are more than :attr:`max_text_values` allowed values,
+        only first of them are shown::
+
+            >>> test = Any(list(range(0, 100000)))
+            >>> test.max_text_values = 3
+            >>> print test
+            must be any of (0, 1, 2, ... 99997 more)
 
         :return: condition text representation
         :rtype: str
         """
-        return self._condition_template.format(operands=", ".join(str(item) for item in self.operand))
+        values = self.operand
+        if self.max_text_values is not None and len(values) > self.max_text_values:
+            return self._condition_template.format(operands="{values}, ... {rest} more".format(
+                values=", ".join(str(item) for item in values[:self.max_text_values]),
+                rest=len(values) - self.max_text_values))
+        return self._condition_template.format(operands=", ".join(str(item) for item in values))
+
+    def get_limited_condition_text(self, max_length):
+        """
+        Allowed values are joined, until text is longer than max_length
+        (see :meth:`~.Base.get_limited_condition_text`), so large list of values is not rendered for short text::
+
+            >>> Any(list(range(0, 100000))).get_limited_condition_text(20)
+            'must be any of (0, 1, 2, 3, 4, 5, 6, 7)'
+
+        :param max_length: required length of text
+        :type max_length: int
+        :return: condition text, that is longer than max_length, or full condition text
+        :rtype: str
+        """
+        values = self.operand
+        if self._get_cached('text') is not _MISSING or type(self).get_condition_text != Any.get_condition_text \
+                or (self.max_text_values is not None and len(values) > self.max_text_values):
+            return self.get_cached_condition_text()
+        parts = []
+        length = 0
+        for item in values:
+            if length > max_length:
+                return self._condition_template.format(operands=", ".join(parts))
+            parts.append(str(item))
+            length += len(parts[-1]) + (2 if len(parts) > 1 else 0)
+        return self.get_cached_condition_text()
 
 # just aliases
 # In = Any
@@ -480,6 +990,11 @@ class Between(BaseComparator):
         ([40, 41, 42], [38, 39, 43, 44])
 
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "must be between {min_value} and {max_value}"
     """used for creating text representation of comparator (:py:meth:`get_condition_text`)"""
 
@@ -505,6 +1020,44 @@ class Between(BaseComparator):
         """
         return self.operand[0] <= value <= self.operand[1]
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``min_value <= value <= max_value``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({min_value} <= {value} <= {max_value})".format(
+            min_value=compiler.bind(self.operand[0]), value=value, max_value=compiler.bind(self.operand[1]))
+
+    def get_mask(self, values):
+        """
+        Check array with ``(values >= min_value) & (values <= max_value)``.
+        Elements are checked one by one if array can not be compared with min_value or max_value
+        (see :func:`.is_comparable`).
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not (is_comparable(values, self.operand[0]) and is_comparable(values, self.operand[1])):
+            return loop_mask(self, values)
+        return (values >= self.operand[0]) & (values <= self.operand[1])
+
+    def get_intervals(self):
+        """
+        :return: set of numbers between min_value and max_value, if both of them are numbers
+        :rtype: validity.interval.IntervalSet
+        """
+        if not (is_orderable(self.operand[0]) and is_orderable(self.operand[1])):
+            return None
+        return IntervalSet.between(self.operand[0], self.operand[1])
+
     def get_condition_text(self):
         """
         Get condition text representation.
@@ -516,10 +1069,199 @@ class Between(BaseComparator):
         return self._condition_template.format(min_value=self.operand[0], max_value=self.operand[1])
 
 
+class InIntervals(BaseComparator):
+    """
+    **Interval set comparator.**
+    Use it for check that value belongs to :class:`~validity.interval.IntervalSet`, stored in :attr:`operand`.
+    Value is checked with single bisect, regardless of intervals count.
+    Usually it is created by :meth:`~.Base.simplify`.
+
+    Example::
+
+        >>> from validity import InIntervals, Or, LT, GT, Between
+        >>>
+        >>> test = InIntervals(Or(LT(0), Between(10, 20), GT(100)).get_intervals())
+        >>> print test
+        must be in (-inf, 0) or [10, 20] or (100, +inf)
+        >>> test.filter_values(-1, 0, 10, 15, 21, 100, 101)
+        ([-1, 10, 15, 101], [0, 21, 100])
+
+    Values, that are not numbers, are compared with bounds of intervals, unless result for them is given::
+
+        >>> InIntervals(Or(LT(0), GT(100)).get_intervals(), other=False).is_valid('a')
+        False
+
+    """
+
+    structural = True
+
+    __slots__ = {
+        'other': "result for values, that are not numbers (None if they are compared with bounds of intervals)",
+    }
+
+    _condition_template = "must be in {operand}"
+    """used for creating text representation of comparator (:py:meth:`get_condition_text`)"""
+
+    _other_condition_template = "must be in {operand} (or not a number)"
+    """used for creating text representation of comparator, that is valid for values, that are not numbers"""
+
+    def __init__(self, intervals, other=None):
+        """
+        intervals are stored in :attr:`operand`
+
+        :param intervals: set of valid numbers
+        :type intervals: validity.interval.IntervalSet
+        :param other: result for values, that are not numbers (see :func:`~validity.interval.is_number`),
+            if it is None, they are compared with bounds of intervals
+        :type other: bool
+        :raises ~exceptions.TypeError: if intervals is not instance of IntervalSet
+        :raises ~exceptions.ValueError: if other is not None, True or False
+        """
+        if not isinstance(intervals, IntervalSet):
+            raise TypeError("intervals must be instance of 'IntervalSet'")
+        if other is not None and type(other) is not bool:  # pylint: disable=unidiomatic-typecheck
+            raise ValueError("other must be None, True or False")
+        super(InIntervals, self).__init__(operand=intervals)
+        self.other = other
+
+    def is_valid(self, value):
+        """
+        Check if given value belongs to :attr:`operand`
+
+        :param value: value for check
+        :return: True if value is in one of intervals (or :attr:`other`, if it is given and value is not number)
+        :rtype: bool
+        """
+        other = self.other
+        if other is not None and not is_number(value):
+            return other
+        return value in self.operand
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value in operand`` (with check of value type, if :attr:`other` is given).
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        expression = "({value} in {operand})".format(value=value, operand=compiler.bind(self.operand))
+        if self.other is None:
+            return expression
+        return "({expression} if {is_number}({value}) else {other})".format(
+            expression=expression, is_number=compiler.bind(is_number), value=value, other=self.other)
+
+    def get_mask(self, values):
+        """
+        Check array of numbers with bounds of each interval.
+        Elements of other arrays are checked one by one.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        if not is_numeric(values):
+            return loop_mask(self, values)
+        numpy = require_numpy()
+        if self.operand.is_everything():
+            return numpy.ones(len(values), dtype=bool)
+        mask = numpy.zeros(len(values), dtype=bool)
+        for (start, start_flag), (end, end_flag) in self.operand.intervals:
+            mask |= ((values > start) if start_flag else (values >= start)) & \
+                ((values <= end) if end_flag else (values < end))
+        if self.operand.nan and values.dtype.kind == 'f':
+            mask |= numpy.isnan(values)
+        return mask
+
+    def get_structure(self):
+        """
+        Interval comparators are equal, if they have same :attr:`other` and :attr:`operand` with same bounds
+        of same types.
+
+        :return: (type, other, typed intervals)
+        :rtype: tuple
+        """
+        return (type(self), self.other, _get_typed_value(self.operand.__getstate__()))
+
+    def get_intervals(self):
+        """
+        :return: :attr:`operand`
+        :rtype: validity.interval.IntervalSet
+        """
+        return self.operand
+
+    def get_condition_text(self):
+        """
+        Get condition text representation.
+        Formats :attr:`._condition_template` (or :attr:`._other_condition_template`, if :attr:`other` is True)
+        with text representation of :attr:`operand`.
+
+        :return: condition text representation
+        :rtype: str
+        """
+        template = self._condition_template if not self.other else self._other_condition_template
+        return template.format(operand=self.operand.get_text())
+
+
+class TypeIndex(object):
+    """
+    Index of allowed types, used by :class:`.TypeIs` for checking type of value.
+
+    Types are stored in :py:class:`frozenset`. In subclasses mode result of :py:func:`issubclass`
+    (which walks MRO of type and checks abstract base classes) is cached for each checked type.
+
+    Example::
+
+        >>> from numbers import Number
+        >>>
+        >>> index = TypeIndex((Number, str), subclasses=True)
+        >>> int in index, bool in index, list in index
+        (True, True, False)
+
+    """
+
+    __slots__ = ('source', 'subclasses', 'types', 'contains', '_results')
+
+    max_cached_types = 1024
+    """maximum count of cached results of subclasses mode, cache is cleared when it is reached"""
+
+    def __init__(self, source, subclasses=False):
+        """
+        :param source: allowed type or tuple of types
+        :type source: type or tuple
+        :param subclasses: True if subclasses of allowed types are allowed too
+        :type subclasses: bool
+        """
+        self.source = source
+        self.subclasses = subclasses
+        self.types = frozenset(source if type(source) is tuple else (source, ))  # pylint: disable=unidiomatic-typecheck
+        self._results = {}
+        self.contains = self._is_subclass if subclasses else self.types.__contains__
+        """function, that checks if type is allowed (same as ``value_type in index``)"""
+
+    def __contains__(self, value_type):
+        return self.contains(value_type)
+
+    def _is_subclass(self, value_type):
+        results = self._results
+        try:
+            return results[value_type]
+        except KeyError:
+            pass
+        if len(results) >= self.max_cached_types:
+            results.clear()
+        result = results[value_type] = issubclass(value_type, tuple(self.types))
+        return result
+
+
 class TypeIs(BaseComparator):
     """
     **Value type comparator**
-    Use it for check that value type is same as :attr:`operand`.
+    Use it for check that value type is same as :attr:`operand` (or one of types in :attr:`operand`).
 
     Example::
 
@@ -537,43 +1279,141 @@ class TypeIs(BaseComparator):
         >>> test.filter_values(1, 2, [1,2,3], '1', {'test': 'test'}, (1, 2))
         ([1, 2, '1'], [[1, 2, 3], {'test': 'test'}, (1, 2)])
 
+    Many types are checked with single lookup (see :class:`.TypeIndex`),
+    :class:`.Or` merges :class:`.TypeIs` operands in same way (see :meth:`.Or.optimize_operands`).
+    Subclasses of types are allowed in ``subclasses`` mode::
+
+        >>> from decimal import Decimal
+        >>> from numbers import Number
+        >>>
+        >>> print TypeIs(int, float, Decimal)
+        must be int or float or Decimal
+        >>> TypeIs(int, float, Decimal).filter_values(1, 1.5, Decimal(1), True, '1')
+        ([1, 1.5, Decimal('1')], [True, '1'])
+        >>> TypeIs(Number, subclasses=True).filter_values(1, 1.5, Decimal(1), True, '1')
+        ([1, 1.5, Decimal('1'), True], ['1'])
+
     """
 
+    structural = True
+
+    __slots__ = {
+        'subclasses': "True if subclasses of required types are valid too",
+        '_index': "index of required types (see :meth:`get_index`)",
+    }
+
+    _transient = BaseComparator._transient + ('_index', )
+    """index of types is not pickled, it is rebuilt by :meth:`get_index`"""
+
     _condition_template = "must be {operand}"
     """used for creating text representation of comparator (:py:meth:`get_condition_text`)"""
 
-    def __init__(self, required_type):
-        """
-        required_type is stored in :attr:`operand`.
+    _subclasses_condition_template = "must be instance of {operand}"
+    """used for creating text representation of comparator in subclasses mode (:py:meth:`get_condition_text`)"""
 
-        :param required_type: type to compare with
-        :type required_type: type
-        :raises ~exceptions.TypeError: if required_type is not instance of :class:`type`
+    def __init__(self, *required_types, **options):
         """
-        if not isinstance(required_type, type):
+        Single required type is stored in :attr:`operand` as is, many types are stored as tuple
+        (repeated types are removed).
+
+        :param required_types: one or more types to compare with
+        :type required_types: type
+        :param subclasses: if True, value is valid if it is instance of any of types (or their subclasses)
+        :type subclasses: bool
+        :raises ~exceptions.TypeError: if no types given, if any of required_types is not instance of :class:`type`
+            or if unexpected keyword argument given
+        """
+        subclasses = options.pop('subclasses', False)
+        if options:
+            raise TypeError("unexpected keyword argument '{name}'".format(name=sorted(options)[0]))
+        if not required_types:
+            raise TypeError("at least one type must be specified")
+        if not all(isinstance(required_type, type) for required_type in required_types):
             raise TypeError("required_type must be instance of 'type'")
-        super(TypeIs, self).__init__(operand=required_type)
+        types = []
+        for required_type in required_types:
+            if required_type not in types:
+                types.append(required_type)
+        super(TypeIs, self).__init__(operand=types[0] if len(types) == 1 else tuple(types))
+        self.subclasses = bool(subclasses)
+        self._index = None
+
+    def get_types(self):
+        """
+        :return: required types
+        :rtype: tuple
+        """
+        return self.operand if type(self.operand) is tuple else (self.operand, )  # pylint: disable=unidiomatic-typecheck
+
+    def get_index(self):
+        """
+        Get index of required types. Index is rebuilt if :attr:`operand` or :attr:`subclasses` was replaced.
+
+        :return: index of :attr:`operand` types
+        :rtype: TypeIndex
+        """
+        try:
+            index = self._index
+        except AttributeError:  # not pickled
+            index = None
+        if index is None or index.source is not self.operand or index.subclasses != self.subclasses:
+            index = self._index = TypeIndex(self.operand, self.subclasses)
+        return index
 
     def is_valid(self, value):
         """
-        Check if type of given value is same as :attr:`operand`
+        Check if type of given value is same as :attr:`operand` (or one of it's types).
+        In :attr:`subclasses` mode value can be instance of subclass of them.
 
         :param value: value to check
         :return: True if value has type same as :attr:`operand`, otherwise False
         :rtype: bool
         """
-        # pylint: disable=unidiomatic-typecheck
-        return type(value) is self.operand
+        operand = self.operand
+        if type(operand) is not tuple and not self.subclasses:  # pylint: disable=unidiomatic-typecheck
+            return type(value) is operand
+        index = self._index
+        if index is None or index.source is not operand or index.subclasses != self.subclasses:
+            index = self.get_index()
+        return index.contains(type(value))
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``type(value) is operand`` (or lookup in index for many types
+        and subclasses mode, see :class:`.TypeIndex`).
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        if type(self.operand) is tuple or self.subclasses:  # pylint: disable=unidiomatic-typecheck
+            return "{contains}(type({value}))".format(contains=compiler.bind(self.get_index().contains), value=value)
+        return "(type({value}) is {operand})".format(value=value, operand=compiler.bind(self.operand))
+
+    def get_structure(self):
+        """
+        Type comparators are equal, if they have same mode and same types in same order
+        (order of types is shown in condition text).
+
+        :return: (type, subclasses, types)
+        :rtype: tuple
+        """
+        return (type(self), self.subclasses, self.get_types())
 
     def get_condition_text(self):
         """
         Get condition text representation.
-        Formats :attr:`._condition_template` with name of type, stored in :attr:`operand` and returns result.
+        Formats :attr:`._condition_template` (or :attr:`._subclasses_condition_template`)
+        with names of types, stored in :attr:`operand` and returns result.
 
         :return: condition text representation
         :rtype: str
         """
-        return self._condition_template.format(operand=self.operand.__name__)
+        template = self._subclasses_condition_template if self.subclasses else self._condition_template
+        return template.format(operand=" or ".join(required_type.__name__ for required_type in self.get_types()))
 
 
 class IsNone(BaseComparator):
@@ -602,6 +1442,10 @@ class IsNone(BaseComparator):
 
     """
 
+    structural = True
+
+    __slots__ = ('_custom_text', )
+
     _condition_text = 'must be None'
     """used for creating text representation of comparator (:py:meth:`get_condition_text`)"""
 
@@ -613,8 +1457,7 @@ class IsNone(BaseComparator):
         :type condition_text:  str
         """
         super(IsNone, self).__init__(None)
-        if condition_text:
-            self._condition_text = condition_text
+        self._custom_text = condition_text or None
 
     def is_valid(self, value):
         """
@@ -626,6 +1469,33 @@ class IsNone(BaseComparator):
         """
         return value is None
 
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression ``value is None``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "({value} is None)".format(value=value)
+
+    def get_mask(self, values):
+        """
+        Array of numbers can not contain None, so only elements of object arrays are checked.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        numpy = require_numpy()
+        if values.dtype.kind != 'O':
+            return numpy.zeros(len(values), dtype=bool)
+        return numpy.fromiter((value is None for value in values), dtype=bool, count=len(values))
+
     def get_condition_text(self):
         """
         Get condition text representation.
@@ -634,7 +1504,42 @@ class IsNone(BaseComparator):
         :return: condition text representation
         :rtype: str
         """
-        return self._condition_text or ''
+        return self._custom_text or self._condition_text or ''
+
+    def get_structure(self):
+        """
+        Custom condition text is part of structure, so :class:`IsNone` validators with different texts are not equal.
+
+        :return: (type, condition text)
+        :rtype: tuple
+        """
+        return (type(self), self.get_condition_text())
+
+
+def _get_count_limit(intervals):
+    """
+    Get count of items, that decides result of length validator (see :meth:`.Len.get_count_limit`).
+
+    :param intervals: valid lengths or None
+    :type intervals: IntervalSet
+    :return: (count, result) or None, if result is not decided by any count
+    :rtype: tuple
+    """
+    if intervals is None:
+        return None
+    if not intervals.intervals:
+        return (0, False)
+    (start, start_flag), (end, end_flag) = intervals.intervals[-1]
+    infinity = float('inf')
+    if start == infinity:
+        return (0, False)
+    if end != infinity:
+        # no length after last interval is valid
+        return (max(0, int(math.floor(end)) + 1 if end_flag else int(math.ceil(end))), False)
+    # all lengths in last interval are valid
+    if start == -infinity:
+        return (0, True)
+    return (max(0, int(math.floor(start)) + 1 if start_flag else int(math.ceil(start))), True)
 
 
 class Len(BaseComparator):
@@ -660,7 +1565,16 @@ class Len(BaseComparator):
         >>> test.filter_values('a', 'abc', '123456', '42')
         (['abc', '42'], ['a', '123456'])
 
+    Length of iterables without ``len()`` (generators, iterators, etc.) is count of their items.
+    Items are consumed only until result is decided (see :meth:`get_count_limit`),
+    use :meth:`tee` for keeping consumed items.
+
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "length {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
 
@@ -680,7 +1594,9 @@ class Len(BaseComparator):
     def is_valid(self, value):
         """
         Check if given value has length that is valid for :attr:`operand`.
-        First step is to get value length. If length for value can not be calculated (for example, type of value is int), False is returned.
+        First step is to get value length. If value has no length, but it is iterable (for example, generator),
+        it's items are counted until result is decided (see :meth:`get_count_limit`), so iterator is consumed.
+        If value is not iterable (for example, type of value is int), False is returned.
         Second step is to check if value length is valid for validator, sotred in :attr:`operand` (see :meth:`__init__`)
 
         :param value: value for length validation
@@ -690,9 +1606,117 @@ class Len(BaseComparator):
         try:
             value_length = len(value)
         except TypeError:
-            return False
+            return self._is_valid_iterable(value)
         return self.operand.is_valid(value_length)
 
+    def get_count_limit(self):
+        """
+        Get count of items, after which result does not depend on other items of iterable.
+        Limit is found from set of valid lengths (see :meth:`~.Base.get_intervals`) of :attr:`operand`,
+        so ``Len(LT(5))`` is not valid after 5 items and ``Len(GT(5))`` is valid after 6 items.
+        Limit is computed once and dropped, if attribute of this or any nested validator was replaced
+        (see :meth:`~.Base.invalidate`).
+
+        :return: (count, result) or None, if all items must be counted
+        :rtype: tuple
+        """
+        limit = self._get_cached('count_limit')
+        if limit is _MISSING:
+            limit = _get_count_limit(get_intervals(self.operand))
+            self._set_cached('count_limit', limit)
+        return limit
+
+    def _is_valid_iterable(self, value, consumed=None):
+        """
+        Count items of iterable until result is decided (see :meth:`get_count_limit`).
+
+        :param value: iterable without length
+        :param consumed: list for consumed items
+        :type consumed: list
+        :return: True if count of items is valid for :attr:`operand`, False if value is not iterable
+        :rtype: bool
+        """
+        try:
+            iterator = iter(value)
+        except TypeError:
+            return False
+        limit = self.get_count_limit()
+        items = islice(iterator, limit[0] if limit else None)
+        if consumed is None:
+            count = sum(1 for _ in items)
+        else:
+            consumed.extend(items)
+            count = len(consumed)
+        if limit is not None and count == limit[0]:
+            return limit[1]
+        return self.operand.is_valid(count)
+
+    def tee(self, iterable):
+        """
+        Check length of iterable without losing items, consumed while checking.
+
+        Example::
+
+            >>> from validity import Count, LT
+            >>>
+            >>> valid, items = Count(LT(5)).tee(iter(range(0, 10)))
+            >>> valid, list(items)
+            (False, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+        :param iterable: any value
+        :return: (result of :meth:`is_valid`, iterable with all items: value it self, if it has length,
+            otherwise iterator over consumed and remaining items)
+        :rtype: tuple
+        """
+        try:
+            value_length = len(iterable)
+        except TypeError:
+            try:
+                iterator = iter(iterable)
+            except TypeError:
+                return False, iterable
+            consumed = []
+            return bool(self._is_valid_iterable(iterator, consumed)), chain(consumed, iterator)
+        return bool(self.operand.is_valid(value_length)), iterable
+
+    def get_children(self):
+        """
+        :return: validator of length, stored in :attr:`operand`
+        :rtype: tuple
+        """
+        return (self.operand, )
+
+    def replace_children(self, children):
+        """
+        :param children: new validator of length
+        :type children: tuple
+        :return: validator of same type with other validator of length
+        :rtype: Len
+        """
+        return type(self)(children[0])
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Length can not be calculated inside expression (it may raise `TypeError`),
+        so helper function is defined for checking value length (items of iterables without length
+        are counted by bound method).
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        helper = compiler.define([
+            "try:",
+            "    value_length = len(value)",
+            "except TypeError:",
+            "    return {count}(value)".format(count=compiler.bind(self._is_valid_iterable)),
+            "return {expression}".format(expression=compiler.expression(self.operand, 'value_length')),
+        ])
+        return "{helper}({value})".format(helper=helper, value=value)
+
 
 class Count(Len):
     """
@@ -714,8 +1738,14 @@ class Count(Len):
         False
         >>> test.filter_values(['a', 'b'], ['a', 'b', 'c'], ['1', '2', '3', '4', '5', '6'])
         ([['a', 'b'], ['a', 'b', 'c']], [['1', '2', '3', '4', '5', '6']])
+        >>> Count(LT(5)).is_valid(value for value in range(0, 10 ** 9))  # stops after 5 items
+        False
 
     """
 
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "items count {operand}"
     """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
@@ -0,0 +1,160 @@
+"""
+
+Compiler turns tree of *validators* into single python function.
+
+Each validator knows how to represent it self as python expression
+(see :meth:`~.Base.get_compiled_expression`), so whole tree is rendered to source code
+with all operands bound as constants and logical operators replaced with native ``and``, ``or``, ``not``.
+Result function returns same results as :meth:`~.Base.is_valid`, but does not walk the tree
+and does not make method call for each node::
+
+    >>> from validity import And, GT, LT, EQ, Between, Not
+    >>>
+    >>> working_hours = And(Between(9, 18), Not(Between(13,15))).or_valid(EQ(14))
+    >>> is_working_hour = working_hours.compile()
+    >>> is_working_hour(10)
+    True
+    >>> [hour for hour in range(0, 24) if is_working_hour(hour)]
+    [9, 10, 11, 12, 14, 16, 17, 18]
+    >>> print is_working_hour.source
+    def compiled(value):
+        return (True if ((True if ((_c1 <= value <= _c2) and (not (_c3 <= value <= _c4))) else False) or (value == _c5)) else False)
+
+.. warning::
+    Operands are bound while compiling, so changes of validators, made after :meth:`~.Base.compile` call,
+    do not affect already compiled function.
+
+"""
+
+__docformat__ = 'reStructuredText'
+
+
+def _defining_class(cls, name):
+    """
+    Get class from `cls` mro, that defines attribute with given name.
+
+    :param cls: class to look in
+    :param name: attribute name
+    :return: class, that defines attribute or None
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
+
+def overrides_is_valid(validator, method_name):
+    """
+    Check if validator class overrides :meth:`~.Base.is_valid` after class, that defines given method.
+    Such method (for example :meth:`~.Base.get_compiled_expression`) is inherited
+    from parent class, that has other validation rule, so it can not be trusted.
+
+    :param validator: any validator
+    :type validator: Base
+    :param method_name: name of method, that represents validation rule of parent class
+    :type method_name: str
+    :return: True if :meth:`~.Base.is_valid` is defined in child class of class, that defines method
+    :rtype: bool
+    """
+    validator_type = type(validator)
+    method_class = _defining_class(validator_type, method_name)
+    is_valid_class = _defining_class(validator_type, 'is_valid')
+    return is_valid_class is not method_class and issubclass(is_valid_class, method_class)
+
+
+class Compiler(object):
+    """
+    Builds source code of python function from tree of *validators*.
+
+    Validators use :meth:`bind`, :meth:`define` and :meth:`expression` methods
+    inside :meth:`~.Base.get_compiled_expression`.
+    """
+
+    function_name = 'compiled'
+    """name of generated function"""
+
+    def __init__(self):
+        self.namespace = {'len': len, 'type': type}
+        self.definitions = []
+        self._counter = 0
+
+    def _new_name(self, prefix):
+        self._counter += 1
+        return "_{prefix}{index}".format(prefix=prefix, index=self._counter)
+
+    def bind(self, constant):
+        """
+        Bind constant to generated function.
+
+        :param constant: any object
+        :return: name, that can be used in generated source code for referring to constant
+        :rtype: str
+        """
+        name = self._new_name('c')
+        self.namespace[name] = constant
+        return name
+
+    def define(self, body):
+        """
+        Define helper function with one argument named ``value``.
+        Helpers are used by validators that can not be represented as single expression (like :class:`.Len`).
+
+        :param body: list of source code lines of function body
+        :type body: list
+        :return: name of helper function
+        :rtype: str
+        """
+        name = self._new_name('f')
+        self.definitions.append("def {name}(value):".format(name=name))
+        self.definitions.extend("    " + line for line in body)
+        return name
+
+    def expression(self, validator, value):
+        """
+        Get python expression, that checks if `value` is valid for `validator`.
+
+        If validator class overrides :meth:`~.Base.is_valid` without overriding
+        :meth:`~.Base.get_compiled_expression`, inherited expression can not be trusted,
+        so :meth:`~.Base.is_valid` call is used instead.
+
+        :param validator: validator to represent
+        :type validator: Base
+        :param value: name of variable, that holds value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        if overrides_is_valid(validator, 'get_compiled_expression'):
+            return "{is_valid}({value})".format(is_valid=self.bind(validator.is_valid), value=value)
+        return validator.get_compiled_expression(self, value)
+
+    def get_source(self, validator):
+        """
+        Get source code of function for given validator.
+
+        :param validator: validator to compile
+        :type validator: Base
+        :return: python source code
+        :rtype: str
+        """
+        body = "def {name}(value):\n    return {expression}".format(
+            name=self.function_name, expression=self.expression(validator, 'value'))
+        return "\n".join(self.definitions + [body])
+
+    def compile(self, validator):
+        """
+        Compile validator to python function.
+        Generated source code is stored in ``source`` attribute of returned function.
+
+        :param validator: validator to compile
+        :type validator: Base
+        :return: function, that takes one argument and returns same result as ``validator.is_valid``
+        :rtype: function
+        """
+        source = self.get_source(validator)
+        code = compile(source, "<validity compiled>", "exec")
+        exec(code, self.namespace)  # pylint: disable=exec-used
+        function = self.namespace[self.function_name]
+        function.source = source
+        function.__doc__ = validator.get_condition_text()
+        return function
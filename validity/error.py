@@ -0,0 +1,155 @@
+"""
+
+Validation errors.
+
+:meth:`~.Base.get_error` returns condition text of validator, if value is not valid.
+With ``lazy=True`` it returns lightweight :class:`.Error` instead, that holds reference to validator
+and renders text only when it is converted to string::
+
+    >>> from validity import Any, Error
+    >>>
+    >>> error = Any(list(range(0, 100000))).get_error(-1, lazy=True)
+    >>> error.value
+    -1
+    >>> error.get_text(max_length=40)
+    'must be any of (0, 1, 2, 3, 4, 5, 6, ...'
+    >>> default, Error.max_length = Error.max_length, 40  # default limit of all errors
+    >>> print error
+    must be any of (0, 1, 2, 3, 4, 5, 6, ...
+    >>> Error.max_length = default
+
+Only beginning of text is rendered for truncated text (see :meth:`~.Base.get_limited_condition_text`),
+so short error of large :class:`.Any` is cheap. Text of large :class:`.Any` can also be limited
+with :attr:`.Any.max_text_values`.
+
+:meth:`~.Base.explain` checks value once and returns :class:`.Explanation` with errors of leaves,
+that decided result, instead of condition text of whole validator::
+
+    >>> from validity import And, Or, TypeIs, Len, LT, Any
+    >>>
+    >>> test = And(TypeIs(str), Or(Len(LT(3)), Any('long', 'longer')))
+    >>> explanation = test.explain('wrong')
+    >>> print explanation
+    length must be less than 3
+    must be any of (long, longer)
+    >>> [error.validator for error in explanation.get_errors()] == [test.operands[1].operands[0], test.operands[1].operands[1]]
+    True
+
+"""
+
+__docformat__ = 'reStructuredText'
+
+
+class Error(object):
+    """
+    Lazy validation error.
+    Text is rendered from :meth:`~.Base.get_cached_condition_text` of validator, when error is converted to string
+    (with :attr:`max_length` only beginning of text is rendered, see :meth:`~.Base.get_limited_condition_text`).
+    """
+
+    __slots__ = ('validator', 'value')
+
+    max_length = None
+    """maximum length of error text, longer texts are truncated. None means no limit."""
+
+    ellipsis = '...'
+    """suffix of truncated text"""
+
+    def __init__(self, validator, value):
+        """
+        :param validator: validator, for which value is not valid
+        :type validator: Base
+        :param value: checked value
+        """
+        self.validator = validator
+        self.value = value
+
+    def get_text(self, max_length=None):
+        """
+        Render error text.
+
+        :param max_length: maximum length of text (including :attr:`ellipsis`). If None, :attr:`max_length` is used.
+        :type max_length: int
+        :return: condition text of validator, truncated to max_length
+        :rtype: str
+        """
+        max_length = self.max_length if max_length is None else max_length
+        if max_length is None:
+            return self.validator.get_cached_condition_text()
+        return self._truncate(self.validator.get_limited_condition_text(max_length), max_length)
+
+    def _truncate(self, text, max_length):
+        """
+        :param text: error text
+        :type text: str
+        :param max_length: maximum length of text (including :attr:`ellipsis`)
+        :type max_length: int
+        :return: text, truncated to max_length
+        :rtype: str
+        """
+        if len(text) > max_length:
+            cut = max_length - len(self.ellipsis)
+            return text[:cut] + self.ellipsis if cut > 0 else self.ellipsis[:max_length]
+        return text
+
+    def __str__(self):
+        return self.get_text()
+
+    def __repr__(self):
+        return "<{name} value={value!r}>".format(name=type(self).__name__, value=self.value)
+
+
+class Explanation(object):
+    """
+    Result of validation with leaves, that decided it (see :meth:`~.Base.explain`).
+    """
+
+    __slots__ = {
+        'validator': "checked validator",
+        'value': "checked value",
+        'valid': "result of validation",
+        'reasons': "list of pairs (leaf validator, negated), that decided result (see :meth:`~.Base.get_reasons`)",
+    }
+
+    def __init__(self, validator, value, valid, reasons):
+        """
+        :param validator: checked validator
+        :type validator: Base
+        :param value: checked value
+        :param valid: result of validation
+        :type valid: bool
+        :param reasons: pairs (leaf validator, negated)
+        :type reasons: list
+        """
+        self.validator = validator
+        self.value = value
+        self.valid = valid
+        self.reasons = reasons
+
+    def get_errors(self):
+        """
+        Get errors of leaves, that are not valid for value (negated leaves are wrapped with :class:`.Not`).
+
+        :return: list of :class:`.Error`, empty if value is valid
+        :rtype: list
+        """
+        if self.valid:
+            return []
+        from validity.logical_operator import Not  # pylint: disable=cyclic-import
+        return [Error(Not(validator) if negated else validator, self.value) for validator, negated in self.reasons]
+
+    def get_texts(self, max_length=None):
+        """
+        :param max_length: maximum length of each text (see :meth:`.Error.get_text`)
+        :type max_length: int
+        :return: texts of errors (see :meth:`get_errors`)
+        :rtype: list
+        """
+        return [error.get_text(max_length) for error in self.get_errors()]
+
+    def __str__(self):
+        return '\n'.join(self.get_texts())
+
+    def __repr__(self):
+        return "<{name} value={value!r} valid={valid} reasons={count}>".format(
+            name=type(self).__name__, value=self.value, valid=self.valid, count=len(self.reasons))
@@ -0,0 +1,210 @@
+"""
+
+Interning of *validators*.
+
+Built-in comparators and logical operators are compared structurally (see :meth:`~.Base.get_structure`),
+so equal validators can be used as dictionary keys and interchanged. Custom child classes are equal only to
+them selves, unless they set :attr:`~.Base.structural` (see :func:`~validity.logical_operator.get_structure`)::
+
+    >>> from validity import And, Or, GT, LT, TypeIs
+    >>>
+    >>> GT(5) == GT(5), GT(5) == GT(6)
+    (True, False)
+    >>> And(TypeIs(int), GT(5)) == TypeIs(int) & GT(5)
+    True
+
+:class:`.InternPool` replaces equal subtrees of many validators with single shared instance,
+so large catalog of rules, built from same parts, keeps only one copy of each part::
+
+    >>> from validity import InternPool
+    >>>
+    >>> pool = InternPool()
+    >>> rule_1 = pool.intern(And(TypeIs(int), GT(5), LT(10)))
+    >>> rule_2 = pool.intern(Or(And(TypeIs(int), GT(5), LT(10)), GT(100)))
+    >>> rule_2.operands[0] is rule_1
+    True
+
+With ``share_results=True`` pool wraps each interned subtree into :class:`.Shared`,
+so :meth:`.InternPool.evaluate` checks value with each subtree only once, even if it is used in many rules
+(it is useful for expensive subtrees, cheap ones become slower because of extra wrapper call).
+
+.. warning::
+    Interned validators are shared, so they must not be changed after interning.
+
+"""
+
+from weakref import WeakValueDictionary
+
+from validity.logical_operator import Base, get_structure
+from validity.vectorized import operand_mask
+
+__docformat__ = 'reStructuredText'
+
+
+class InternPool(object):
+    """
+    Pool of unique validators.
+    Validators are stored by :meth:`~.Base.get_structure` with weak references,
+    so unused validators are removed from pool automatically.
+    """
+
+    def __init__(self, share_results=False):
+        """
+        :param share_results: wrap interned subtrees (validators with nested validators) into :class:`.Shared`
+        :type share_results: bool
+        """
+        self.share_results = share_results
+        self.round = None
+        self._rounds = 0
+        self._nodes = WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __getstate__(self):
+        return {'share_results': self.share_results}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def intern(self, validator):
+        """
+        Get validator, equal to given one, from pool. Nested validators are interned first,
+        so validator is rebuilt with shared nested validators (see :meth:`~.Base.replace_children`).
+        If there is no equal validator in pool, given (or rebuilt) validator is added to pool.
+
+        Validators without structure (like :class:`.Cached` or custom :class:`.Base` child classes)
+        and validators with unhashable operands are not added to pool, only their nested validators are interned.
+
+        :param validator: validator to intern
+        :type validator: Base
+        :return: shared validator, equal to given one
+        :rtype: Base
+        """
+        children = validator.get_children()
+        if children:
+            interned = tuple(self.intern(child) for child in children)
+            if any(child is not interned_child for child, interned_child in zip(children, interned)):
+                validator = validator.replace_children(interned)
+
+        structure = get_structure(validator)
+        try:
+            shared = self._nodes.get(structure)
+        except TypeError:
+            return validator
+        if shared is None:
+            if structure is None:
+                return validator
+            shared = Shared(validator, self) if self.share_results and children else validator
+            self._nodes[structure] = shared
+        return shared
+
+    def evaluate(self, validators, value):
+        """
+        Check value with each of given validators.
+        If pool shares results, each :class:`.Shared` subtree is checked only once.
+
+        .. warning::
+            Evaluation is not thread-safe, same pool must be used by one thread at a time.
+
+        :param validators: interned validators
+        :type validators: list
+        :param value: value for check
+        :return: results of :meth:`~.Base.is_valid` of each validator
+        :rtype: list
+        """
+        self._rounds += 1
+        self.round = self._rounds
+        try:
+            return [validator.is_valid(value) for validator in validators]
+        finally:
+            self.round = None
+
+    def clear(self):
+        """
+        Remove all validators from pool.
+        """
+        self._nodes.clear()
+
+
+class Shared(Base):
+    """
+    Validator wrapper, that remembers result of last check while :meth:`.InternPool.evaluate` call.
+    Out of :meth:`.InternPool.evaluate` wrapped validator is called every time.
+    """
+
+    def __init__(self, validator, pool):
+        """
+        :param validator: validator to wrap
+        :type validator: Base
+        :param pool: pool, that controls evaluation rounds
+        :type pool: InternPool
+        """
+        self.validator = validator
+        self.pool = pool
+        self._round = None
+        self._result = None
+
+    __slots__ = ('validator', 'pool', '_round', '_result')
+
+    _transient = Base._transient + ('_round', '_result')
+
+    def __setstate__(self, state):
+        super(Shared, self).__setstate__(state)
+        self._round = None
+        self._result = None
+
+    def is_valid(self, value):
+        """
+        :param value: value for check
+        :return: result of wrapped validator :meth:`~.Base.is_valid`
+        :rtype: bool
+        """
+        current = self.pool.round
+        if current is None:
+            return self.validator.is_valid(value)
+        if self._round != current:
+            self._result = self.validator.is_valid(value)
+            self._round = current
+        return self._result
+
+    def get_children(self):
+        """
+        :return: wrapped validator
+        :rtype: tuple
+        """
+        return (self.validator, )
+
+    def replace_children(self, children):
+        """
+        :param children: new wrapped validator
+        :type children: tuple
+        :return: new shared validator of same pool
+        :rtype: Shared
+        """
+        return Shared(children[0], self.pool)
+
+    def get_mask(self, values):
+        """
+        Arrays are checked by wrapped validator.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        return operand_mask(self.validator, values)
+
+    def get_condition_text(self):
+        """
+        :return: condition text of wrapped validator
+        :rtype: str
+        """
+        return self.validator.get_cached_condition_text()
+
+    def get_nested_condition(self):
+        """
+        :return: nested condition text of wrapped validator
+        :rtype: str
+        """
+        return self.validator.get_nested_condition()
@@ -0,0 +1,351 @@
+"""
+
+Interval algebra for numeric *validators*.
+
+Comparators :class:`.GT`, :class:`.GTE`, :class:`.LT`, :class:`.LTE`, :class:`.EQ`, :class:`.NotEQ`
+and :class:`.Between` with numeric operand describe set of valid numbers,
+that can be represented as :class:`.IntervalSet` (see :meth:`~.Base.get_intervals`).
+Logical operators :class:`.And`, :class:`.Or`, :class:`.Not` of such comparators
+are intersection, union and complement of interval sets.
+
+:meth:`~.Base.simplify` uses it for reducing numeric validators tree to canonical sorted set of disjoint intervals,
+that is checked with single bisect (see :class:`.InIntervals`), or to single comparator if it is possible::
+
+    >>> from validity import And, Or, GT, LT, Between
+    >>>
+    >>> print Or(Between(1, 5), Between(4, 9)).simplify()
+    must be between 1 and 9
+    >>> print And(GT(5), GT(10)).simplify()
+    must be greater than 10
+    >>> print And(GT(10), LT(5)).simplify()
+    must be in nothing
+    >>> print Or(LT(0), Between(10, 20), GT(100), Between(15, 30)).simplify()
+    must be in (-inf, 0) or [10, 30] or (100, +inf)
+
+Values, that are not numbers, are compared with bounds of intervals (like comparators do), so usually
+it raises `TypeError`. If original tree gives same result for all such values without comparing them
+(like ``Or(EQ(1), EQ(2))``, see :func:`get_other_result`), this result is kept in :attr:`.InIntervals.other`::
+
+    >>> from validity import EQ, NotEQ
+    >>>
+    >>> Or(EQ(1), EQ(2)).simplify().is_valid('a')
+    False
+    >>> print And(NotEQ(0), NotEQ(1)).simplify()
+    must be in (-inf, 0) or (0, 1) or (1, +inf) or NaN (or not a number)
+
+"""
+
+from bisect import bisect_right
+from decimal import Decimal
+from numbers import Real
+
+from validity.compiler import overrides_is_valid
+
+__docformat__ = 'reStructuredText'
+
+
+_INF = float('inf')
+
+_ALL = ((-_INF, 0), (_INF, 1))
+
+_NUMBER_TYPES = frozenset([int, float, bool, Decimal])
+
+_UNSPECIFIED = object()
+
+
+def is_orderable(operand):
+    """
+    Check if operand can be used as interval bound.
+
+    :param operand: comparator operand
+    :return: True if operand is real number (or :py:class:`~decimal.Decimal`) and is not NaN
+    :rtype: bool
+    """
+    # pylint: disable=comparison-with-itself
+    return isinstance(operand, (Real, Decimal)) and operand == operand
+
+
+def is_number(value):
+    """
+    Check if value is number, that is checked with bounds of intervals.
+
+    :param value: value for check
+    :return: True if value is real number (or :py:class:`~decimal.Decimal`), including NaN
+    :rtype: bool
+    """
+    return type(value) in _NUMBER_TYPES or isinstance(value, (Real, Decimal))
+
+
+def get_other_result(validator):
+    """
+    Get result of numeric validator (see :meth:`~.Base.get_intervals`) for values, that are not numbers.
+    :class:`.EQ` is not valid for them, :class:`.NotEQ` is valid, other comparators compare value with
+    operand, so result is unknown (usually it raises `TypeError`). :class:`.Or` and :class:`.And` give result
+    of first operand, that is decisive or unknown.
+
+    :param validator: numeric validator
+    :type validator: Base
+    :return: True or False, or None if validator compares such values with numbers
+    :rtype: bool
+    """
+    # pylint: disable=cyclic-import
+    from validity.comparator import EQ, NotEQ, InIntervals
+    from validity.logical_operator import BaseLogicalOperator, Not
+
+    if isinstance(validator, InIntervals):
+        return validator.other
+    if isinstance(validator, EQ):
+        return False
+    if isinstance(validator, NotEQ):
+        return True
+    if isinstance(validator, Not):
+        result = get_other_result(validator.operands[0])
+        return None if result is None else not result
+    if isinstance(validator, BaseLogicalOperator) and validator._decisive_result is not None:  # pylint: disable=protected-access
+        decisive = validator._decisive_result  # pylint: disable=protected-access
+        for operand in validator.operands:
+            result = get_other_result(operand)
+            if result is None or result is decisive:
+                return result
+        return not decisive
+    return None
+
+
+def get_intervals(validator):
+    """
+    Get set of numbers, that are valid for validator (see :meth:`~.Base.get_intervals`).
+
+    :param validator: any validator
+    :type validator: Base
+    :return: interval set or None, if validator can not be represented as interval set
+        (or it's class overrides :meth:`~.Base.is_valid` without overriding :meth:`~.Base.get_intervals`)
+    :rtype: IntervalSet or None
+    """
+    if overrides_is_valid(validator, 'get_intervals'):
+        return None
+    return validator.get_intervals()
+
+
+class IntervalSet(object):
+    """
+    Sorted set of disjoint intervals of numbers.
+
+    Each interval is stored as pair of keys (start, end), where key is tuple (number, flag).
+    Number ``x`` belongs to interval if ``start <= (x, 0) < end``, so:
+
+        - closed lower bound ``a`` is ``(a, 0)``, open lower bound is ``(a, 1)``,
+        - closed upper bound ``b`` is ``(b, 1)``, open upper bound is ``(b, 0)``,
+        - unbounded sides are infinite numbers.
+
+    NaN does not belong to any interval, so it is stored separately in :attr:`nan` flag
+    (for example ``NotEQ(5)`` is valid for NaN, ``GT(5)`` is not).
+    """
+
+    __slots__ = ('intervals', 'nan', '_starts', '_ends', '_everything')
+
+    def __init__(self, intervals=(), nan=False):
+        """
+        Intervals are sorted and merged while initialization.
+
+        :param intervals: pairs of keys (start, end)
+        :type intervals: list
+        :param nan: True if NaN belongs to set
+        :type nan: bool
+        """
+        merged = []
+        for start, end in sorted(interval for interval in intervals if interval[0] < interval[1]):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        self.intervals = tuple(merged)
+        self.nan = nan
+        self._starts = [start for start, _ in merged]
+        self._ends = [end for _, end in merged]
+        self._everything = self.is_everything()
+
+    @classmethod
+    def greater(cls, bound, closed=False):
+        """
+        :param bound: lower bound
+        :param closed: True if bound belongs to set
+        :return: set of numbers greater than bound
+        :rtype: IntervalSet
+        """
+        return cls([((bound, 0 if closed else 1), _ALL[1])])
+
+    @classmethod
+    def less(cls, bound, closed=False):
+        """
+        :param bound: upper bound
+        :param closed: True if bound belongs to set
+        :return: set of numbers less than bound
+        :rtype: IntervalSet
+        """
+        return cls([(_ALL[0], (bound, 1 if closed else 0))])
+
+    @classmethod
+    def between(cls, min_value, max_value):
+        """
+        :param min_value: lower bound
+        :param max_value: upper bound
+        :return: set of numbers between min_value and max_value (bounds are included)
+        :rtype: IntervalSet
+        """
+        return cls([((min_value, 0), (max_value, 1))])
+
+    @classmethod
+    def everything(cls):
+        """
+        :return: set of all numbers and NaN
+        :rtype: IntervalSet
+        """
+        return cls([_ALL], nan=True)
+
+    def __getstate__(self):
+        return (self.intervals, self.nan)
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def __contains__(self, value):
+        # pylint: disable=comparison-with-itself
+        if self._everything:
+            return True
+        if value != value:
+            return self.nan
+        key = (value, 0)
+        index = bisect_right(self._starts, key) - 1
+        return index >= 0 and key < self._ends[index]
+
+    def __invert__(self):
+        return self.complement()
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __eq__(self, other):
+        return isinstance(other, IntervalSet) and self.intervals == other.intervals and self.nan == other.nan
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((self.intervals, self.nan))
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def complement(self):
+        """
+        :return: set of numbers, that do not belong to this set
+        :rtype: IntervalSet
+        """
+        intervals = []
+        start = _ALL[0]
+        for interval_start, interval_end in self.intervals:
+            intervals.append((start, interval_start))
+            start = interval_end
+        intervals.append((start, _ALL[1]))
+        return IntervalSet(intervals, not self.nan)
+
+    def union(self, other):
+        """
+        :param other: other set
+        :type other: IntervalSet
+        :return: set of numbers, that belong to any of sets
+        :rtype: IntervalSet
+        """
+        return IntervalSet(self.intervals + other.intervals, self.nan or other.nan)
+
+    def intersection(self, other):
+        """
+        :param other: other set
+        :type other: IntervalSet
+        :return: set of numbers, that belong to both sets
+        :rtype: IntervalSet
+        """
+        return self.complement().union(other.complement()).complement()
+
+    def is_empty(self):
+        """
+        :return: True if no value belongs to set
+        :rtype: bool
+        """
+        return not self.intervals and not self.nan
+
+    def is_everything(self):
+        """
+        :return: True if any number (and NaN) belongs to set
+        :rtype: bool
+        """
+        return self.intervals == (_ALL, ) and self.nan
+
+    def get_text(self):
+        """
+        Get text representation of set, like ``(-inf, 0) or [10, 30]``.
+
+        :return: text representation
+        :rtype: str
+        """
+        parts = []
+        for (start, start_flag), (end, end_flag) in self.intervals:
+            parts.append("{left}{start}, {end}{right}".format(
+                left='(' if start_flag or start == -_INF else '[',
+                start='-inf' if start == -_INF else start,
+                end='+inf' if end == _INF else end,
+                right=']' if end_flag and end != _INF else ')'))
+        if self.nan:
+            parts.append('NaN')
+        return " or ".join(parts) if parts else 'nothing'
+
+    def to_validator(self, other=_UNSPECIFIED):
+        """
+        Get simplest validator, that is valid for numbers from this set.
+
+        Single interval is represented with :class:`.GT`, :class:`.GTE`, :class:`.LT`, :class:`.LTE`,
+        :class:`.EQ`, or :class:`.Between`, all numbers except one - with :class:`.NotEQ`,
+        other sets - with :class:`.InIntervals`.
+        Interval with :py:class:`~decimal.Decimal` bound is also represented with :class:`.InIntervals`
+        (unless it is single number), as ordering comparison of NaN with Decimal raises
+        :py:class:`~decimal.InvalidOperation`, but NaN is checked without comparisons in interval set.
+
+        :param other: required result for values, that are not numbers (see :func:`get_other_result`),
+            :class:`.InIntervals` is used, if simplest validator gives other result
+        :type other: bool
+        :return: validator
+        :rtype: Base
+        """
+        validator = self._get_simplest_validator()
+        if other is not _UNSPECIFIED and get_other_result(validator) is not other:
+            from validity.comparator import InIntervals  # pylint: disable=cyclic-import
+            return InIntervals(self, other)
+        return validator
+
+    def _get_simplest_validator(self):
+        """
+        :return: validator for numbers from this set (see :meth:`to_validator`)
+        :rtype: Base
+        """
+        from validity.comparator import GT, GTE, LT, LTE, EQ, NotEQ, Between, InIntervals  # pylint: disable=cyclic-import
+
+        if len(self.intervals) == 1 and not self.nan:
+            (start, start_flag), (end, end_flag) = self.intervals[0]
+            if type(start) is Decimal or type(end) is Decimal:  # pylint: disable=unidiomatic-typecheck
+                return EQ(start) if start == end else InIntervals(self)
+            if end == _INF and end_flag:
+                return GT(start) if start_flag else GTE(start)
+            if start == -_INF and not start_flag:
+                return LTE(end) if end_flag else LT(end)
+            if not start_flag and end_flag:
+                return EQ(start) if start == end else Between(start, end)
+        if len(self.intervals) == 2 and self.nan:
+            (start, start_flag), (end, end_flag) = self.intervals[0][1], self.intervals[1][0]
+            if self.intervals[0][0] == _ALL[0] and self.intervals[1][1] == _ALL[1] \
+                    and start == end and not start_flag and end_flag:
+                return NotEQ(start)
+        return InIntervals(self)
@@ -81,12 +81,304 @@ Available logical operators
 
 """
 
+import time
+from numbers import Integral
+from weakref import ref
+
+from validity.compiler import Compiler, overrides_is_valid
+from validity.error import Error, Explanation
+from validity.interval import get_intervals, get_other_result
+from validity.vectorized import get_mask, loop_mask, operand_mask
+
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+def get_negation(validator):
+    """
+    Get validator, that gives opposite results (see :meth:`~.Base.get_negation`).
+
+    :param validator: any validator
+    :type validator: Base
+    :return: negation or None, if validator has no simple negation
+        (or it's class overrides :meth:`~.Base.is_valid` without overriding :meth:`~.Base.get_negation`)
+    :rtype: Base or None
+    """
+    if overrides_is_valid(validator, 'get_negation'):
+        return None
+    return validator.get_negation()
+
+
+def get_structure(validator):
+    """
+    Get structure of validator (see :meth:`~.Base.get_structure`), if it's class is compared by structure.
+
+    :attr:`~.Base.structural` is read only from class of validator, not from it's parents:
+    child class can keep validation rule in other attributes (like tolerance of custom comparator),
+    so it is equal only to it self, until it sets :attr:`~.Base.structural` explicitly.
+
+    :param validator: any validator
+    :type validator: Base
+    :return: structure or None
+    :rtype: tuple
+    """
+    if not type(validator).__dict__.get('structural', False):
+        return None
+    return validator.get_structure()
+
+
+def get_reasons(validator, value):
+    """
+    Check value and get leaves, that decided result (see :meth:`~.Base.get_reasons`).
+
+    :param validator: any validator
+    :type validator: Base
+    :param value: value for check
+    :return: (result, reasons)
+    :rtype: tuple
+    """
+    if overrides_is_valid(validator, 'get_reasons'):
+        return Base.get_reasons(validator, value)
+    return validator.get_reasons(value)
+
+
+def _get_decisive_reasons(operator, value):
+    """
+    Check operands of :class:`.Or` or :class:`.And` in order, until one of them gives decisive result
+    (see :attr:`~.BaseLogicalOperator._decisive_result`), which is explained by reasons of that operand.
+    Otherwise result is explained by reasons of all operands.
+
+    :param operator: :class:`.Or` or :class:`.And`
+    :type operator: BaseLogicalOperator
+    :param value: value for check
+    :return: (result, reasons)
+    :rtype: tuple
+    """
+    reasons = []
+    for operand in operator.operands:
+        result, operand_reasons = get_reasons(operand, value)
+        if result is operator._decisive_result:  # pylint: disable=protected-access
+            return result, operand_reasons
+        reasons.extend(operand_reasons)
+    return not operator._decisive_result, reasons  # pylint: disable=protected-access
+
+
+def join_normalized(operator_type, operands, adaptive=None):
+    """
+    Join normalized operands with :class:`.Or` or :class:`.And` (see :meth:`~.Base.normalize`).
+
+    Operands, that are operators of same type (and same adaptive mode), are replaced with their operands,
+    repeated operands are removed: same instances, and validators of classes, that are compared by structure
+    (see :func:`get_structure`), with equal structures.
+
+    :param operator_type: :class:`.Or` or :class:`.And`
+    :type operator_type: type
+    :param operands: normalized operands
+    :type operands: tuple
+    :param adaptive: adaptive mode of operator
+    :type adaptive: bool or int
+    :return: single remaining operand or new operator
+    :rtype: Base
+    """
+    result = []
+    seen = set()
+    for operand in operands:
+        # pylint: disable=unidiomatic-typecheck
+        if type(operand) is operator_type and (operand.adaptive or None) == (adaptive or None):
+            nested = operand.operands
+        else:
+            nested = (operand, )
+        for item in nested:
+            structure = get_structure(item)
+            if structure is not None:  # other validators are equal only to them selves
+                try:
+                    hash(structure)
+                except TypeError:
+                    result.append(item)
+                    continue
+            if item not in seen:
+                seen.add(item)
+                result.append(item)
+    if len(result) == 1:
+        return result[0]
+    if adaptive:
+        return operator_type(*result, adaptive=adaptive)
+    return operator_type(*result)
+
+
+_set_attribute = object.__setattr__
+
+_REGISTERED = ()
+"""Value of ``_cache`` of validator, that has no cached data, but is registered in nested validators
+(see :meth:`Base.invalidate`)."""
+
+_MISSING = object()
+
+_SLOT_NAMES = {}
+
+
+def _get_slot_names(klass):
+    """
+    :param klass: validator class
+    :type klass: type
+    :return: names of slots of class and it's parents (except ``__dict__`` and ``__weakref__``)
+    :rtype: tuple
+    """
+    names = _SLOT_NAMES.get(klass)
+    if names is None:
+        names = []
+        for parent in klass.__mro__:
+            slots = parent.__dict__.get('__slots__', ())
+            for name in (slots, ) if isinstance(slots, str) else slots:
+                if name not in ('__dict__', '__weakref__') and name not in names:
+                    names.append(name)
+        names = _SLOT_NAMES[klass] = tuple(names)
+    return names
+
 
 class Base(object):
     """
     Base class for all module classes.
     """
 
+    __slots__ = ('_cache', '_owners', '__weakref__')
+    # ``_cache`` and ``_owners`` are not set, until validator is registered (see :meth:`invalidate`),
+    # so construction of validators does not pay for them
+
+    _transient = ('_cache', '_owners')
+    """names of private attributes, that are not pickled (see :meth:`__getstate__`)"""
+
+    structural = False
+    """True if validators of this class are compared by :meth:`get_structure`, otherwise they are equal
+    only to them selves. It is not inherited (see :func:`~validity.logical_operator.get_structure`),
+    so child classes of built-in validators, that keep validation rule in own attributes, are not equal by mistake."""
+
+    def __getstate__(self):
+        """
+        Cached data (attributes, listed in :attr:`_transient`) and slots, that are None
+        (like :attr:`~.BaseLogicalOperator.adaptive` by default), are not pickled (see :mod:`validity.parallel`).
+
+        :return: attributes of validator (values of slots and ``__dict__``)
+        :rtype: dict
+        """
+        state = dict(getattr(self, '__dict__', ()))
+        transient = self._transient
+        for name in _get_slot_names(type(self)):
+            if name not in transient:
+                value = getattr(self, name, None)
+                if value is not None:
+                    state[name] = value
+        for name in transient:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore unpickled validator. Slots, that are not pickled (see :meth:`__getstate__`),
+        are initialized with None, child classes rebuild cached data here, if it is needed.
+
+        :param state: attributes of validator
+        :type state: dict
+        """
+        for name in _get_slot_names(type(self)) + self._transient:
+            _set_attribute(self, name, None)
+        for name, value in state.items():
+            _set_attribute(self, name, value)
+
+    def __setattr__(self, name, value):
+        """
+        Public attributes (like :attr:`~.BaseComparator.operand`) define validation rule,
+        so replacing of them makes data, cached by this validator and by validators, that contain it,
+        outdated (see :meth:`invalidate`). Validators without cached data (like validators in ``__init__``)
+        are not invalidated, so built-in validators set attributes in ``__init__`` directly.
+        """
+        _set_attribute(self, name, value)
+        if name[0] != '_' and getattr(self, '_cache', None) is not None:
+            self.invalidate()
+
+    def invalidate(self):
+        """
+        Drop data, cached by this validator (like condition text, hash or merged operands of :class:`.Or`)
+        and by validators, that contain it.
+
+        Validator, that caches data derived from nested validators (see :meth:`get_children`),
+        is registered in them, so only validators, that contain changed one, drop their data.
+        It is called automatically, when public attribute of validator is replaced,
+        so call it only after in-place change of mutable attribute (like list, stored in attribute of
+        custom validator).
+        """
+        registered = getattr(self, '_cache', None) is not None
+        self._reset_cache()
+        if registered:  # nested validators may be replaced
+            for child in self.get_children():
+                child._add_owner(self)  # pylint: disable=protected-access
+
+    def _reset_cache(self):
+        """
+        Drop cached data of this validator and of validators, that contain it.
+        Child classes, that keep cached data in own attributes, reset them here.
+        """
+        if getattr(self, '_cache', None):
+            _set_attribute(self, '_cache', _REGISTERED)
+        owners = getattr(self, '_owners', None)
+        if owners is not None:
+            for reference in owners:
+                owner = reference()
+                if owner is not None and getattr(owner, '_cache', None) is not None:
+                    owner._reset_cache()  # pylint: disable=protected-access
+
+    def _register(self):
+        """
+        Register validator in nested validators (and them in their nested validators),
+        so their changes drop data, cached by this validator (see :meth:`invalidate`).
+        """
+        if getattr(self, '_cache', None) is None:
+            _set_attribute(self, '_cache', _REGISTERED)
+            for child in self.get_children():
+                child._add_owner(self)  # pylint: disable=protected-access
+
+    def _add_owner(self, owner):
+        """
+        :param owner: validator, that contains this validator and caches data derived from it
+        :type owner: Base
+        """
+        owners = getattr(self, '_owners', None)
+        if owners is None:
+            _set_attribute(self, '_owners', [ref(owner)])
+        else:
+            for reference in owners:
+                if reference() is owner:
+                    break
+            else:
+                count = len(owners)
+                if count >= 8 and not count & (count - 1):  # drop references to removed owners
+                    owners[:] = [reference for reference in owners if reference() is not None]
+                owners.append(ref(owner))
+        self._register()
+
+    def _get_cached(self, name):
+        """
+        :param name: name of cached data
+        :type name: str
+        :return: cached data or ``_MISSING``
+        """
+        cache = getattr(self, '_cache', None)
+        return cache.get(name, _MISSING) if cache else _MISSING
+
+    def _set_cached(self, name, value):
+        """
+        Cache data, derived from this validator and it's nested validators (it is dropped by :meth:`invalidate`).
+
+        :param name: name of cached data
+        :type name: str
+        :param value: data
+        """
+        cache = getattr(self, '_cache', None)
+        if not cache:
+            self._register()
+            cache = {}
+            _set_attribute(self, '_cache', cache)
+        cache[name] = value
+
     def __call__(self, value):
         """
         If class instance is called like function - returns result of :meth:`.is_valid` method.
@@ -126,33 +418,132 @@ class Base(object):
         """
         raise NotImplementedError()
 
+    def ais_valid(self, value):
+        """
+        Check if given value is valid in event loop (python 3.7+, see :mod:`validity.aio`).
+
+        Example::
+
+            >>> import asyncio
+            >>> from validity import GT
+            >>>
+            >>> asyncio.run(GT(5).ais_valid(10))
+            True
+
+        :param value: value for check
+        :return: coroutine, that returns result of validation
+        """
+        from validity.aio import ais_valid  # pylint: disable=cyclic-import
+        return ais_valid(self, value)
+
+    def is_async(self):
+        """
+        Check if validator has asynchronous validators (see :class:`~validity.aio.AsyncBaseComparator`) inside.
+
+        Result is cached like condition text (see :meth:`.get_cached_condition_text`), so :meth:`ais_valid`
+        of each nested operator does not walk whole subtree again.
+
+        :return: True if any of nested validators (see :meth:`.get_children`) is asynchronous
+        :rtype: bool
+        """
+        result = self._get_cached('async')
+        if result is _MISSING:
+            result = any(child.is_async() for child in self.get_children())
+            self._set_cached('async', result)
+        return result
+
+    def is_blocking(self):
+        """
+        Check if validator has blocking comparators (see :attr:`.BaseComparator.blocking`) inside.
+
+        :return: True if any of nested validators (see :meth:`.get_children`) is blocking
+        :rtype: bool
+        """
+        return any(child.is_blocking() for child in self.get_children())
+
     def all_is_valid(self, *values):
         """
-        Checks if all of given values are valid
+        Checks if all of given values are valid.
+        Blocking validators (see :meth:`.is_blocking`) check values in thread pool (see :mod:`validity.blocking`).
 
         :param values: values for check
         :return: True if result of :meth:`.is_valid` is True for all given values
         :rtype: bool
         """
+        if self.is_blocking():
+            from validity.blocking import iter_results  # pylint: disable=cyclic-import
+            return all(result for _, result in iter_results(self, values))
         # return all(self.is_valid(value) for value in values)
         for value in values:
             if not self.is_valid(value):
                 return False
         return True
 
-    def get_error(self, value):
+    def get_error(self, value, lazy=False):
         """
         Get error text for given value if value is not valid ( :meth:`.is_valid` returned False).
 
+        If ``lazy`` is True, returns :class:`~validity.error.Error`, that renders text only when
+        it is converted to string.
+
         :param value: value for check.
-        :return: None if :meth:`.is_valid` returned True, :meth:`.get_condition_text` in other cases.
-        :rtype: None or str
+        :param lazy: return lazy error object instead of text
+        :type lazy: bool
+        :return: None if :meth:`.is_valid` returned True, :meth:`.get_cached_condition_text` in other cases.
+        :rtype: None or str or validity.error.Error
+        """
+        if self.is_valid(value):
+            return None
+        return Error(self, value) if lazy else self.get_cached_condition_text()
+
+    def get_reasons(self, value):
+        """
+        Check value and get leaves of validator, that decided result (see :meth:`explain`).
+
+        By default validator is leaf, so it is the only reason of it's result.
+        Logical operators override this method and collect reasons from operands.
+
+        :param value: value for check
+        :return: (result, reasons), where reasons is list of pairs (leaf validator, negated).
+            Negated leaf decided result by opposite result (like operand of :class:`.Not`).
+        :rtype: tuple
+        """
+        return bool(self.is_valid(value)), [(self, False)]
+
+    def explain(self, value):
+        """
+        Check value once and explain result with minimal set of leaves, that decided it.
+
+        Operands are checked in order with short-circuit, like :meth:`is_valid` does, so :class:`.And`
+        is explained by it's first not valid operand, and :class:`.Or` by all of it's operands.
+        Leaves under :class:`.Not` are reported negated.
+
+        Example::
+
+            >>> from validity import And, Or, Not, TypeIs, GT, LT, EQ
+            >>>
+            >>> test = And(TypeIs(int), Or(LT(0), GT(10)), Not(EQ(42)))
+            >>> explanation = test.explain(5)
+            >>> explanation.valid
+            False
+            >>> for error in explanation.get_errors():
+            ...     print error
+            must be less than 0
+            must be greater than 10
+            >>> print test.explain(42)
+            NOT(must be equal to 42)
+
+        :param value: value for check
+        :return: explanation of result
+        :rtype: validity.error.Explanation
         """
-        return None if self.is_valid(value) else self.get_condition_text()
+        result, reasons = get_reasons(self, value)
+        return Explanation(self, value, result, reasons)
 
     def filter_values(self, *values):
         """
-        Checks each given value and returns tuple of lists (valid, not_valid)
+        Checks each given value and returns tuple of lists (valid, not_valid).
+        Blocking validators (see :meth:`.is_blocking`) check values in thread pool (see :mod:`validity.blocking`).
 
         :param values: values for check
         :return: ([list of valid values], [list of not valid values])
@@ -160,10 +551,431 @@ class Base(object):
         """
         valid = []
         not_valid = []
+        if self.is_blocking():
+            from validity.blocking import iter_results  # pylint: disable=cyclic-import
+            for value, is_valid in iter_results(self, values):
+                (valid if is_valid else not_valid).append(value)
+            return valid, not_valid
         for value in values:
             (valid if self.is_valid(value) else not_valid).append(value)
         return valid, not_valid
 
+    def iter_partition(self, iterable):
+        """
+        Lazily checks each value from iterable and yields pairs (value, is_valid).
+        Unlike :meth:`.filter_values`, values are not collected, so any iterable
+        (generator, file, socket reader) can be checked with constant memory.
+
+        Example::
+
+            >>> from validity import GT
+            >>>
+            >>> list(GT(10).iter_partition(iter([5, 15])))
+            [(5, False), (15, True)]
+
+        :param iterable: values for check
+        :return: generator of pairs (value, result of :meth:`.is_valid`)
+        :rtype: generator
+        """
+        is_valid = self.is_valid
+        for value in iterable:
+            yield value, bool(is_valid(value))
+
+    def iter_valid(self, iterable):
+        """
+        Lazily yields valid values from iterable.
+
+        Example::
+
+            >>> from validity import Between
+            >>>
+            >>> with open('hours.txt') as lines:  # doctest: +SKIP
+            ...     working_hours = list(Between(9, 18).iter_valid(int(line) for line in lines))
+
+        :param iterable: values for check
+        :return: generator of values, for which :meth:`.is_valid` returned True
+        :rtype: generator
+        """
+        is_valid = self.is_valid
+        for value in iterable:
+            if is_valid(value):
+                yield value
+
+    def iter_invalid(self, iterable):
+        """
+        Lazily yields not valid values from iterable.
+
+        :param iterable: values for check
+        :return: generator of values, for which :meth:`.is_valid` returned False
+        :rtype: generator
+        """
+        is_valid = self.is_valid
+        for value in iterable:
+            if not is_valid(value):
+                yield value
+
+    def route_values(self, iterable, valid_sink=None, invalid_sink=None):
+        """
+        Checks each value from iterable and passes it to one of sinks as soon as it is checked.
+
+        Example::
+
+            >>> from validity import GT
+            >>>
+            >>> valid, not_valid = [], []
+            >>> GT(10).route_values(iter(range(8, 13)), valid.append, not_valid.append)
+            (2, 3)
+            >>> valid, not_valid
+            ([11, 12], [8, 9, 10])
+
+        :param iterable: values for check
+        :param valid_sink: callable, that takes valid value. If None, valid values are skipped.
+        :type valid_sink: callable
+        :param invalid_sink: callable, that takes not valid value. If None, not valid values are skipped.
+        :type invalid_sink: callable
+        :return: (count of valid values, count of not valid values)
+        :rtype: int, int
+        """
+        is_valid = self.is_valid
+        valid_count = 0
+        invalid_count = 0
+        for value in iterable:
+            if is_valid(value):
+                valid_count += 1
+                if valid_sink is not None:
+                    valid_sink(value)
+            else:
+                invalid_count += 1
+                if invalid_sink is not None:
+                    invalid_sink(value)
+        return valid_count, invalid_count
+
+    def is_valid_array(self, values, chunk_size=None):
+        """
+        Check each element of numpy array (see :mod:`validity.vectorized`).
+
+        Example::
+
+            >>> import numpy
+            >>> from validity import GT, LT, EQ
+            >>>
+            >>> values = numpy.arange(38, 53)
+            >>> mask = (GT(50) | LT(40) | EQ(42)).is_valid_array(values)
+            >>> values[mask], values[~mask]
+            (array([38, 39, 42, 51, 52]), array([40, 41, 43, 44, 45, 46, 47, 48, 49, 50]))
+
+        :param values: numpy array or any sequence, that can be converted to array
+        :param chunk_size: if given, array is checked by chunks of this size for bounding memory usage
+        :type chunk_size: int
+        :return: boolean mask with same shape as values (True for valid elements)
+        :rtype: numpy.ndarray
+        :raises ~exceptions.ImportError: if numpy is not installed
+        """
+        return get_mask(self, values, chunk_size)
+
+    def mask(self, values, chunk_size=None):
+        """
+        Same as :meth:`.is_valid_array`.
+
+        :param values: numpy array or any sequence, that can be converted to array
+        :param chunk_size: if given, array is checked by chunks of this size for bounding memory usage
+        :type chunk_size: int
+        :return: boolean mask with same shape as values (True for valid elements)
+        :rtype: numpy.ndarray
+        """
+        return self.is_valid_array(values, chunk_size)
+
+    def get_mask(self, values):
+        """
+        Get boolean mask of valid elements of one dimensional numpy array.
+        Used by :meth:`.is_valid_array`.
+
+        By default calls :meth:`.is_valid` for each element. Child classes can override this method
+        for checking elements with vectorized numpy operations.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        return loop_mask(self, values)
+
+    def cached(self, maxsize=1024):
+        """
+        Wraps ``self`` with :class:`~validity.cache.Cached`, that memoizes validation results
+        of hashable values in bounded LRU cache.
+
+        Example::
+
+            >>> from validity import Any
+            >>>
+            >>> test = Any('UA', 'PL', 'DE').cached(maxsize=2)
+            >>> test('UA'), test('UA'), test('US'), test('PL')
+            (True, True, False, True)
+            >>> test.cache_info()
+            CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2)
+
+        :param maxsize: maximum count of cached results
+        :type maxsize: int
+        :return: ``Cached(self, maxsize)``
+        :rtype: validity.cache.Cached
+        """
+        from validity.cache import Cached  # pylint: disable=cyclic-import
+        return Cached(self, maxsize)
+
+    def partition_parallel(self, iterable, workers=None, chunksize=1000):
+        """
+        Check values in pool of processes (see :mod:`validity.parallel`).
+        Validator is sent to each process once, values are sent by chunks.
+
+        Example::
+
+            >>> from validity import GT
+            >>>
+            >>> GT(2).partition_parallel([1, 2, 3, 4], workers=2, chunksize=2)
+            [(1, False), (2, False), (3, True), (4, True)]
+
+        :param iterable: values for check
+        :param workers: count of processes (``os.cpu_count()`` if None)
+        :type workers: int
+        :param chunksize: count of values, sent to process at once
+        :type chunksize: int
+        :return: list of pairs (value, result of :meth:`.is_valid`) in order of values
+        :rtype: list
+        """
+        from validity.parallel import partition_parallel  # pylint: disable=cyclic-import
+        return partition_parallel(self, iterable, workers, chunksize)
+
+    def iter_partition_parallel(self, iterable, workers=None, chunksize=1000):
+        """
+        Same as :meth:`.iter_partition`, but values are checked in pool of processes (see :mod:`validity.parallel`).
+        Values are read from iterable by chunks, only while workers are busy with few previous chunks,
+        so memory does not grow with count of values.
+
+        Example::
+
+            >>> from validity import GT
+            >>>
+            >>> for value, valid in GT(2).iter_partition_parallel(iter([1, 3]), workers=2):
+            ...     print value, valid
+            1 False
+            3 True
+
+        :param iterable: values for check
+        :param workers: count of processes (``os.cpu_count()`` if None)
+        :type workers: int
+        :param chunksize: count of values, sent to process at once
+        :type chunksize: int
+        :return: generator of pairs (value, result of :meth:`.is_valid`) in order of values
+        :rtype: generator
+        """
+        from validity.parallel import iter_partition_parallel  # pylint: disable=cyclic-import
+        return iter_partition_parallel(self, iterable, workers, chunksize)
+
+    def filter_values_parallel(self, iterable, workers=None, chunksize=1000):
+        """
+        Same as :meth:`.filter_values`, but values are checked in pool of processes (see :meth:`.partition_parallel`).
+
+        :param iterable: values for check
+        :param workers: count of processes (``os.cpu_count()`` if None)
+        :type workers: int
+        :param chunksize: count of values, sent to process at once
+        :type chunksize: int
+        :return: (valid, not_valid) lists in order of values
+        :rtype: tuple
+        """
+        from validity.parallel import filter_values_parallel  # pylint: disable=cyclic-import
+        return filter_values_parallel(self, iterable, workers, chunksize)
+
+    def compile(self):
+        """
+        Compile validator to python function (see :class:`~validity.compiler.Compiler`).
+
+        Whole tree of validators is rendered to single function with operands bound as constants,
+        so there is no method call for each node while checking value.
+
+        Example::
+
+            >>> from validity import GT, LT, EQ
+            >>>
+            >>> test = (GT(50) | LT(40) | EQ(42)).compile()
+            >>> test(42)
+            True
+            >>> [value for value in range(38, 53) if test(value)]
+            [38, 39, 42, 51, 52]
+
+        :return: function, that returns same result as :meth:`.is_valid` for given value
+        :rtype: function
+        """
+        return Compiler().compile(self)
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression, that checks if value is valid.
+        Used by :class:`~validity.compiler.Compiler` while compiling validator.
+
+        By default simply calls :meth:`.is_valid`. Child classes can override this method
+        for representing validation rule as inline expression.
+
+        :param compiler: compiler instance, used for binding constants
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "{is_valid}({value})".format(is_valid=compiler.bind(self.is_valid), value=value)
+
+    def get_children(self):
+        """
+        Get validators, nested in this validator (like operands of logical operators).
+
+        :return: nested validators
+        :rtype: tuple
+        """
+        return ()
+
+    def replace_children(self, children):
+        """
+        Get copy of validator with other nested validators (see :meth:`.get_children`).
+
+        :param children: new nested validators
+        :type children: tuple
+        :return: validator of same type with given nested validators
+        :rtype: Base
+        """
+        return self
+
+    def get_intervals(self):
+        """
+        Get set of numbers, that are valid for this validator (see :mod:`validity.interval`).
+
+        By default returns None, which means that validator can not be represented as interval set.
+
+        :return: interval set or None
+        :rtype: validity.interval.IntervalSet
+        """
+        return None
+
+    def simplify(self):
+        """
+        Reduce numeric validators (and logical operators of them) to canonical set of disjoint intervals
+        (see :mod:`validity.interval`).
+
+        Example::
+
+            >>> from validity import Or, And, GT, LT, Between, TypeIs
+            >>>
+            >>> print Or(Between(1, 5), Between(4, 9)).simplify()
+            must be between 1 and 9
+            >>> print And(TypeIs(int), GT(5), GT(10), LT(20)).simplify()
+            (must be int) AND (must be in (10, 20))
+
+        Values, that are not numbers, give same results too, if original validator does not compare them
+        with numbers (see :func:`~validity.interval.get_other_result`).
+
+        :return: validator, that gives same results for numbers
+        :rtype: Base
+        """
+        intervals = get_intervals(self)
+        if intervals is not None:
+            return intervals.to_validator(get_other_result(self))
+        children = self.get_children()
+        simplified = tuple(child.simplify() for child in children)
+        if all(child is simplified_child for child, simplified_child in zip(children, simplified)):
+            return self
+        return self.replace_children(simplified)
+
+    def get_negation(self):
+        """
+        Get validator, that gives opposite results for any value, without wrapping this validator with :class:`.Not`
+        (for example ``NotEQ(1)`` for ``EQ(1)``). Used by :meth:`normalize`.
+
+        By default returns None, which means that validator has no such negation.
+
+        :return: negation or None
+        :rtype: Base
+        """
+        return None
+
+    def normalize(self):
+        """
+        Remove redundant levels of nesting, so each value is checked with fewer calls:
+
+            - nested :class:`.Or` and :class:`.And` are flattened (``And(And(a, b), c)`` becomes ``And(a, b, c)``),
+            - repeated operands of :class:`.Or` and :class:`.And` are removed (see :meth:`get_structure`),
+            - double negation is removed (``Not(Not(a))`` becomes ``a``),
+            - :class:`.Not` is moved into operands of :class:`.Or` and :class:`.And` by De Morgan's laws,
+              if each operand has simple negation (see :meth:`get_negation`).
+
+        Operands are checked in same order, so normalized validator gives same results for any value.
+        Flattened operands are checked in same order as nested ones, and :meth:`.Or.optimize_operands` merges
+        only adjacent operands, so normalized validator checks same operands as original one
+        and raises same exceptions.
+
+        Example::
+
+            >>> from validity import Or, And, Not, EQ, NotEQ, GT, LT, TypeIs
+            >>>
+            >>> print And(And(TypeIs(int), GT(0)), LT(10), GT(0)).normalize()
+            (must be int) AND (must be greater than 0) AND (must be less than 10)
+            >>> print Not(Or(EQ(1), Not(TypeIs(int)))).normalize()
+            (must NOT be equal to 1) AND (must be int)
+
+        :return: validator, that gives same results for any value
+        :rtype: Base
+        """
+        children = self.get_children()
+        normalized = tuple(child.normalize() for child in children)
+        if all(child is normalized_child for child, normalized_child in zip(children, normalized)):
+            return self
+        return self.replace_children(normalized)
+
+    def get_structure(self):
+        """
+        Get structure of validator, used for structural comparison (``==``) and hashing (see :mod:`validity.intern`).
+        Validators with equal structures give same results for any value, so one of them can be used instead of other.
+
+        By default returns None, which means that validator is equal only to it self.
+        Structure is used only if class sets :attr:`structural` to True.
+
+        :return: hashable (if operands are hashable) representation of validation rule or None
+        :rtype: tuple
+        """
+        return None
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, Base):
+            return NotImplemented
+        structure = get_structure(self)
+        return structure is not None and structure == get_structure(other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __hash__(self):
+        """
+        Hash of :meth:`.get_structure` (or identity hash, if there is no structure).
+        Validators with unhashable operands have same hash for all instances of class.
+        Hash is cached like condition text (see :meth:`.get_cached_condition_text`).
+        """
+        result = self._get_cached('hash')
+        if result is not _MISSING:
+            return result
+        structure = get_structure(self)
+        if structure is None:
+            result = object.__hash__(self)
+        else:
+            try:
+                result = hash(structure)
+            except TypeError:
+                result = hash(type(self))
+        self._set_cached('hash', result)
+        return result
+
     def get_condition_text(self):
         """
         Get validation condition text representation.
@@ -180,6 +992,42 @@ class Base(object):
         """
         raise NotImplementedError()
 
+    def get_cached_condition_text(self):
+        """
+        Get result of :meth:`.get_condition_text`, that is computed once and cached.
+
+        Cached text is used by :meth:`.get_error`, :meth:`.get_nested_condition`
+        and :meth:`.__str__`, so text of logical operators is built from cached texts of operands.
+        Cached text is dropped when public attribute of this validator or of any nested validator is replaced
+        (in-place changes of mutable operands are not tracked, see :meth:`.invalidate`).
+        New validators, created by :meth:`.or_valid`, :meth:`.and_valid`, :meth:`.invert`, have own cache.
+
+        :return: validation condition text representation
+        :rtype: str
+        """
+        text = self._get_cached('text')
+        if text is _MISSING:
+            text = self.get_condition_text()
+            self._set_cached('text', text)
+        return text
+
+    def get_limited_condition_text(self, max_length):
+        """
+        Get condition text, rendered only as far as it is needed for text of given length
+        (used by :meth:`.Error.get_text` for truncated texts).
+
+        By default returns full text (see :meth:`get_cached_condition_text`).
+        :class:`.Any` and logical operators override this method, so large validators are not rendered
+        for short error texts.
+
+        :param max_length: required length of text
+        :type max_length: int
+        :return: full condition text, or text, that is longer than max_length
+            and starts with same max_length characters as full text
+        :rtype: str
+        """
+        return self.get_cached_condition_text()
+
     def get_nested_condition(self):
         """
         Get validation condition, wrapped with brackets.
@@ -191,18 +1039,18 @@ class Base(object):
         :return: validation condition text representation, wrapped with brackets
         :rtype: str
         """
-        return "({condition_text})".format(condition_text=self.get_condition_text())
+        return "({condition_text})".format(condition_text=self.get_cached_condition_text())
 
     def __str__(self):
         """
         Text representation of class instance
 
-        By default same as :meth:`.get_condition_text`
+        By default same as :meth:`.get_condition_text` (cached, see :meth:`.get_cached_condition_text`)
 
         :return: Text representation of class instance
         :rtype: str
         """
-        return self.get_condition_text()
+        return self.get_cached_condition_text()
 
     def __or__(self, other):
         """
@@ -287,28 +1135,212 @@ class BaseLogicalOperator(Base):
     Must contains {operands} placeholder, if :meth:`get_condition_text` is not implemented in child class.
     """
 
-    operands = None
-    """Operands to work with when :py:meth:`is_valid` called.
-    One or more operands must be given in :py:meth:`__init__`
+    _decisive_result = None
+    """Result of single operand, that decides result of whole logical expression
+    (True for :class:`.Or`, False for :class:`.And`).
+    None means that operator does not support adaptive evaluation order (see :class:`.AdaptiveOrder`).
     """
 
-    def __init__(self, *operands):
+    __slots__ = {
+        'operands': """Operands to work with when :py:meth:`is_valid` called.
+    One or more operands must be given in :py:meth:`__init__`
+    """,
+        'adaptive': """Adaptive evaluation mode, given in :py:meth:`__init__`""",
+        '_evaluated': """Pair of operands, that are really evaluated (see :meth:`optimize_operands`),
+    and :class:`.AdaptiveOrder` in adaptive mode (otherwise None). It is built on first evaluation.""",
+    }
+
+    _transient = Base._transient + ('_evaluated', )
+
+    def __init__(self, *operands, **options):
         """
         logical operator initialization
 
+        Adaptive evaluation mode can be enabled with ``adaptive`` keyword argument
+        for operators, that support it (:class:`.Or`, :class:`.And`).
+        In this mode operands are periodically reordered (see :class:`.AdaptiveOrder`),
+        so cheapest and most decisive operands are checked first.
+        Only evaluation order is changed, condition text keeps original operands order.
+
+        .. warning::
+            Use adaptive mode only for operands without side effects,
+            which do not raise exceptions for checked values (for example, ``And(TypeIs(int), GT(0))``
+            relies on order of operands, as ``GT(0)`` raises `TypeError` for strings on python 3).
 
         :param operands: one or more operand to work with
         :type operands: Base
+        :param adaptive: True or number of evaluations between reorders.
+        :type adaptive: bool or int
         :raises ~exceptions.ValueError: if no operands
         :raises ~exceptions.ValueError: if not all of operands is instances of :class:`.Base`
+        :raises ~exceptions.ValueError: if adaptive mode is not supported by operator
+        :raises ~exceptions.ValueError: if adaptive is not bool or positive integer
+        :raises ~exceptions.TypeError: if unexpected keyword argument given
         """
+        adaptive = options.pop('adaptive', None)
+        if options:
+            raise TypeError("unexpected keyword argument '{name}'".format(name=sorted(options)[0]))
+
         if not len(operands):
             raise ValueError("at least one operand must be specified")
 
         if not all([isinstance(operand, Base) for operand in operands]):
             raise ValueError("all operands must be instances of validity.Base class")
 
-        self.operands = operands
+        if adaptive and self._decisive_result is None:
+            raise ValueError("{name} does not support adaptive mode".format(name=type(self).__name__))
+
+        if not (adaptive is None or isinstance(adaptive, bool) or (isinstance(adaptive, Integral) and adaptive > 0)):
+            raise ValueError("adaptive must be True or positive number of evaluations, not {adaptive!r}".format(
+                adaptive=adaptive))
+
+        # new validator is not registered, so attributes are set without invalidation (see :meth:`~.Base.__setattr__`)
+        _set_attribute(self, 'operands', operands)
+        _set_attribute(self, 'adaptive', adaptive)
+        _set_attribute(self, '_evaluated', None)
+
+    def _prepare_evaluation(self):
+        """
+        Build evaluated operands (see :meth:`optimize_operands`) and adaptive order.
+        They are dropped (with adaptive order statistics), when this validator or it's operands are changed
+        (see :meth:`~.Base.invalidate`).
+
+        :return: pair of evaluated operands and adaptive order (None if mode is not adaptive)
+        :rtype: tuple
+        """
+        self._register()
+        operands = self.optimize_operands()
+        order = None
+        if self.adaptive:
+            order = AdaptiveOrder(len(operands), self._decisive_result,
+                                  AdaptiveOrder.default_period if self.adaptive is True else self.adaptive)
+        evaluated = self._evaluated = (operands, order)
+        return evaluated
+
+    def _reset_cache(self):
+        """
+        Drop evaluated operands too.
+        """
+        self._evaluated = None
+        super(BaseLogicalOperator, self)._reset_cache()
+
+    def optimize_operands(self):
+        """
+        Get operands, that are really evaluated by :meth:`is_valid`.
+        Called on first evaluation and again, when this validator or any of :attr:`operands` was changed after that
+        (see :meth:`~.Base.invalidate`), so evaluated operands follow replaced attributes of :attr:`operands`.
+
+        By default returns :attr:`operands` as is. Child classes can override this method
+        for replacing group of operands with single equivalent operand (see :meth:`.Or.optimize_operands`).
+
+        :return: evaluated operands
+        :rtype: tuple
+        """
+        return self.operands
+
+    def get_children(self):
+        """
+        :return: :attr:`operands`
+        :rtype: tuple
+        """
+        return self.operands
+
+    def replace_children(self, children):
+        """
+        :param children: new operands
+        :type children: tuple
+        :return: logical operator of same type (and same adaptive mode) with given operands
+        :rtype: BaseLogicalOperator
+        """
+        if self.adaptive:
+            return type(self)(*children, adaptive=self.adaptive)
+        return type(self)(*children)
+
+    def get_structure(self):
+        """
+        Logical operators are equal, if they have same type, same adaptive mode and equal :attr:`operands`.
+
+        :return: (type, adaptive, operands)
+        :rtype: tuple
+        """
+        return (type(self), self.adaptive, self.operands)
+
+    def simplify(self):
+        """
+        Operands of :class:`.Or` and :class:`.And`, that can be represented as interval sets,
+        are merged into single validator, placed instead of first of them.
+        Operands are not merged, if merged validator would compare values, that are not numbers,
+        with numbers before other operands, that are checked before it in original validator.
+
+        :return: simplified validator
+        :rtype: Base
+        """
+        simplified = super(BaseLogicalOperator, self).simplify()
+        decisive = self._decisive_result
+        if decisive is None or not isinstance(simplified, BaseLogicalOperator):
+            return simplified
+
+        operands = []
+        merged = None
+        merged_index = None
+        other = not decisive  # result of merged operands for values, that are not numbers
+        resolved = False
+        skipped = False
+        for operand in simplified.operands:
+            intervals = get_intervals(operand)
+            if intervals is None:
+                skipped = skipped or merged is not None
+                operands.append(operand)
+                continue
+            if not resolved:
+                result = get_other_result(operand)
+                if result is None or result is decisive:
+                    if result is None and skipped:
+                        return simplified
+                    other, resolved = result, True
+            if merged is None:
+                merged = intervals
+                merged_index = len(operands)
+                operands.append(operand)
+            else:
+                merged = merged.union(intervals) if decisive else merged.intersection(intervals)
+        if merged is None:
+            return simplified
+        if other is decisive and (merged.is_everything() if decisive else merged.is_empty()):
+            return merged.to_validator(other)
+        operands[merged_index] = merged.to_validator(other)
+        if len(operands) == 1:
+            return operands[0]
+        return simplified.replace_children(tuple(operands))
+
+    def normalize(self):
+        """
+        Operands of :class:`.Or` and :class:`.And` are normalized and joined with :func:`join_normalized`
+        (other operators, including child classes of :class:`.Or` and :class:`.And`, only normalize operands).
+
+        :return: normalized validator
+        :rtype: Base
+        """
+        if type(self) not in (Or, And):  # pylint: disable=unidiomatic-typecheck
+            return super(BaseLogicalOperator, self).normalize()
+        result = join_normalized(type(self), tuple(operand.normalize() for operand in self.operands), self.adaptive)
+        if type(result) is type(self) and len(result.operands) == len(self.operands) \
+                and all(operand is other for operand, other in zip(result.operands, self.operands)):
+            return self
+        return result
+
+    def get_ordered_operands(self):
+        """
+        Get evaluated operands (see :meth:`optimize_operands`) in order of evaluation.
+        Order differs from :attr:`operands` only in adaptive mode (see :meth:`__init__`).
+
+        :return: operands in evaluation order
+        :rtype: tuple
+        """
+        operands, order = self._evaluated or self._prepare_evaluation()
+        if order is None:
+            return operands
+        return tuple(operands[index] for index in order.order)
 
     def is_valid(self, value):
         """
@@ -348,6 +1380,133 @@ class BaseLogicalOperator(Base):
         """
         return ", ".join([str(operand) for operand in self.operands])
 
+    def _get_limited_operands_text(self, separator, max_length):
+        """
+        Join nested conditions of :attr:`operands` with separator, until text is longer than max_length
+        (see :meth:`~.Base.get_limited_condition_text`).
+
+        :param separator: separator of operands, like ``" OR "``
+        :type separator: str
+        :param max_length: required length of text
+        :type max_length: int
+        :return: text of operands
+        :rtype: str
+        """
+        parts = []
+        length = 0
+        for operand in self.operands:
+            if parts:
+                if length > max_length:
+                    break
+                length += len(separator)
+            if type(operand).get_nested_condition == Base.get_nested_condition:
+                text = "({text})".format(text=operand.get_limited_condition_text(max_length - length))
+            else:
+                text = operand.get_nested_condition()
+            parts.append(text)
+            length += len(text)
+        return separator.join(parts)
+
+
+class AdaptiveOrder(object):
+    """
+    Operands evaluation order of :class:`.Or` and :class:`.And` in adaptive mode.
+
+    Statistics is recorded only for each :attr:`sample_period`-th evaluation (other evaluations
+    just check operands in current order, without timer calls): for each operand it records count of calls,
+    count of *decisive* results (True for :class:`.Or`, False for :class:`.And`) and cumulative evaluation time.
+    Each :attr:`period` evaluations operands are sorted by expected cost of decision
+    (average cost divided by rate of decisive results), and collected statistics is halved,
+    so order follows changes of checked values.
+    Operands, that were never evaluated, are moved to the beginning to be measured.
+    """
+
+    __slots__ = ('decisive_result', 'period', 'sample_period', 'order', 'calls', 'decisions', 'cost', 'evaluations')
+
+    default_period = 1000
+    """number of evaluations between reorders, used if ``adaptive=True``"""
+
+    default_sample_period = 8
+    """each N-th evaluation is measured (first evaluation after reorder is always measured)"""
+
+    def __init__(self, size, decisive_result, period, sample_period=None):
+        """
+        :param size: number of operands
+        :type size: int
+        :param decisive_result: result of operand, that decides result of logical expression
+        :type decisive_result: bool
+        :param period: number of evaluations between reorders
+        :type period: int
+        :param sample_period: each N-th evaluation is measured (:attr:`default_sample_period` if None)
+        :type sample_period: int
+        """
+        self.decisive_result = decisive_result
+        self.period = period
+        self.sample_period = self.default_sample_period if sample_period is None else sample_period
+        self.order = tuple(range(size))
+        self.calls = [0] * size
+        self.decisions = [0] * size
+        self.cost = [0.0] * size
+        self.evaluations = 0
+
+    def evaluate(self, operands, value):
+        """
+        Check value with operands in current order, until decisive result is got.
+
+        :param operands: operands of logical operator
+        :type operands: tuple
+        :param value: value for check
+        :return: decisive result, if any operand returned it, otherwise inverted decisive result
+        :rtype: bool
+        """
+        decisive_result = self.decisive_result
+        result = not decisive_result
+        if self.evaluations % self.sample_period:
+            for index in self.order:
+                if bool(operands[index].is_valid(value)) is decisive_result:
+                    result = decisive_result
+                    break
+        else:
+            calls, decisions, cost = self.calls, self.decisions, self.cost
+            for index in self.order:
+                start = _timer()
+                operand_result = operands[index].is_valid(value)
+                cost[index] += _timer() - start
+                calls[index] += 1
+                if bool(operand_result) is decisive_result:
+                    decisions[index] += 1
+                    result = decisive_result
+                    break
+        self.evaluations += 1
+        if self.evaluations >= self.period:
+            self.reorder()
+        return result
+
+    def get_score(self, index):
+        """
+        Get expected cost of decision for operand.
+
+        :param index: operand index
+        :type index: int
+        :return: average evaluation time divided by rate of decisive results
+        :rtype: float
+        """
+        if not self.calls[index]:
+            return 0.0
+        if not self.decisions[index]:
+            return float('inf')
+        return self.cost[index] / self.decisions[index]
+
+    def reorder(self):
+        """
+        Sort operands by :meth:`get_score` and halve collected statistics.
+        """
+        self.order = tuple(sorted(self.order, key=self.get_score))
+        self.calls = [calls // 2 for calls in self.calls]
+        self.decisions = [decisions // 2 for decisions in self.decisions]
+        self.cost = [cost / 2 for cost in self.cost]
+        self.evaluations = 0
+
 
 class Or(BaseLogicalOperator):
     """
@@ -379,9 +1538,19 @@ class Or(BaseLogicalOperator):
         True
 
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "{operands}"
     """Condition template, used for creating text representation (see :meth:`~.BaseLogicalOperator.get_condition_text`)"""
 
+    _decisive_result = True
+
+    merge_threshold = 4
+    """Minimal number of adjacent equality, membership or type checks, that are merged (see :meth:`optimize_operands`)"""
+
     def is_valid(self, value):
         """
         Check if any of :attr:`operands` is valid for given value.
@@ -395,7 +1564,10 @@ class Or(BaseLogicalOperator):
         :rtype: bool
         """
         # return any([operand.is_valid(value) for operand in self.operands])
-        for operand in self.operands:
+        operands, order = self._evaluated or self._prepare_evaluation()
+        if order is not None:
+            return order.evaluate(operands, value)
+        for operand in operands:
             if operand.is_valid(value):
                 return True
         return False
@@ -412,7 +1584,116 @@ class Or(BaseLogicalOperator):
         """
         if not len(validators):
             raise ValueError("at least one operand must be specified")
-        return Or(*(self.operands + validators))
+        return Or(*(self.operands + validators), adaptive=self.adaptive)
+
+    def optimize_operands(self):
+        """
+        Runs of adjacent equality checks (:class:`.EQ`) and membership checks (:class:`.Any`) are merged
+        into single :class:`.Any`, so ``Or(EQ(1), EQ(2), EQ(3), EQ(4))`` is checked with one indexed lookup
+        (see :class:`.MembershipIndex`).
+        Runs of adjacent type checks (:class:`.TypeIs` with same ``subclasses`` mode) are merged into single
+        :class:`.TypeIs` in same way (see :class:`.TypeIndex`).
+        Only runs of at least :attr:`merge_threshold` operands are merged, as short runs are checked faster as is.
+        Merged operands are checked in place of the run, so other operands are checked in original order.
+
+        :return: evaluated operands
+        :rtype: tuple
+        """
+        from validity.comparator import EQ, Any, TypeIs  # pylint: disable=cyclic-import
+
+        threshold = self.merge_threshold
+        operands = []
+        run = []
+        run_key = None
+        for operand in self.operands + (None, ):
+            operand_type = type(operand)
+            if operand_type is EQ or operand_type is Any:
+                key = Any
+            elif operand_type is TypeIs:
+                key = (TypeIs, operand.subclasses)
+            else:
+                key = None
+            if run and key != run_key:
+                if len(run) < threshold:
+                    operands.extend(run)
+                elif run_key is Any:
+                    allowed_values = []
+                    for item in run:
+                        if type(item) is EQ:  # pylint: disable=unidiomatic-typecheck
+                            allowed_values.append(item.operand)
+                        else:
+                            allowed_values.extend(item.operand)
+                    operands.append(Any(allowed_values))
+                else:
+                    operands.append(TypeIs(*[required_type for item in run for required_type in item.get_types()],
+                                           subclasses=run_key[1]))
+                run = []
+            if key is None:
+                if operand is not None:
+                    operands.append(operand)
+            else:
+                run.append(operand)
+                run_key = key
+        if len(operands) == len(self.operands):
+            return self.operands
+        return tuple(operands)
+
+    def get_reasons(self, value):
+        """
+        Check :attr:`operands` in order, until one of them is valid, which is explained by it's reasons.
+        If no operand is valid, result is explained by reasons of all operands.
+
+        :param value: value for check
+        :return: (result, reasons)
+        :rtype: tuple
+        """
+        return _get_decisive_reasons(self, value)
+
+    def get_intervals(self):
+        """
+        :return: union of operands interval sets, if all of them can be represented as interval sets
+        :rtype: validity.interval.IntervalSet
+        """
+        result = None
+        for operand in self.operands:
+            intervals = get_intervals(operand)
+            if intervals is None:
+                return None
+            result = intervals if result is None else result.union(intervals)
+        return result
+
+    def get_mask(self, values):
+        """
+        Combine masks of operands with ``|``.
+        Each next operand checks only elements, that are not valid yet.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        operands = self.get_ordered_operands()
+        mask = operand_mask(operands[0], values)
+        for operand in operands[1:]:
+            rest = ~mask
+            if not rest.any():
+                break
+            mask[rest] = operand_mask(operand, values[rest])
+        return mask
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression, where operands are joined with ``or``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "(True if ({operands}) else False)".format(
+            operands=" or ".join(compiler.expression(operand, value) for operand in self.get_ordered_operands()))
 
     def get_operands_text(self):
         """
@@ -424,6 +1705,22 @@ class Or(BaseLogicalOperator):
         """
         return " OR ".join([operand.get_nested_condition() for operand in self.operands])
 
+    def get_limited_condition_text(self, max_length):
+        """
+        Nested conditions of operands are rendered, until text is longer than max_length
+        (see :meth:`~.Base.get_limited_condition_text`).
+
+        :param max_length: required length of text
+        :type max_length: int
+        :return: condition text, that is longer than max_length, or full condition text
+        :rtype: str
+        """
+        if self._get_cached('text') is not _MISSING \
+                or type(self).get_condition_text != BaseLogicalOperator.get_condition_text \
+                or type(self).get_operands_text != Or.get_operands_text:
+            return self.get_cached_condition_text()
+        return self._condition_template.format(operands=self._get_limited_operands_text(" OR ", max_length))
+
 
 class And(BaseLogicalOperator):
     """
@@ -456,14 +1753,22 @@ class And(BaseLogicalOperator):
         True
 
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "{operands}"
     """Condition template, used for creating text representation (see :meth:`~.BaseLogicalOperator.get_condition_text`)"""
 
+    _decisive_result = False
+
     def is_valid(self, value):
         """
         Check if all of :attr:`operands` is valid for given value.
-        Simply executes is_valid method in each of :attr:`operands` with given value
-        and returns True if all of :attr:`operands` is_valid method returned True
+        Executes is_valid method in each of :attr:`operands` with given value
+        and returns True if all of :attr:`operands` is_valid method returned True.
+        Evaluation stops at first operand, that returned False.
 
         :param value: value for check
         :type value:
@@ -471,7 +1776,70 @@ class And(BaseLogicalOperator):
             other wise returns False
         :rtype: bool
         """
-        return all([operand.is_valid(value) for operand in self.operands])
+        # return all([operand.is_valid(value) for operand in self.operands])
+        operands, order = self._evaluated or self._prepare_evaluation()
+        if order is not None:
+            return order.evaluate(operands, value)
+        for operand in operands:
+            if not operand.is_valid(value):
+                return False
+        return True
+
+    def get_reasons(self, value):
+        """
+        Check :attr:`operands` in order, until one of them is not valid, which is explained by it's reasons.
+        If all operands are valid, result is explained by reasons of all operands.
+
+        :param value: value for check
+        :return: (result, reasons)
+        :rtype: tuple
+        """
+        return _get_decisive_reasons(self, value)
+
+    def get_intervals(self):
+        """
+        :return: intersection of operands interval sets, if all of them can be represented as interval sets
+        :rtype: validity.interval.IntervalSet
+        """
+        result = None
+        for operand in self.operands:
+            intervals = get_intervals(operand)
+            if intervals is None:
+                return None
+            result = intervals if result is None else result.intersection(intervals)
+        return result
+
+    def get_mask(self, values):
+        """
+        Combine masks of operands with ``&``.
+        Each next operand checks only elements, that are still valid.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        operands = self.get_ordered_operands()
+        mask = operand_mask(operands[0], values)
+        for operand in operands[1:]:
+            if not mask.any():
+                break
+            mask[mask] = operand_mask(operand, values[mask])
+        return mask
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression, where operands are joined with ``and``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "(True if ({operands}) else False)".format(
+            operands=" and ".join(compiler.expression(operand, value) for operand in self.get_ordered_operands()))
 
     def get_operands_text(self):
         """
@@ -483,6 +1851,22 @@ class And(BaseLogicalOperator):
         """
         return " AND ".join([operand.get_nested_condition() for operand in self.operands])
 
+    def get_limited_condition_text(self, max_length):
+        """
+        Nested conditions of operands are rendered, until text is longer than max_length
+        (see :meth:`~.Base.get_limited_condition_text`).
+
+        :param max_length: required length of text
+        :type max_length: int
+        :return: condition text, that is longer than max_length, or full condition text
+        :rtype: str
+        """
+        if self._get_cached('text') is not _MISSING \
+                or type(self).get_condition_text != BaseLogicalOperator.get_condition_text \
+                or type(self).get_operands_text != And.get_operands_text:
+            return self.get_cached_condition_text()
+        return self._condition_template.format(operands=self._get_limited_operands_text(" AND ", max_length))
+
     def and_valid(self, *validators):
         """
         And class overrides :meth:`Base.and_valid` method to prevent unnecessary nested conditions if called in instance of And class.
@@ -495,13 +1879,18 @@ class And(BaseLogicalOperator):
         """
         if not len(validators):
             raise ValueError("at least one operand must be specified")
-        return And(*(self.operands + validators))
+        return And(*(self.operands + validators), adaptive=self.adaptive)
 
 
 class Not(BaseLogicalOperator):
     """
     Logical Not
     """
+
+    structural = True
+
+    __slots__ = ()
+
     _condition_template = "NOT({operands})"
     """Condition template, used for creating text representation (see :meth:`~.BaseLogicalOperator.get_condition_text`)"""
 
@@ -526,13 +1915,84 @@ class Not(BaseLogicalOperator):
         """
         return not self.operands[0].is_valid(value)
 
+    def get_intervals(self):
+        """
+        :return: complement of operand interval set, if operand can be represented as interval set
+        :rtype: validity.interval.IntervalSet
+        """
+        intervals = get_intervals(self.operands[0])
+        return None if intervals is None else intervals.complement()
+
+    def get_negation(self):
+        """
+        :return: operand
+        :rtype: Base
+        """
+        return self.operands[0]
+
+    def get_reasons(self, value):
+        """
+        :param value: value for check
+        :return: inverted result of operand and it's reasons, negated
+        :rtype: tuple
+        """
+        result, reasons = get_reasons(self.operands[0], value)
+        return not result, [(validator, not negated) for validator, negated in reasons]
+
+    def normalize(self):
+        """
+        Remove double negation and apply De Morgan's laws (``Not(Or(a, b))`` becomes ``And(~a, ~b)``),
+        if operand, or each operand of :class:`.Or` or :class:`.And`, has simple negation (see :func:`get_negation`).
+
+        :return: normalized validator
+        :rtype: Base
+        """
+        if type(self) is not Not:  # pylint: disable=unidiomatic-typecheck
+            return super(Not, self).normalize()
+        operand = self.operands[0].normalize()
+        negation = get_negation(operand)
+        if negation is not None:
+            return negation
+        # pylint: disable=unidiomatic-typecheck
+        if type(operand) in (Or, And) and not operand.adaptive:
+            negations = tuple(get_negation(item) for item in operand.operands)
+            if all(item is not None for item in negations):
+                return join_normalized(And if type(operand) is Or else Or, negations)
+        if operand is self.operands[0]:
+            return self
+        return Not(operand)
+
+    def get_mask(self, values):
+        """
+        Invert mask of operand with ``~``.
+
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: boolean mask
+        :rtype: numpy.ndarray
+        """
+        return ~operand_mask(self.operands[0], values)
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Get python expression, where operand is negated with ``not``.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        return "(not {operand})".format(operand=compiler.expression(self.operands[0], value))
+
     def get_nested_condition(self):
         """
         As only one operand can be passed to Not logical operator, there is no reason to wrap it with brackets.
         :return: string representation
         :rtype: str
         """
-        return self.get_condition_text()
+        return self.get_cached_condition_text()
 
     def get_operands_text(self):
         """
@@ -541,3 +2001,16 @@ class Not(BaseLogicalOperator):
         :rtype: str
         """
         return str(self.operands[0])
+
+    def get_limited_condition_text(self, max_length):
+        """
+        :param max_length: required length of text (see :meth:`~.Base.get_limited_condition_text`)
+        :type max_length: int
+        :return: condition text with limited text of operand
+        :rtype: str
+        """
+        if self._get_cached('text') is not _MISSING \
+                or type(self).get_condition_text != BaseLogicalOperator.get_condition_text \
+                or type(self).get_operands_text != Not.get_operands_text:
+            return self.get_cached_condition_text()
+        return self._condition_template.format(operands=self.operands[0].get_limited_condition_text(max_length))
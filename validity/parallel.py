@@ -0,0 +1,193 @@
+"""
+
+Multi-process validation of large batches of values.
+
+Validation of values is CPU-bound, so :meth:`~.Base.filter_values_parallel` and :meth:`~.Base.partition_parallel`
+split values to chunks and check them in pool of processes::
+
+    >>> from validity import And, TypeIs, Between
+    >>>
+    >>> test = And(TypeIs(int), Between(10, 20))
+    >>> valid, not_valid = test.filter_values_parallel(range(0, 100000), workers=4, chunksize=10000)
+    >>> valid
+    [10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20]
+    >>> len(not_valid)
+    99989
+
+Validator is pickled once and sent to each worker process while it's start,
+chunks of values are sent to workers and results are returned in order of values.
+:meth:`~.Base.iter_partition_parallel` yields results while values are read, only few chunks for each worker
+are read ahead, so any iterable (generator, file, socket reader) can be checked with bounded memory.
+
+Built-in validators are pickled without cached data (condition texts, indexes, cached results),
+which is rebuilt after unpickling, and without attributes, that are None. Custom validators must be picklable
+(for example, their classes must be defined on module level).
+
+"""
+
+import pickle
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool, cpu_count
+
+__docformat__ = 'reStructuredText'
+
+
+_WORKER_VALIDATOR = [None]
+
+
+def _init_worker(payload):
+    """
+    Unpickle validator in worker process.
+
+    :param payload: pickled validator
+    :type payload: bytes
+    """
+    _WORKER_VALIDATOR[0] = pickle.loads(payload)
+
+
+def _check_chunk(values):
+    """
+    Check chunk of values with validator of worker process.
+
+    :param values: values for check
+    :type values: list
+    :return: results of :meth:`~.Base.is_valid` (one byte for each value)
+    :rtype: bytes
+    """
+    is_valid = _WORKER_VALIDATOR[0].is_valid
+    return bytes(bytearray(1 if is_valid(value) else 0 for value in values))
+
+
+def iter_chunks(iterable, chunksize):
+    """
+    Split iterable to lists of given size (last list can be shorter).
+
+    :param iterable: any iterable
+    :param chunksize: size of chunk
+    :type chunksize: int
+    :return: iterator of lists
+    :raises ~exceptions.ValueError: if chunksize is not positive
+    """
+    if chunksize <= 0:  # checked on call, not on first iteration
+        raise ValueError("chunksize must be positive")
+    return _iter_chunks(iter(iterable), chunksize)
+
+
+def _iter_chunks(iterator, chunksize):
+    """
+    :param iterator: any iterator
+    :param chunksize: size of chunk
+    :type chunksize: int
+    :return: generator of lists (see :func:`iter_chunks`)
+    """
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_partition_parallel(validator, iterable, workers=None, chunksize=1000, prefetch=2):
+    """
+    Lazily check values in pool of processes (see :meth:`~.Base.iter_partition_parallel`).
+    Chunks are sent to workers, while results of previous chunks are yielded, at most ``prefetch`` chunks
+    for each worker are waiting for results, so values are read from iterable only as fast as they are checked.
+
+    Pool of processes is terminated, when all values are checked or generator is closed.
+
+    :param validator: validator to check values with
+    :type validator: Base
+    :param iterable: values for check
+    :param workers: count of processes (``os.cpu_count()`` if None). If it is 1, values are checked in current process.
+    :type workers: int
+    :param chunksize: count of values, sent to worker at once
+    :type chunksize: int
+    :param prefetch: count of chunks for each worker, that are sent before results are received
+    :type prefetch: int
+    :return: generator of pairs (value, result of :meth:`~.Base.is_valid`) in order of values
+    :rtype: generator
+    :raises ~exceptions.ValueError: if chunksize or prefetch is not positive
+    """
+    # arguments are checked on call, before pool of processes is started by generator
+    if prefetch <= 0:
+        raise ValueError("prefetch must be positive")
+    return _iter_partition_parallel(validator, iter_chunks(iterable, chunksize), workers, prefetch)
+
+
+def _iter_partition_parallel(validator, chunks, workers, prefetch):
+    """
+    :param validator: validator to check values with
+    :type validator: Base
+    :param chunks: iterator of lists of values
+    :param workers: count of processes
+    :type workers: int
+    :param prefetch: count of chunks for each worker, that are sent before results are received
+    :type prefetch: int
+    :return: generator of pairs (see :func:`iter_partition_parallel`)
+    :rtype: generator
+    """
+    if workers == 1:
+        is_valid = validator.is_valid
+        for chunk in chunks:
+            for value in chunk:
+                yield value, bool(is_valid(value))
+        return
+
+    payload = pickle.dumps(validator, pickle.HIGHEST_PROTOCOL)
+    pool = Pool(workers, initializer=_init_worker, initargs=(payload, ))
+    try:
+        limit = (workers or cpu_count()) * prefetch
+        waiting = deque()
+        for chunk in chunks:
+            waiting.append((chunk, pool.apply_async(_check_chunk, (chunk, ))))
+            if len(waiting) >= limit:
+                chunk, results = waiting.popleft()
+                for pair in zip(chunk, (bool(item) for item in bytearray(results.get()))):
+                    yield pair
+        while waiting:
+            chunk, results = waiting.popleft()
+            for pair in zip(chunk, (bool(item) for item in bytearray(results.get()))):
+                yield pair
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def partition_parallel(validator, iterable, workers=None, chunksize=1000):
+    """
+    Check values in pool of processes (see :meth:`~.Base.partition_parallel`).
+
+    :param validator: validator to check values with
+    :type validator: Base
+    :param iterable: values for check
+    :param workers: count of processes (``os.cpu_count()`` if None). If it is 1, values are checked in current process.
+    :type workers: int
+    :param chunksize: count of values, sent to worker at once
+    :type chunksize: int
+    :return: list of pairs (value, result of :meth:`~.Base.is_valid`) in order of values
+    :rtype: list
+    :raises ~exceptions.ValueError: if chunksize is not positive
+    """
+    return list(iter_partition_parallel(validator, iterable, workers, chunksize))
+
+
+def filter_values_parallel(validator, iterable, workers=None, chunksize=1000):
+    """
+    Split values to valid and not valid in pool of processes (see :meth:`~.Base.filter_values_parallel`).
+
+    :param validator: validator to check values with
+    :type validator: Base
+    :param iterable: values for check
+    :param workers: count of processes (``os.cpu_count()`` if None). If it is 1, values are checked in current process.
+    :type workers: int
+    :param chunksize: count of values, sent to worker at once
+    :type chunksize: int
+    :return: (valid, not_valid) lists in order of values
+    :rtype: tuple
+    :raises ~exceptions.ValueError: if chunksize is not positive
+    """
+    valid, not_valid = [], []
+    for value, is_valid in iter_partition_parallel(validator, iterable, workers, chunksize):
+        (valid if is_valid else not_valid).append(value)
+    return valid, not_valid
@@ -0,0 +1,272 @@
+"""
+
+Profiling of *validators*.
+
+:func:`.profile` context manager records, for each validator, count of :meth:`~.Base.is_valid` calls,
+count of valid and not valid results and time of checks, so hot part of slow rule can be found::
+
+    >>> from validity import profile, And, Or, TypeIs, Between, Any, Len, LT
+    >>>
+    >>> rule = And(TypeIs(str), Len(LT(10)), Or(Any('a', 'b'), Between('x', 'z')))
+    >>> with profile() as report:
+    ...     valid, not_valid = rule.filter_values(*['a', 'c', 'y', 1, 'long string'])
+    ...
+    >>> for stats in report.get_stats(sort_by='calls')[:4]:
+    ...     print stats.calls, stats.passed, stats.failed, stats.text
+    5 4 1 must be str
+    5 2 3 (must be str) AND (length must be less than 10) AND ((must be any of (a, b)) OR (must be between x and z))
+    4 3 1 must be less than 10
+    4 3 1 length must be less than 10
+    >>> print report.format(limit=2)  # doctest: +SKIP
+         calls     passed     failed     errors     total, s      self, s  condition
+             5          2          3          0     0.000080     0.000041  (must be str) AND (length must be less than 10) AND ((mus...
+             3          2          1          0     0.000021     0.000012  (must be any of (a, b)) OR (must be between x and z)
+
+While profiling is active, :meth:`~.Base.is_valid` methods of all validator classes are replaced with wrappers,
+which record calls. Original methods are restored on exit, so there is no overhead when profiling is off.
+
+Validators are profiled as they are written: while profiling is active, operands of logical operators
+are not merged (see :meth:`.Or.optimize_operands`), so each of them is recorded by it's own condition text.
+Evaluated operands of profiled operators are rebuilt (and merged again) on first check after profiling.
+
+Statistics are grouped by condition text (see :meth:`~.Base.get_cached_condition_text`),
+so same conditions in different parts of tree are reported together (see :attr:`.NodeStats.nodes`).
+
+.. note::
+    Only classes, that are defined before profiling is started, are profiled.
+    Compiled validators (see :meth:`~.Base.compile`) are profiled only by nodes, that are not inlined
+    (and validators, compiled while profiling is active, keep recording wrappers of such nodes).
+    Profile validators in single thread, calls from other threads are recorded too, but their time is not reliable.
+
+"""
+
+from functools import wraps
+from threading import Lock
+
+from validity.logical_operator import _timer, Base, BaseLogicalOperator
+
+__docformat__ = 'reStructuredText'
+
+
+_ACTIVE = [None]
+_LOCK = Lock()
+
+
+def _subclasses(klass):
+    """
+    :return: klass and all of it's subclasses, that are defined now
+    :rtype: list
+    """
+    result = [klass]
+    index = 0
+    while index < len(result):
+        for child in result[index].__subclasses__():
+            if child not in result:
+                result.append(child)
+        index += 1
+    return result
+
+
+class NodeStats(object):
+    """
+    Statistics of validators with same condition text (see :meth:`.Profile.get_stats`).
+    """
+
+    __slots__ = {
+        'text': "condition text of validators",
+        'nodes': "count of validators with this condition text",
+        'calls': "count of :meth:`~.Base.is_valid` calls",
+        'passed': "count of valid results",
+        'failed': "count of not valid results",
+        'errors': "count of raised exceptions",
+        'total_time': "time of calls, including nested validators, in seconds",
+        'self_time': "time of calls, excluding nested validators, in seconds",
+    }
+
+    def __init__(self, text):
+        """
+        :param text: condition text
+        :type text: str
+        """
+        self.text = text
+        self.nodes = 0
+        self.calls = 0
+        self.passed = 0
+        self.failed = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.self_time = 0.0
+
+    def __repr__(self):
+        return "NodeStats({text!r}, calls={calls}, passed={passed}, failed={failed}, errors={errors}, " \
+               "total_time={total_time:.6f}, self_time={self_time:.6f})".format(
+                   text=self.text, calls=self.calls, passed=self.passed, failed=self.failed, errors=self.errors,
+                   total_time=self.total_time, self_time=self.self_time)
+
+
+class Profile(object):
+    """
+    Profiling session (see :func:`.profile`).
+    Statistics are recorded between :meth:`start` and :meth:`stop`, session can be used as context manager.
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._stack = []
+        self._patched = []
+        self._operators = {}
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """
+        Replace :meth:`~.Base.is_valid` of all validator classes with recording wrappers
+        and disable merging of operands of logical operators (see :meth:`.BaseLogicalOperator.optimize_operands`).
+
+        :raises ~exceptions.RuntimeError: if other profiling session is active
+        """
+        with _LOCK:
+            if _ACTIVE[0] is not None:
+                raise RuntimeError("profiling is already active")
+            _ACTIVE[0] = self
+            for klass in _subclasses(Base):
+                method = klass.__dict__.get('is_valid')
+                if method is not None:
+                    self._patched.append((klass, 'is_valid', method))
+                    setattr(klass, 'is_valid', self._wrap(method))
+            for klass in _subclasses(BaseLogicalOperator)[1:]:
+                method = klass.__dict__.get('optimize_operands')
+                if method is not None:
+                    self._patched.append((klass, 'optimize_operands', method))
+                    setattr(klass, 'optimize_operands', BaseLogicalOperator.__dict__['optimize_operands'])
+
+    def stop(self):
+        """
+        Restore original methods.
+        Evaluated operands of profiled logical operators are dropped, so they are merged again on next check.
+        """
+        with _LOCK:
+            if _ACTIVE[0] is not self:
+                return
+            for klass, name, method in reversed(self._patched):
+                setattr(klass, name, method)
+            self._patched = []
+            for operator in self._operators.values():
+                operator._evaluated = None  # pylint: disable=protected-access
+            self._operators.clear()
+            _ACTIVE[0] = None
+
+    def _wrap(self, method):
+        """
+        :param method: original is_valid function
+        :type method: function
+        :return: is_valid function, that records calls
+        :rtype: function
+        """
+        records = self._records
+        stack = self._stack
+        operators = self._operators
+
+        @wraps(method)
+        def is_valid(validator, value):
+            if stack and stack[-1][0] is validator:
+                # is_valid of parent class, called with super()
+                return method(validator, value)
+            if isinstance(validator, BaseLogicalOperator) and id(validator) not in operators:
+                # operands, merged before profiling, are rebuilt as written
+                operators[id(validator)] = validator
+                validator._evaluated = None  # pylint: disable=protected-access
+            frame = [validator, 0.0]
+            stack.append(frame)
+            outcome = 2
+            start = _timer()
+            try:
+                result = method(validator, value)
+                outcome = 0 if result else 1
+                return result
+            finally:
+                elapsed = _timer() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                record = records.get(id(validator))
+                if record is None:
+                    record = records[id(validator)] = [validator, 0, [0, 0, 0], 0.0, 0.0]
+                record[1] += 1
+                record[2][outcome] += 1
+                record[3] += elapsed
+                record[4] += elapsed - frame[1]
+        return is_valid
+
+    def get_stats(self, sort_by='self_time'):
+        """
+        Get statistics, grouped by condition text.
+
+        :param sort_by: attribute of :class:`.NodeStats` to sort by (in descending order)
+        :type sort_by: str
+        :return: list of statistics
+        :rtype: list
+        """
+        stats = {}
+        for validator, calls, (passed, failed, errors), total_time, self_time in self._records.values():
+            text = validator.get_cached_condition_text()
+            item = stats.get(text)
+            if item is None:
+                item = stats[text] = NodeStats(text)
+            item.nodes += 1
+            item.calls += calls
+            item.passed += passed
+            item.failed += failed
+            item.errors += errors
+            item.total_time += total_time
+            item.self_time += self_time
+        return sorted(stats.values(), key=lambda item: getattr(item, sort_by), reverse=True)
+
+    def get_report(self):
+        """
+        :return: statistics by condition text
+        :rtype: dict
+        """
+        return dict((item.text, item) for item in self.get_stats())
+
+    def format(self, limit=None, sort_by='self_time', text_length=60):
+        """
+        Format statistics as text table.
+
+        :param limit: maximum count of rows
+        :type limit: int
+        :param sort_by: attribute of :class:`.NodeStats` to sort by (in descending order)
+        :type sort_by: str
+        :param text_length: maximum length of condition text in row
+        :type text_length: int
+        :return: table
+        :rtype: str
+        """
+        rows = ["{0:>10} {1:>10} {2:>10} {3:>10} {4:>12} {5:>12}  {6}".format(
+            'calls', 'passed', 'failed', 'errors', 'total, s', 'self, s', 'condition')]
+        for item in self.get_stats(sort_by)[:limit]:
+            text = item.text if len(item.text) <= text_length else item.text[:text_length - 3] + '...'
+            rows.append("{0:>10} {1:>10} {2:>10} {3:>10} {4:>12.6f} {5:>12.6f}  {6}".format(
+                item.calls, item.passed, item.failed, item.errors, item.total_time, item.self_time, text))
+        return '\n'.join(rows)
+
+    def clear(self):
+        """
+        Remove recorded statistics.
+        """
+        self._records.clear()
+
+
+def profile():
+    """
+    Create profiling session, which is started by ``with`` statement (see :mod:`validity.profiling`).
+
+    :return: profiling session
+    :rtype: Profile
+    """
+    return Profile()
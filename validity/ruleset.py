@@ -0,0 +1,309 @@
+"""
+
+Matching of one value against many named *validators*.
+
+:class:`.RuleSet` answers "which rules does this value satisfy?" without calling
+:meth:`~.Base.is_valid` of each rule. Rules are indexed by their leaves:
+
+    - :class:`.EQ` and :class:`.Any` - in hash table of allowed values,
+    - numeric validators (see :mod:`validity.interval`) - in interval tree,
+    - :class:`.TypeIs` - in map of types,
+    - other rules are checked for each value.
+
+Rule, that is :class:`.Or` of indexed validators, is indexed by each of them.
+Rule, that is :class:`.And`, is indexed by one of it's operands (hash table is preferred),
+so index gives candidates, that are checked with :meth:`~.Base.is_valid`::
+
+    >>> from validity import RuleSet, And, Or, EQ, Any, GT, LT, Between, TypeIs, Len
+    >>>
+    >>> rules = RuleSet()
+    >>> rules.add('answer', EQ(42))
+    >>> rules.add('small', And(TypeIs(int), Between(0, 9)))
+    >>> rules.add('big or negative', Or(GT(100), LT(0)))
+    >>> rules.add('short', Len(LT(3)))
+    >>> rules.match(42)
+    ['answer']
+    >>> rules.match(5)
+    ['small']
+    >>> rules.match(-5.5)
+    ['big or negative']
+    >>> rules.match('ab')
+    ['short']
+
+.. note::
+    Unlike :meth:`~.Base.is_valid`, :meth:`.RuleSet.match` does not raise `TypeError`, if rule can not
+    compare value (like ``GT(5)`` for strings on python 3), such rule is considered as not matching.
+    Rules, resolved by index, are not called at all, so for them comparison with value of other type
+    is just not valid (for example ``Or(GT(5), EQ('a'))`` matches ``'a'``).
+
+"""
+
+from decimal import Decimal
+from numbers import Real
+
+from validity.comparator import EQ, Any, TypeIs
+from validity.interval import get_intervals
+from validity.logical_operator import Base, And, Or
+
+__docformat__ = 'reStructuredText'
+
+
+_HASH, _INTERVALS, _TYPE = 0, 1, 2
+
+
+def _checks_as(validator, klass):
+    """
+    :return: True if validator is instance of klass and uses it's :meth:`~.Base.is_valid`
+    :rtype: bool
+    """
+    return isinstance(validator, klass) and type(validator).is_valid == klass.is_valid
+
+
+def get_index_entries(validator):
+    """
+    Get entries of :class:`.RuleSet` index for validator.
+    Each entry is pair (kind, key), where kind is one of:
+
+        - 0 - key is allowed value (for hash table),
+        - 1 - key is :class:`.IntervalSet`,
+        - 2 - key is type.
+
+    :param validator: any validator
+    :type validator: Base
+    :return: (entries, exact), where exact is True if value is valid only if it matches one of entries,
+        and False if entries give only candidates. None if validator can not be indexed.
+    :rtype: tuple
+    """
+    if _checks_as(validator, EQ):
+        try:
+            hash(validator.operand)
+        except TypeError:
+            pass
+        else:
+            return [(_HASH, validator.operand)], True
+    if _checks_as(validator, Any):
+        index = validator.get_index()
+        if not index.unhashable:
+            return [(_HASH, allowed) for allowed in index.source], True
+    if _checks_as(validator, TypeIs) and not validator.subclasses:
+        return [(_TYPE, required_type) for required_type in validator.get_types()], True
+
+    intervals = get_intervals(validator)
+    if intervals is not None:
+        return [(_INTERVALS, intervals)], True
+
+    if _checks_as(validator, Or):
+        entries, exact = [], True
+        for operand in validator.operands:
+            indexed = get_index_entries(operand)
+            if indexed is None:
+                return None
+            entries.extend(indexed[0])
+            exact = exact and indexed[1]
+        return entries, exact
+
+    if _checks_as(validator, And):
+        best = None
+        for operand in validator.operands:
+            indexed = get_index_entries(operand)
+            if indexed is not None:
+                rank = (max(kind for kind, _ in indexed[0]), len(indexed[0]))
+                if best is None or rank < best[0]:
+                    best = (rank, indexed)
+        if best is not None:
+            return best[1][0], best[1][1] and len(validator.operands) == 1
+    return None
+
+
+class IntervalTree(object):
+    """
+    Centered interval tree of keys from :class:`.IntervalSet`.
+    Each item is (start, end, data) and contains key, if ``start <= key < end``.
+    """
+
+    def __init__(self, items):
+        """
+        :param items: list of (start, end, data)
+        :type items: list
+        """
+        self.left = self.right = None
+        self.center = None
+        self.by_start = self.by_end = ()
+        if not items:
+            return
+        bounds = sorted(bound for start, end, _ in items for bound in (start, end))
+        self.center = center = bounds[(len(bounds) - 1) // 2]
+        left = [item for item in items if item[1] <= center]
+        right = [item for item in items if item[0] > center]
+        here = [item for item in items if item[0] <= center < item[1]]
+        self.by_start = sorted(here, key=lambda item: item[0])
+        self.by_end = sorted(here, key=lambda item: item[1], reverse=True)
+        if left:
+            self.left = IntervalTree(left)
+        if right:
+            self.right = IntervalTree(right)
+
+    def query(self, key, result):
+        """
+        Add data of all items, that contain key, to result.
+
+        :param key: key of number (see :class:`.IntervalSet`)
+        :type key: tuple
+        :param result: set of found data
+        :type result: set
+        """
+        node = self
+        while node is not None and node.center is not None:
+            if key < node.center:
+                for start, _, data in node.by_start:
+                    if start > key:
+                        break
+                    result.add(data)
+                node = node.left
+            elif key > node.center:
+                for _, end, data in node.by_end:
+                    if end <= key:
+                        break
+                    result.add(data)
+                node = node.right
+            else:
+                result.update(data for _, _, data in node.by_start)
+                node = None
+
+
+class RuleSet(object):
+    """
+    Container of named validators with index of their leaves (see :mod:`validity.ruleset`).
+    Index is rebuilt on first :meth:`match` call after rules are changed.
+
+    .. warning::
+        Rules must not be changed after they are added to rule set, index is not updated.
+    """
+
+    def __init__(self, rules=None):
+        """
+        :param rules: initial rules, name: validator
+        :type rules: dict
+        """
+        self._rules = {}
+        self._counter = 0
+        self._index = None
+        for name, validator in (rules or {}).items():
+            self.add(name, validator)
+
+    def __len__(self):
+        return len(self._rules)
+
+    def __contains__(self, name):
+        return name in self._rules
+
+    def __getitem__(self, name):
+        return self._rules[name][1]
+
+    def __iter__(self):
+        return iter(self.get_names())
+
+    def get_names(self):
+        """
+        :return: names of rules in order of adding
+        :rtype: list
+        """
+        return [name for _, name in sorted((number, name) for name, (number, _) in self._rules.items())]
+
+    def add(self, name, validator):
+        """
+        Add rule or replace rule with same name.
+
+        :param name: name of rule
+        :param validator: rule
+        :type validator: Base
+        :raises ~exceptions.ValueError: if validator is not instance of Base
+        """
+        if not isinstance(validator, Base):
+            raise ValueError("validator must be instances of validity.Base class")
+        self._counter += 1
+        self._rules[name] = (self._counter, validator)
+        self._index = None
+
+    def remove(self, name):
+        """
+        Remove rule.
+
+        :param name: name of rule
+        :raises ~exceptions.KeyError: if there is no rule with given name
+        """
+        del self._rules[name]
+        self._index = None
+
+    def _build_index(self):
+        hashes, types, intervals, nan, scan = {}, {}, [], set(), set()
+        rules = []
+        for number, name, validator in sorted((number, name, validator)
+                                              for name, (number, validator) in self._rules.items()):
+            rule_id = len(rules)
+            indexed = get_index_entries(validator)
+            rules.append((name, validator, indexed is not None and indexed[1]))
+            if indexed is None:
+                scan.add(rule_id)
+                continue
+            for kind, key in indexed[0]:
+                if kind == _HASH:
+                    hashes.setdefault(key, set()).add(rule_id)
+                elif kind == _TYPE:
+                    types.setdefault(key, set()).add(rule_id)
+                else:
+                    intervals.extend((start, end, rule_id) for start, end in key.intervals)
+                    if key.nan:
+                        nan.add(rule_id)
+        self._index = (rules, hashes, types, IntervalTree(intervals), nan,
+                       set(rule_id for rule_ids in hashes.values() for rule_id in rule_ids),
+                       set(item[2] for item in intervals) | nan, scan)
+        return self._index
+
+    def get_candidates(self, value):
+        """
+        Get rules, that can be valid for value, from index.
+
+        :param value: value for check
+        :return: list of (name, validator, exact), where exact is True if rule is valid for value without check
+            (rules, found in index for value, that can not be looked up in it, like numeric rules for strings,
+            are returned for check)
+        :rtype: list
+        """
+        # pylint: disable=comparison-with-itself
+        rules, hashes, types, tree, nan, hashed, numeric, scan = self._index or self._build_index()
+        found = set()
+        unchecked = set(scan)
+        try:
+            found.update(hashes.get(value, ()))
+        except TypeError:
+            unchecked.update(hashed)
+        if isinstance(value, (Real, Decimal)):
+            if value != value:
+                found.update(nan)
+            else:
+                tree.query((value, 0), found)
+        else:
+            unchecked.update(numeric)
+        found.update(types.get(type(value), ()))
+        return [(rules[rule_id][0], rules[rule_id][1], rules[rule_id][2] and rule_id in found)
+                for rule_id in sorted(found | unchecked)]
+
+    def match(self, value):
+        """
+        Get names of rules, that are valid for value.
+
+        :param value: value for check
+        :return: names of matched rules in order of adding
+        :rtype: list
+        """
+        matched = []
+        for name, validator, exact in self.get_candidates(value):
+            if not exact:
+                try:
+                    if not validator.is_valid(value):
+                        continue
+                except TypeError:
+                    continue
+            matched.append(name)
+        return matched
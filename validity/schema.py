@@ -0,0 +1,545 @@
+"""
+
+Validation of records (dicts and other mappings).
+
+:class:`.Key` checks one item of mapping, :class:`.Schema` checks all items of record, described as dict
+of *validators* by key. Keys, which validator is wrapped with :class:`.Optional`, may be absent::
+
+    >>> from validity import Schema, Optional, TypeIs, GT, Any, Len, LT, And
+    >>>
+    >>> event = Schema({
+    ...     'id': And(TypeIs(int), GT(0)),
+    ...     'type': Any('click', 'view'),
+    ...     'comment': Optional(Len(LT(100))),
+    ... })
+    >>> event.is_valid({'id': 1, 'type': 'click'})
+    True
+    >>> event.is_valid({'id': 1, 'type': 'click', 'comment': 'x' * 200})
+    False
+    >>> event.is_valid({'id': 1})
+    False
+    >>> print event.get_error({'id': 0, 'type': 'buy'})
+    item `id` (must be int) AND (must be greater than 0)
+    >>> event.get_errors({'id': 0, 'type': 'buy'})
+    ['item `id` (must be int) AND (must be greater than 0)', 'item `type` must be any of (click, view)']
+    >>> event.get_errors({'type': 'click'})
+    ['item `id` must be present']
+
+Required items are fetched from record by single :func:`operator.itemgetter` call, so missing keys are found
+once per record. Values are checked in order of keys (required keys first, keys of dict are sorted)
+until first not valid value, only :meth:`.Schema.get_errors` checks all of them.
+
+Other keys of record are not checked. Schema and keys can be used as any other *validator*
+(they can be nested, combined with logical operators, compiled, serialized, etc.).
+
+"""
+
+from operator import itemgetter
+
+from validity.comparator import BaseComparator
+from validity.error import Error
+from validity.logical_operator import Base
+
+__docformat__ = 'reStructuredText'
+
+
+def _items_getter(names):
+    """
+    :param names: keys of items
+    :type names: tuple
+    :return: function, that returns tuple of items of mapping for given keys
+        (it raises `LookupError`, if any of them is missing)
+    :rtype: callable
+    """
+    if not names:
+        return lambda value: ()
+    if len(names) == 1:
+        get_item = itemgetter(names[0])
+        return lambda value: (get_item(value), )
+    return itemgetter(*names)
+
+
+def _sorted_names(fields):
+    """
+    :param fields: dict of validators by key
+    :type fields: dict
+    :return: keys of dict, sorted (by type name and text representation, if keys are not comparable),
+        so order of fields doesn't depend on order of dict
+    :rtype: list
+    """
+    try:
+        return sorted(fields)
+    except TypeError:
+        return sorted(fields, key=lambda name: (type(name).__name__, repr(name)))
+
+
+class MissingItemError(Error):
+    """
+    Lazy error of required item, that is absent in record (see :meth:`.Key.get_error`).
+    :attr:`~.Error.validator` is :class:`.Key` of missing item.
+    """
+
+    __slots__ = ()
+
+    def get_text(self, max_length=None):
+        """
+        :param max_length: maximum length of text (including :attr:`~.Error.ellipsis`).
+            If None, :attr:`~.Error.max_length` is used.
+        :type max_length: int
+        :return: text of missing item (see :meth:`.Key.get_missing_text`), truncated to max_length
+        :rtype: str
+        """
+        max_length = self.max_length if max_length is None else max_length
+        text = self.validator.get_missing_text()
+        return text if max_length is None else self._truncate(text, max_length)
+
+
+class Optional(BaseComparator):
+    """
+    Validator of item, that may be absent in mapping (see :class:`.Key`).
+    Present value is checked by validator, stored in :attr:`~.BaseComparator.operand`.
+
+    Example::
+
+        >>> from validity import Key, Optional, GT
+        >>>
+        >>> test = Key('age', Optional(GT(0)))
+        >>> print test
+        item `age` (if present) must be greater than 0
+        >>> test.is_valid({}), test.is_valid({'age': 20}), test.is_valid({'age': -1})
+        (True, True, False)
+
+    """
+
+    structural = True
+
+    __slots__ = ()
+
+    _condition_template = "(if present) {operand}"
+    """used for creating text representation of comparator (:py:meth:`.BaseComparator.get_condition_text`)"""
+
+    def __init__(self, validator):
+        """
+        validator is stored in :attr:`~.BaseComparator.operand`
+
+        :param validator: validator of present value
+        :type validator: Base
+        :raises ~exceptions.ValueError: if validator is not instance of Base
+        """
+        if not isinstance(validator, Base):
+            raise ValueError("validator must be instances of validity.Base class")
+        super(Optional, self).__init__(operand=validator)
+
+    def is_valid(self, value):
+        """
+        :param value: present value
+        :return: result of :attr:`~.BaseComparator.operand` validator
+        :rtype: bool
+        """
+        return self.operand.is_valid(value)
+
+    def get_children(self):
+        """
+        :return: validator of present value
+        :rtype: tuple
+        """
+        return (self.operand, )
+
+    def replace_children(self, children):
+        """
+        :param children: new validator of present value
+        :type children: tuple
+        :return: validator of same type with other validator of present value
+        :rtype: Optional
+        """
+        return type(self)(children[0])
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: expression of validator of present value
+        :rtype: str
+        """
+        return compiler.expression(self.operand, value)
+
+
+class Key(Base):
+    """
+    Validator of one item of mapping (or of other object, that supports ``value[name]``).
+    Value is not valid, if it has no such item, unless validator is :class:`.Optional`.
+
+    Example::
+
+        >>> from validity import Key, TypeIs
+        >>>
+        >>> test = Key('name', TypeIs(str))
+        >>> print test
+        item `name` must be str
+        >>> test.filter_values({'name': 'John'}, {'name': 1}, {}, None)
+        ([{'name': 'John'}], [{'name': 1}, {}, None])
+
+    """
+
+    structural = True
+
+    __slots__ = {
+        'name': "key of item",
+        'validator': "validator of item value",
+    }
+
+    _condition_template = "item {name} {validator}"
+    """used for creating text representation of validator (see :meth:`get_condition_text`)"""
+
+    _missing_template = "item {name} must be present"
+    """used for creating error text of missing required item (see :meth:`get_missing_text`)"""
+
+    def __init__(self, name, validator):
+        """
+        :param name: key of item
+        :param validator: validator of item value (wrapped with :class:`.Optional`, if item may be absent)
+        :type validator: Base
+        :raises ~exceptions.ValueError: if validator is not instance of Base
+        """
+        if not isinstance(validator, Base):
+            raise ValueError("validator must be instances of validity.Base class")
+        self.name = name
+        self.validator = validator
+
+    def is_required(self):
+        """
+        :return: False if :attr:`validator` is :class:`.Optional`
+        :rtype: bool
+        """
+        return not isinstance(self.validator, Optional)
+
+    def is_missing(self, value):
+        """
+        :param value: mapping
+        :return: True if value has no such item (value, that doesn't support ``value[name]``, is not mapping,
+            so it's item isn't missing)
+        :rtype: bool
+        """
+        try:
+            value[self.name]
+        except LookupError:
+            return True
+        except TypeError:
+            return False
+        return False
+
+    def is_valid(self, value):
+        """
+        Check if value has valid item.
+
+        :param value: mapping
+        :return: True if item is valid for :attr:`validator` (or it is absent and not required), otherwise False
+        :rtype: bool
+        """
+        try:
+            item = value[self.name]
+        except LookupError:
+            return not self.is_required()
+        except TypeError:
+            return False
+        return self.validator.is_valid(item)
+
+    def get_error(self, value, lazy=False):
+        """
+        Missing required item is reported as missing (see :meth:`get_missing_text`),
+        instead of condition text of :attr:`validator`.
+
+        :param value: mapping
+        :param lazy: return lazy error object instead of text
+        :type lazy: bool
+        :return: None if value is valid, otherwise error text (or :class:`~validity.error.Error`)
+        :rtype: None or str or validity.error.Error
+        """
+        if self.is_required() and self.is_missing(value):
+            return MissingItemError(self, value) if lazy else self.get_missing_text()
+        return super(Key, self).get_error(value, lazy)
+
+    def get_children(self):
+        """
+        :return: :attr:`validator`
+        :rtype: tuple
+        """
+        return (self.validator, )
+
+    def replace_children(self, children):
+        """
+        :param children: new validator of item
+        :type children: tuple
+        :return: validator of same type and same key with other validator of item
+        :rtype: Key
+        """
+        return type(self)(self.name, children[0])
+
+    def get_structure(self):
+        """
+        Keys are equal, if they have same type, equal :attr:`name` of same type and equal :attr:`validator`.
+
+        :return: (type, name type, name, validator)
+        :rtype: tuple
+        """
+        return (type(self), type(self.name), self.name, self.validator)
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Item is fetched in helper function (it may raise `LookupError` or `TypeError`).
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        helper = compiler.define([
+            "try:",
+            "    item = value[{name}]".format(name=compiler.bind(self.name)),
+            "except LookupError:",
+            "    return {missing}".format(missing=not self.is_required()),
+            "except TypeError:",
+            "    return False",
+            "return {expression}".format(expression=compiler.expression(self.validator, 'item')),
+        ])
+        return "{helper}({value})".format(helper=helper, value=value)
+
+    def _get_name_text(self):
+        """
+        :return: text representation of :attr:`name` (strings are quoted with backticks)
+        :rtype: str
+        """
+        return ("`{}`" if isinstance(self.name, (str, )) else "{}").format(self.name)
+
+    def get_missing_text(self):
+        """
+        :return: error text of missing required item
+        :rtype: str
+        """
+        return self._missing_template.format(name=self._get_name_text())
+
+    def get_condition_text(self):
+        """
+        :return: condition text representation (key and condition text of :attr:`validator`)
+        :rtype: str
+        """
+        return self._condition_template.format(
+            name=self._get_name_text(), validator=self.validator.get_cached_condition_text())
+
+
+class Schema(Base):
+    """
+    Validator of record: mapping, that has valid items for all keys of schema (see :mod:`validity.schema`).
+    """
+
+    structural = True
+
+    __slots__ = {
+        'keys': "validators of items (:class:`.Key`)",
+        '_evaluated': "function, that returns tuple of required items, validators of required items "
+                      "and pairs (key, validator) of optional items (built on first evaluation)",
+    }
+
+    _transient = Base._transient + ('_evaluated', )
+
+    def __init__(self, fields):
+        """
+        :param fields: validators of items by key (wrapped with :class:`.Optional`, if item may be absent)
+            or sequence of :class:`.Key`. Keys of dict are sorted, so order of keys doesn't depend on dict order.
+        :type fields: dict or tuple
+        :raises ~exceptions.ValueError: if no fields
+        :raises ~exceptions.ValueError: if validators are not instances of :class:`.Base` or keys are repeated
+        """
+        if isinstance(fields, dict):
+            keys = tuple(Key(name, fields[name]) for name in _sorted_names(fields))
+        else:
+            keys = tuple(fields)
+            if not all(isinstance(key, Key) for key in keys):
+                raise ValueError("fields must be dict of validators or sequence of validity.Key")
+            if len(set(key.name for key in keys)) != len(keys):
+                raise ValueError("keys of fields must be unique")
+        if not keys:
+            raise ValueError("at least one field must be specified")
+        self.keys = keys
+        self._evaluated = None
+
+    def _prepare_evaluation(self):
+        """
+        Build item getter and validators of items from :attr:`keys`.
+        Called on first evaluation and again, when this schema or any of :attr:`keys` was changed after that
+        (like replaced :attr:`.Key.validator`, see :meth:`~.Base.invalidate`), so evaluation follows :attr:`keys`.
+
+        :return: (item getter, validators of required items, pairs (key, validator) of optional items)
+        :rtype: tuple
+        """
+        self._register()
+        required = [key for key in self.keys if key.is_required()]
+        evaluated = self._evaluated = (
+            _items_getter(tuple(key.name for key in required)),
+            tuple(key.validator for key in required),
+            tuple((key.name, key.validator.operand) for key in self.keys if not key.is_required()))
+        return evaluated
+
+    def _reset_cache(self):
+        """
+        Drop item getter and validators of items too.
+        """
+        self._evaluated = None
+        super(Schema, self)._reset_cache()
+
+    def is_valid(self, value):
+        """
+        Check if all items of record are valid.
+        Required items are fetched at once, then values are checked until first not valid value.
+
+        :param value: record (mapping)
+        :return: True if all required items are present and all present items are valid, otherwise False
+        :rtype: bool
+        """
+        get_required, required, optional = self._evaluated or self._prepare_evaluation()
+        try:
+            items = get_required(value)
+        except (LookupError, TypeError):
+            return False
+        index = 0
+        for validator in required:
+            if not validator.is_valid(items[index]):
+                return False
+            index += 1
+        for name, validator in optional:
+            try:
+                item = value[name]
+            except LookupError:
+                continue
+            except TypeError:
+                return False
+            if not validator.is_valid(item):
+                return False
+        return True
+
+    def get_ordered_keys(self):
+        """
+        :return: :attr:`keys` in order of evaluation (required keys first)
+        :rtype: tuple
+        """
+        return tuple(key for key in self.keys if key.is_required()) + \
+            tuple(key for key in self.keys if not key.is_required())
+
+    def get_reasons(self, value):
+        """
+        Record is explained by first not valid item (or by all items, if it is valid, see :meth:`~.Base.explain`).
+
+        :param value: record
+        :return: (result, reasons)
+        :rtype: tuple
+        """
+        keys = self.get_ordered_keys()
+        for key in keys:
+            if not key.is_valid(value):
+                return False, [(key, False)]
+        return True, [(key, False) for key in keys]
+
+    def get_error(self, value, lazy=False):
+        """
+        Get error of first not valid item (see :meth:`.Key.get_error`), instead of condition text of whole schema.
+
+        :param value: record
+        :param lazy: return lazy error object instead of text
+        :type lazy: bool
+        :return: None if value is valid, otherwise condition text (or :class:`~validity.error.Error`) of :class:`.Key`
+        :rtype: None or str or validity.error.Error
+        """
+        valid, reasons = self.get_reasons(value)
+        if valid:
+            return None
+        return reasons[0][0].get_error(value, lazy)
+
+    def get_errors(self, value, lazy=False):
+        """
+        Check all items of record and get errors of all not valid items (see :meth:`.Key.get_error`).
+
+        :param value: record
+        :param lazy: return lazy error objects instead of texts
+        :type lazy: bool
+        :return: list of error texts (or :class:`~validity.error.Error`) of not valid :class:`.Key` validators,
+            empty if value is valid
+        :rtype: list
+        """
+        errors = (key.get_error(value, lazy) for key in self.get_ordered_keys())
+        return [error for error in errors if error is not None]
+
+    def get_children(self):
+        """
+        :return: :attr:`keys`
+        :rtype: tuple
+        """
+        return self.keys
+
+    def replace_children(self, children):
+        """
+        :param children: new validators of items (:class:`.Key`)
+        :type children: tuple
+        :return: schema of same type with given keys
+        :rtype: Schema
+        """
+        return type(self)(children)
+
+    def get_structure(self):
+        """
+        Schemas are equal, if they have same type and equal :attr:`keys` in same order.
+
+        :return: (type, keys)
+        :rtype: tuple
+        """
+        return (type(self), self.keys)
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        Required items are fetched with bound item getter, values are checked with inline expressions.
+
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression
+        :rtype: str
+        """
+        get_required, required, optional = self._evaluated or self._prepare_evaluation()
+        names = ["item{index}".format(index=index) for index in range(len(required))]
+        body = []
+        if names:
+            body.extend([
+                "try:",
+                "    {names}, = {getter}(value)".format(names=", ".join(names), getter=compiler.bind(get_required)),
+                "except (LookupError, TypeError):",
+                "    return False",
+            ])
+        for name, validator in zip(names, required):
+            body.append("if not {expression}:".format(expression=compiler.expression(validator, name)))
+            body.append("    return False")
+        for name, validator in optional:
+            body.extend([
+                "try:",
+                "    item = value[{name}]".format(name=compiler.bind(name)),
+                "except LookupError:",
+                "    pass",
+                "except TypeError:",
+                "    return False",
+                "else:",
+                "    if not {expression}:".format(expression=compiler.expression(validator, 'item')),
+                "        return False",
+            ])
+        body.append("return True")
+        helper = compiler.define(body)
+        return "{helper}({value})".format(helper=helper, value=value)
+
+    def get_condition_text(self):
+        """
+        :return: condition texts of :attr:`keys`, joined with AND
+        :rtype: str
+        """
+        return " AND ".join(key.get_nested_condition() for key in self.keys)
@@ -0,0 +1,788 @@
+"""
+
+Serialization of *validators*.
+
+:func:`.dumps` converts validator (or list, tuple, dict of validators) to compact JSON text or binary data,
+and :func:`.loads` restores it::
+
+    >>> from validity import And, Or, TypeIs, Len, Between, Any
+    >>> from validity.serialization import dumps, loads
+    >>>
+    >>> rule = And(TypeIs(str), Len(Between(1, 3)), Or(Any('a', 'ab'), Any('abc')))
+    >>> dumps(rule)
+    '{"data":["And",["TypeIs","str"],["Len",["Between",1,3]],["Or",["Any","a","ab"],["Any","abc"]]],"format":1}'
+    >>> loads(dumps(rule)) == rule
+    True
+    >>> loads(dumps({'short': rule}, binary=True))['short'] == rule
+    True
+
+Validator is stored as list ``[class name, arguments...]``:
+
+    - comparators, that have only :attr:`~.BaseComparator.operand`, as ``[name, operand]``
+      (:class:`.Any` and :class:`.Between` as ``[name, values...]``, :class:`.TypeIs` as ``[name, type names...]``),
+    - logical operators as ``[name, operands...]`` (or ``[name, {"adaptive": ...}, operands...]``),
+    - other validators as ``[name, {"state": attributes}]``, where attributes are pickled attributes
+      (see :meth:`~.Base.__getstate__`).
+
+Values, that are not JSON primitives (tuples, types, non-finite floats, etc.), are stored as ``{tag: data}``
+(on python 2 also ``str``, that is not ASCII, and ASCII ``unicode``, so both types are restored).
+Validators are restored without calling ``__init__``, like :py:mod:`pickle` does,
+so loading is faster than building same validators from config.
+
+Binary format is :py:mod:`marshal` of same data, it is faster, but depends on python version.
+
+Classes of validators and types (operands of :class:`.TypeIs`) are found by name in :class:`.Registry`.
+Custom classes must be registered in default :data:`registry` (with :func:`register`)
+or in own registry, that inherits names from it::
+
+    >>> from validity import BaseComparator
+    >>> from validity.serialization import Registry, registry
+    >>>
+    >>> names = Registry(registry)
+    >>> @names.register
+    ... class IsEven(BaseComparator):
+    ...     _condition_template = "must be even"
+    ...     def is_valid(self, value):
+    ...         return value % 2 == 0
+    ...
+    >>> loads(dumps(IsEven(None), names=names), names=names).is_valid(4)
+    True
+
+Startup time of service with large catalog of rules can be reduced with:
+
+    - :class:`.DiskCache` - rules, built from config, are stored in binary format by hash of config,
+    - lazy loading (``loads(data, lazy=True)``) - each validator of catalog is restored only when it is used
+      (see :class:`.LazyValidator`).
+
+"""
+
+import base64
+import gc
+import hashlib
+import json
+import marshal
+import os
+import sys
+from decimal import Decimal
+
+from validity.comparator import (BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, InIntervals, TypeIs,
+                                 IsNone, Len, Count)
+from validity.cache import Cached
+from validity.interval import IntervalSet, get_intervals
+from validity.logical_operator import (_get_slot_names, _set_attribute, Base, BaseLogicalOperator, Or, And, Not,
+                                      get_reasons, get_structure)
+from validity.schema import Key, Optional, Schema
+from validity.vectorized import operand_mask
+
+__docformat__ = 'reStructuredText'
+
+
+FORMAT_VERSION = 1
+"""version of serialization format"""
+
+MAGIC = b'VLD\x01'
+"""prefix of binary format"""
+
+_PRIMITIVES = (type(None), bool, int, str)
+try:
+    _PRIMITIVES += (long, unicode)  # pylint: disable=undefined-variable
+    _UNICODE = unicode  # pylint: disable=undefined-variable
+except NameError:
+    _UNICODE = None
+
+
+def _is_ascii(text):
+    """
+    Used only on python 2, where JSON text is decoded to ``unicode``, so ``str`` and ``unicode`` values
+    are distinguished by ASCII text (see :class:`_Encoder`).
+
+    :param text: str or unicode
+    :type text: str
+    :return: True if text is ASCII
+    :rtype: bool
+    """
+    try:
+        text.encode('ascii')
+    except UnicodeError:
+        return False
+    return True
+
+
+class Registry(object):
+    """
+    Names of validator classes and types, used in serialized data.
+    Registry can inherit names from parent registry (see :data:`registry`).
+    """
+
+    def __init__(self, parent=None):
+        """
+        :param parent: registry, that is used for names, which are not registered in this registry
+        :type parent: Registry
+        """
+        self.parent = parent
+        self._classes = {}
+        self._names = {}
+
+    def register(self, klass, name=None):
+        """
+        Register validator class or type. Can be used as class decorator.
+
+        :param klass: validator class or type
+        :type klass: type
+        :param name: name in serialized data (``klass.__name__`` if None)
+        :type name: str
+        :return: klass
+        :rtype: type
+        :raises ~exceptions.ValueError: if other class is registered with same name
+        """
+        name = klass.__name__ if name is None else name
+        registered = self._classes.get(name)
+        if registered is not None and registered is not klass:
+            raise ValueError("name '{name}' is already registered for {klass!r}".format(name=name, klass=registered))
+        self._classes[name] = klass
+        self._names[klass] = name
+        return klass
+
+    def get_name(self, klass):
+        """
+        :param klass: validator class or type
+        :type klass: type
+        :return: registered name
+        :rtype: str
+        :raises ~exceptions.TypeError: if class is not registered
+        """
+        name = self._names.get(klass)
+        if name is not None:
+            return name
+        if self.parent is not None:
+            return self.parent.get_name(klass)
+        raise TypeError("class {klass!r} is not registered for serialization".format(klass=klass))
+
+    def get_class(self, name):
+        """
+        :param name: registered name
+        :type name: str
+        :return: validator class or type
+        :rtype: type
+        :raises ~exceptions.ValueError: if name is not registered
+        """
+        klass = self._classes.get(name)
+        if klass is not None:
+            return klass
+        if self.parent is not None:
+            return self.parent.get_class(name)
+        raise ValueError("unknown class name '{name}'".format(name=name))
+
+
+registry = Registry()
+"""default registry of built-in validators and types"""
+
+for _klass in (GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, InIntervals, TypeIs, IsNone, Len, Count,
+               Or, And, Not, Cached, Key, Optional, Schema,
+               type(None), bool, int, float, complex, str, bytes, list, tuple, dict, set, frozenset, Decimal):
+    registry.register(_klass)
+del _klass
+
+
+_BUILT_IN = frozenset([GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, TypeIs, Len, Count, Or, And, Not])
+"""classes, that are restored without :meth:`~.Base.__setstate__`"""
+
+_TUPLE_OPERANDS = frozenset([Any, Between])
+"""classes, which operand (tuple) is stored as arguments"""
+
+_TYPE_OPERANDS = frozenset([TypeIs])
+"""classes, which operand (type or tuple of types) is stored as names of types (with ``subclasses`` mode)"""
+
+
+def register(klass, name=None):
+    """
+    Register validator class or type in default :data:`registry` (see :meth:`.Registry.register`).
+
+    :param klass: validator class or type
+    :type klass: type
+    :param name: name in serialized data (``klass.__name__`` if None)
+    :type name: str
+    :return: klass
+    :rtype: type
+    """
+    return registry.register(klass, name)
+
+
+def _restore(klass, state):
+    """
+    Create validator without calling ``__init__``.
+
+    :param klass: validator class
+    :type klass: type
+    :param state: attributes of validator (see :meth:`~.Base.__setstate__`)
+    :type state: dict
+    :return: validator
+    :rtype: Base
+    """
+    validator = klass.__new__(klass)
+    validator.__setstate__(state)
+    return validator
+
+
+class _Encoder(object):
+    """
+    Converter of validators to JSON compatible data.
+    """
+
+    def __init__(self, names):
+        self.names = names
+
+    def value(self, value):
+        """
+        :param value: any supported value
+        :return: JSON compatible data
+        :raises ~exceptions.TypeError: if value can not be serialized
+        """
+        value_type = type(value)
+        if value_type in _PRIMITIVES:
+            # python 2: str is bytes, JSON has only unicode text (restored as str, if it is ASCII)
+            if value_type is bytes and not _is_ascii(value):
+                return {'bytes': base64.b64encode(value).decode('ascii')}
+            if value_type is _UNICODE and _is_ascii(value):
+                return {'unicode': value}
+            return value
+        if value_type is float:
+            return value if value - value == 0 else {'float': repr(value)}
+        if isinstance(value, Base):
+            return self.node(value)
+        if value_type is tuple:
+            return {'tuple': [self.value(item) for item in value]}
+        if value_type is list:
+            return {'list': [self.value(item) for item in value]}
+        if value_type is dict:
+            return {'dict': [[self.value(key), self.value(item)] for key, item in value.items()]}
+        if value_type in (set, frozenset):
+            return {value_type.__name__: [self.value(item) for item in value]}
+        if isinstance(value, type):
+            return {'type': self.names.get_name(value)}
+        if value_type is Decimal:
+            return {'decimal': str(value)}
+        if value_type is bytes:
+            return {'bytes': base64.b64encode(value).decode('ascii')}
+        if value_type is IntervalSet:
+            return {'intervals': self.value(value.__getstate__())}
+        raise TypeError("value of type {name} can not be serialized".format(name=value_type.__name__))
+
+    def node(self, validator):
+        """
+        :param validator: any registered validator
+        :type validator: Base
+        :return: list [class name, arguments...]
+        :rtype: list
+        """
+        if isinstance(validator, LazyValidator):
+            return validator.get_data()
+        klass = type(validator)
+        name = self.names.get_name(klass)
+        state = validator.__getstate__()
+        if isinstance(validator, BaseLogicalOperator) and set(state) - {'adaptive'} == {'operands'}:
+            operands = [self.node(operand) for operand in validator.operands]
+            if validator.adaptive:
+                return [name, {'adaptive': validator.adaptive}] + operands
+            return [name] + operands
+        if klass in _TYPE_OPERANDS and set(state) == {'operand', 'subclasses'} \
+                and all(isinstance(item, type) for item in validator.get_types()):
+            types = [self.names.get_name(item) for item in validator.get_types()]
+            if validator.subclasses:
+                return [name, {'subclasses': True}] + types
+            return [name] + types
+        if isinstance(validator, BaseComparator) and list(state) in (['operand'], []):  # operand can be None
+            operand = validator.operand
+            if klass in _TUPLE_OPERANDS and type(operand) is tuple:
+                return [name] + [self.value(item) for item in operand]
+            return [name, self.value(operand)]
+        return [name, {'state': dict((key, self.value(item)) for key, item in state.items())}]
+
+
+def _new(klass):
+    """
+    Create built-in validator without calling ``__init__``.
+
+    :param klass: validator class
+    :type klass: type
+    :return: validator without public attributes
+    :rtype: Base
+    """
+    validator = object.__new__(klass)
+    for name in _get_slot_names(klass) + klass._transient:  # pylint: disable=protected-access
+        _set_attribute(validator, name, None)
+    return validator
+
+
+class _Decoder(object):
+    """
+    Converter of JSON compatible data to validators.
+    Decoding functions are prepared once for each class name.
+    """
+
+    def __init__(self, names):
+        self.names = names
+        self._decoders = {}
+
+    def value(self, data, lazy=False):
+        """
+        :param data: JSON compatible data (see :class:`_Encoder`)
+        :param lazy: wrap validators with :class:`.LazyValidator` (not nested validators)
+        :type lazy: bool
+        :return: restored value
+        :raises ~exceptions.ValueError: if data is not valid
+        """
+        data_type = type(data)
+        if data_type is list:
+            return LazyValidator(data, self.names) if lazy else self.node(data)
+        if data_type is not dict:
+            if data_type is _UNICODE and _is_ascii(data):  # python 2 (see _Encoder.value)
+                return data.encode('ascii')
+            return data
+        if len(data) != 1:
+            raise ValueError("value must be tagged with one key")
+        (tag, item), = data.items()
+        if tag == 'tuple':
+            return tuple(self.value(element, lazy) for element in item)
+        if tag == 'list':
+            return [self.value(element, lazy) for element in item]
+        if tag == 'dict':
+            return dict((self.value(key), self.value(element, lazy)) for key, element in item)
+        if tag == 'set':
+            return set(self.value(element) for element in item)
+        if tag == 'frozenset':
+            return frozenset(self.value(element) for element in item)
+        if tag == 'float':
+            return float(item)
+        if tag == 'type':
+            return self.names.get_class(item)
+        if tag == 'decimal':
+            return Decimal(item)
+        if tag == 'bytes':
+            return base64.b64decode(item.encode('ascii'))
+        if tag == 'unicode':
+            return item if _UNICODE is None else _UNICODE(item)
+        if tag == 'intervals':
+            intervals = IntervalSet.__new__(IntervalSet)
+            intervals.__setstate__(self.value(item))
+            return intervals
+        raise ValueError("unknown value tag '{tag}'".format(tag=tag))
+
+    def node(self, data):
+        """
+        :param data: list [class name, arguments...]
+        :type data: list
+        :return: validator
+        :rtype: Base
+        :raises ~exceptions.ValueError: if data is not valid
+        """
+        try:
+            decode = self._decoders[data[0]]
+        except KeyError:
+            decode = self._decoders[data[0]] = self._get_decoder(data[0])
+        except (IndexError, TypeError):
+            raise ValueError("validator must be stored as list [class name, arguments...]")
+        return decode(data)
+
+    def _get_decoder(self, name):
+        """
+        :param name: registered name of validator class
+        :type name: str
+        :return: function, that restores validator of this class from data
+        :rtype: callable
+        :raises ~exceptions.ValueError: if name is unknown or it is not name of validator class
+        """
+        klass = self.names.get_class(name)
+        if not isinstance(klass, type) or not issubclass(klass, Base):
+            raise ValueError("'{name}' is not validator class".format(name=name))
+        value = self.value
+        node = self.node
+        is_operator = issubclass(klass, BaseLogicalOperator)
+        built_in = klass in _BUILT_IN
+
+        def decode(data):
+            if len(data) == 2 and type(data[1]) is dict and 'state' in data[1]:
+                return _restore(klass, dict((key, value(item)) for key, item in data[1]['state'].items()))
+            if is_operator:
+                arguments = data[1:]
+                adaptive = None
+                if arguments and type(arguments[0]) is dict:
+                    adaptive = arguments[0].get('adaptive')
+                    arguments = arguments[1:]
+                if not arguments:
+                    raise ValueError("logical operator must have operands")
+                operands = tuple([node(operand) for operand in arguments])
+                if not built_in:
+                    return _restore(klass, {'operands': operands, 'adaptive': adaptive})
+                validator = _new(klass)
+                _set_attribute(validator, 'operands', operands)
+                _set_attribute(validator, 'adaptive', adaptive)
+                return validator
+            if klass in _TYPE_OPERANDS:
+                return decode_types(data)
+            if klass in _TUPLE_OPERANDS:
+                operand = tuple([value(item) for item in data[1:]])
+            elif len(data) != 2:
+                raise ValueError("comparator must have one operand")
+            else:
+                operand = value(data[1])
+            if not built_in:
+                return _restore(klass, {'operand': operand})
+            validator = _new(klass)
+            _set_attribute(validator, 'operand', operand)
+            return validator
+
+        def decode_types(data):
+            arguments = data[1:]
+            subclasses = False
+            if arguments and type(arguments[0]) is dict and 'subclasses' in arguments[0]:
+                subclasses = bool(arguments[0]['subclasses'])
+                arguments = arguments[1:]
+            if not arguments:
+                raise ValueError("type comparator must have types")
+            types = tuple([self.names.get_class(item) if type(item) is not dict else value(item)
+                           for item in arguments])
+            state = {'operand': types[0] if len(types) == 1 else types, 'subclasses': subclasses}
+            if not built_in:
+                return _restore(klass, state)
+            validator = _new(klass)
+            _set_attribute(validator, 'operand', state['operand'])
+            _set_attribute(validator, 'subclasses', subclasses)
+            return validator
+
+        return decode
+
+
+def to_data(value, names=None):
+    """
+    Convert validator (or list, tuple, dict of validators and other values) to JSON compatible data.
+
+    :param value: validator or container of validators
+    :param names: registry of class names (:data:`registry` if None)
+    :type names: Registry
+    :return: JSON compatible data
+    :raises ~exceptions.TypeError: if value contains not registered class or not supported value
+    """
+    return _Encoder(names or registry).value(value)
+
+
+def from_data(data, names=None, lazy=False):
+    """
+    Restore value from data (see :func:`to_data`).
+
+    :param data: JSON compatible data
+    :param names: registry of class names (:data:`registry` if None)
+    :type names: Registry
+    :param lazy: restore validators (not nested in other validators) as :class:`.LazyValidator`
+    :type lazy: bool
+    :return: restored value
+    :raises ~exceptions.ValueError: if data is not valid or contains unknown class name
+    """
+    return _Decoder(names or registry).value(data, lazy)
+
+
+def dumps(value, binary=False, names=None):
+    """
+    Serialize validator (or list, tuple, dict of validators and other values).
+
+    :param value: validator or container of validators
+    :param binary: return :py:mod:`marshal` based binary data instead of JSON text
+    :type binary: bool
+    :param names: registry of class names (:data:`registry` if None)
+    :type names: Registry
+    :return: JSON text or binary data
+    :rtype: str or bytes
+    :raises ~exceptions.TypeError: if value contains not registered class or not supported value
+    """
+    data = to_data(value, names)
+    if binary:
+        return MAGIC + marshal.dumps(data)
+    return json.dumps({'format': FORMAT_VERSION, 'data': data}, separators=(',', ':'), sort_keys=True)
+
+
+def loads(data, names=None, lazy=False):
+    """
+    Restore value, serialized with :func:`dumps`.
+    Cyclic garbage collector (:py:mod:`gc`) is paused while data is restored.
+
+    :param data: JSON text or binary data
+    :type data: str or bytes
+    :param names: registry of class names (:data:`registry` if None)
+    :type names: Registry
+    :param lazy: restore validators (not nested in other validators) as :class:`.LazyValidator`
+    :type lazy: bool
+    :return: restored value
+    :raises ~exceptions.ValueError: if data is not valid, has other format version or contains unknown class name
+    """
+    # restored objects are not garbage, so cyclic garbage collection is paused while they are created
+    collect = gc.isenabled()
+    gc.disable()
+    try:
+        if isinstance(data, bytes) and data.startswith(MAGIC):
+            try:
+                content = marshal.loads(data[len(MAGIC):])
+            except (EOFError, TypeError) as error:
+                raise ValueError("invalid binary data: {error}".format(error=error))
+        else:
+            if isinstance(data, bytes):
+                data = data.decode('utf-8')
+            document = json.loads(data)
+            if not isinstance(document, dict) or document.get('format') != FORMAT_VERSION:
+                raise ValueError("unsupported serialization format")
+            content = document['data']
+        return from_data(content, names, lazy)
+    finally:
+        if collect:
+            gc.enable()
+
+
+class LazyValidator(Base):
+    """
+    Proxy of serialized validator, that is restored on first use (see :func:`loads`).
+    Serialized again, proxy gives same data without restoring validator.
+    """
+
+    structural = True
+
+    __slots__ = ('_data', '_names', '_validator')
+
+    _transient = Base._transient + ('_validator', )
+
+    def __init__(self, data, names=None):
+        """
+        :param data: validator data (see :func:`to_data`)
+        :type data: list
+        :param names: registry of class names (:data:`registry` if None)
+        :type names: Registry
+        """
+        self._data = data
+        self._names = names or registry
+        self._validator = None
+
+    def __getstate__(self):
+        """
+        Default :data:`registry` is not pickled, it is taken from restoring process.
+
+        :return: attributes of proxy
+        :rtype: dict
+        """
+        state = super(LazyValidator, self).__getstate__()
+        if state.get('_names') is registry:
+            del state['_names']
+        return state
+
+    def __setstate__(self, state):
+        super(LazyValidator, self).__setstate__(state)
+        self._names = self._names or registry
+        self._validator = None
+
+    def get_data(self):
+        """
+        :return: validator data (see :func:`to_data`)
+        :rtype: list
+        """
+        return self._data
+
+    def is_loaded(self):
+        """
+        :return: True if validator is restored
+        :rtype: bool
+        """
+        return self._validator is not None
+
+    def get_validator(self):
+        """
+        Restore validator on first call.
+
+        :return: restored validator
+        :rtype: Base
+        """
+        validator = self._validator
+        if validator is None:
+            validator = self._validator = _Decoder(self._names).node(self._data)
+        return validator
+
+    def is_valid(self, value):
+        """
+        :param value: value for check
+        :return: result of restored validator :meth:`~.Base.is_valid`
+        :rtype: bool
+        """
+        return self.get_validator().is_valid(value)
+
+    def get_children(self):
+        """
+        :return: restored validator
+        :rtype: tuple
+        """
+        return (self.get_validator(), )
+
+    def replace_children(self, children):
+        """
+        :param children: new validator
+        :type children: tuple
+        :return: given validator (proxy is not needed for validator, that is already restored)
+        :rtype: Base
+        """
+        return children[0]
+
+    def get_structure(self):
+        """
+        :return: structure of restored validator, so proxy is equal to it
+        :rtype: tuple
+        """
+        return get_structure(self.get_validator())
+
+    def get_intervals(self):
+        """
+        :return: interval set of restored validator
+        :rtype: validity.interval.IntervalSet
+        """
+        return get_intervals(self.get_validator())
+
+    def get_reasons(self, value):
+        """
+        :param value: value for check
+        :return: reasons of restored validator (see :meth:`~.Base.get_reasons`)
+        :rtype: tuple
+        """
+        return get_reasons(self.get_validator(), value)
+
+    def get_mask(self, values):
+        """
+        :param values: one dimensional array
+        :type values: numpy.ndarray
+        :return: mask of restored validator
+        :rtype: numpy.ndarray
+        """
+        return operand_mask(self.get_validator(), values)
+
+    def get_compiled_expression(self, compiler, value):
+        """
+        :param compiler: compiler instance
+        :type compiler: validity.compiler.Compiler
+        :param value: name of variable with value for check
+        :type value: str
+        :return: python expression of restored validator
+        :rtype: str
+        """
+        return compiler.expression(self.get_validator(), value)
+
+    def get_condition_text(self):
+        """
+        :return: condition text of restored validator
+        :rtype: str
+        """
+        return self.get_validator().get_cached_condition_text()
+
+    def get_nested_condition(self):
+        """
+        :return: nested condition text of restored validator
+        :rtype: str
+        """
+        return self.get_validator().get_nested_condition()
+
+
+class DiskCache(object):
+    """
+    Directory with validators in binary format (see :func:`dumps`), stored by SHA-256 hash of their source
+    (like config, from which they are built)::
+
+        >>> from validity.serialization import DiskCache
+        >>>
+        >>> cache = DiskCache('/tmp/rules')  # doctest: +SKIP
+        >>> config = open('rules.json').read()  # doctest: +SKIP
+        >>> rules = cache.load(config, lambda: build_rules(config), lazy=True)  # doctest: +SKIP
+
+    Key also depends on :data:`FORMAT_VERSION` and python version (binary format depends on it).
+    Files are replaced atomically, so cache can be shared by processes.
+    """
+
+    suffix = '.vld'
+    """suffix of cache files"""
+
+    def __init__(self, directory, names=None):
+        """
+        :param directory: cache directory (created if it does not exist)
+        :type directory: str
+        :param names: registry of class names (:data:`registry` if None)
+        :type names: Registry
+        """
+        self.directory = directory
+        self.names = names
+
+    def get_key(self, source):
+        """
+        :param source: source of validators
+        :type source: str or bytes
+        :return: hex digest of SHA-256 hash of source, format version and python version
+        :rtype: str
+        """
+        if not isinstance(source, bytes):
+            source = source.encode('utf-8')
+        prefix = 'validity-{0}-python-{1}.{2}\n'.format(FORMAT_VERSION, *sys.version_info[:2]).encode('ascii')
+        return hashlib.sha256(prefix + source).hexdigest()
+
+    def get_path(self, source):
+        """
+        :param source: source of validators
+        :type source: str or bytes
+        :return: path of cache file
+        :rtype: str
+        """
+        return os.path.join(self.directory, self.get_key(source) + self.suffix)
+
+    def load(self, source, build, lazy=False):
+        """
+        Load validators from cache, or build and store them.
+        Broken cache files are rebuilt.
+
+        :param source: source of validators
+        :type source: str or bytes
+        :param build: function without arguments, that builds validators from source
+        :type build: callable
+        :param lazy: restore cached validators as :class:`.LazyValidator`
+        :type lazy: bool
+        :return: cached or built validators
+        """
+        path = self.get_path(source)
+        try:
+            with open(path, 'rb') as cached:
+                data = cached.read()
+        except (IOError, OSError):
+            data = None
+        if data is not None:
+            try:
+                return loads(data, self.names, lazy)
+            except (ValueError, TypeError):
+                pass
+
+        value = build()
+        self.store(path, dumps(value, binary=True, names=self.names))
+        return value
+
+    def store(self, path, data):
+        """
+        Write cache file atomically.
+
+        :param path: path of cache file
+        :type path: str
+        :param data: serialized validators
+        :type data: bytes
+        """
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        temporary = '{path}.{pid}.tmp'.format(path=path, pid=os.getpid())
+        with open(temporary, 'wb') as cached:
+            cached.write(data)
+        getattr(os, 'replace', os.rename)(temporary, path)
+
+    def clear(self):
+        """
+        Remove all cache files.
+        """
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(self.suffix):
+                os.remove(os.path.join(self.directory, name))
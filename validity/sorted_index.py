@@ -0,0 +1,164 @@
+"""
+
+Selection of values from sorted index with numeric *validators*.
+
+:class:`.SortedIndex` keeps values sorted by numeric key, :func:`.select` turns validator into set of intervals
+(see :mod:`validity.interval`) and takes slice of index for each interval, found with bisect,
+so selection takes ``O(log n + k)`` time instead of checking all values with :meth:`~.Base.filter_values`::
+
+    >>> from validity import SortedIndex, select, And, Or, GT, LT, Between, EQ, Not
+    >>>
+    >>> index = SortedIndex([7, 3.5, 10, 1, 42, 5, 15, 3])
+    >>> select(index, Or(LT(3), Between(5, 10)))
+    [1, 5, 7, 10]
+    >>> select(index, And(GT(3), Not(EQ(5))))
+    [3.5, 7, 10, 15, 42]
+
+Records can be indexed by any numeric field with ``key`` function, validator is checked with keys::
+
+    >>> readings = [{'sensor': 'a', 'value': 20.5}, {'sensor': 'b', 'value': 18.0}, {'sensor': 'c', 'value': 25.1}]
+    >>> index = SortedIndex(readings, key=lambda reading: reading['value'])
+    >>> [reading['sensor'] for reading in select(index, GT(20))]
+    ['a', 'c']
+
+One dimensional numeric numpy arrays are indexed with ``numpy.sort`` and searched with ``numpy.searchsorted``,
+then selection is numpy array.
+
+Validators, that can not be represented as intervals (like ``And(TypeIs(int), GT(5))`` or custom comparators),
+are checked with each key (in order of index), so result is same, but it takes ``O(n)`` time.
+
+"""
+
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from numbers import Real
+
+from validity.interval import get_intervals
+from validity.vectorized import require_numpy, is_array, is_numeric
+
+__docformat__ = 'reStructuredText'
+
+
+class SortedIndex(object):
+    """
+    Values, sorted by numeric key.
+    Values with NaN key are kept after all others (they are selected only by validators, that are valid for NaN).
+    """
+
+    __slots__ = {
+        'keys': "sorted keys of values (list or numpy array), NaN keys are in the end",
+        'values': "values in order of keys (list or numpy array)",
+        'nan_start': "position of first NaN key (count of keys, if there are no NaN keys)",
+    }
+
+    def __init__(self, values, key=None):
+        """
+        Values are sorted while initialization (it takes ``O(n)`` time for already sorted values).
+
+        :param values: iterable of values, or one dimensional numeric numpy array
+        :type values: collections.Iterable or numpy.ndarray
+        :param key: function, that returns key (number) of value (value itself is key, if it is None),
+            it is not supported for numpy arrays
+        :type key: callable
+        :raises ~exceptions.TypeError: if key is not a number, or key function is given for numpy array
+        :raises ~exceptions.ValueError: if numpy array is not one dimensional numeric array
+        """
+        if is_array(values):
+            if key is not None:
+                raise TypeError("key function is not supported for numpy arrays")
+            if values.ndim != 1 or not is_numeric(values):
+                raise ValueError("only one dimensional numeric arrays can be indexed")
+            numpy = require_numpy()
+            self.keys = self.values = numpy.sort(values, kind='stable')
+            self.nan_start = len(values)
+            if values.dtype.kind == 'f':
+                self.nan_start -= int(numpy.count_nonzero(numpy.isnan(self.keys)))
+            return
+        values = list(values)
+        keys = values if key is None else [key(value) for value in values]
+        for item in keys:
+            if not isinstance(item, (Real, Decimal)):
+                raise TypeError("key of sorted index must be number, not {type}".format(type=type(item).__name__))
+        # pylint: disable=comparison-with-itself
+        if key is None:
+            self.values = sorted(value for value in values if value == value)
+            self.nan_start = len(self.values)
+            self.values.extend(value for value in values if value != value)
+            self.keys = self.values
+            return
+        order = sorted((position for position, item in enumerate(keys) if item == item), key=keys.__getitem__)
+        self.nan_start = len(order)
+        order.extend(position for position, item in enumerate(keys) if item != item)
+        self.keys = [keys[position] for position in order]
+        self.values = [values[position] for position in order]
+
+    def __len__(self):
+        return len(self.values)
+
+    def search(self, bound, after=False):
+        """
+        Find position of bound in sorted keys (NaN keys are not searched).
+
+        :param bound: number
+        :param after: if True, position after keys, that are equal to bound, is returned
+        :type after: bool
+        :return: count of keys, that are less than bound (or less or equal, if ``after`` is True)
+        :rtype: int
+        """
+        if is_array(self.keys):
+            return int(require_numpy().searchsorted(self.keys[:self.nan_start], bound, 'right' if after else 'left'))
+        return (bisect_right if after else bisect_left)(self.keys, bound, 0, self.nan_start)
+
+    def get_slices(self, intervals):
+        """
+        Get slices of :attr:`values`, which keys belong to set of intervals.
+
+        :param intervals: set of numbers
+        :type intervals: validity.interval.IntervalSet
+        :return: list of slices in order of keys
+        :rtype: list
+        """
+        slices = []
+        for (start, start_flag), (end, end_flag) in intervals.intervals:
+            # start key (a, 0) includes a, (a, 1) excludes it; end key (b, 1) includes b, (b, 0) excludes it
+            first = self.search(start, after=bool(start_flag))
+            stop = self.search(end, after=bool(end_flag))
+            if first < stop:
+                slices.append(slice(first, stop))
+        if intervals.nan and self.nan_start < len(self.values):
+            slices.append(slice(self.nan_start, len(self.values)))
+        return slices
+
+    def take(self, slices):
+        """
+        :param slices: slices of :attr:`values`
+        :type slices: list
+        :return: values from all slices (list, or numpy array for array index)
+        :rtype: list or numpy.ndarray
+        """
+        if is_array(self.values):
+            return require_numpy().concatenate([self.values[:0]] + [self.values[part] for part in slices])
+        result = []
+        for part in slices:
+            result.extend(self.values[part])
+        return result
+
+
+def select(index, validator):
+    """
+    Select values, which keys are valid for validator (see :mod:`validity.sorted_index`).
+
+    :param index: sorted values
+    :type index: SortedIndex
+    :param validator: any validator, numeric validators (see :meth:`~.Base.get_intervals`) are resolved by bisect
+    :type validator: Base
+    :return: valid values in order of keys (list, or numpy array for array index)
+    :rtype: list or numpy.ndarray
+    """
+    intervals = get_intervals(validator)
+    if intervals is not None:
+        return index.take(index.get_slices(intervals))
+    if is_array(index.values):
+        return index.values[validator.is_valid_array(index.keys)]
+    is_valid = validator.is_valid
+    return [value for item, value in zip(index.keys, index.values) if is_valid(item)]
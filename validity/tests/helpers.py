@@ -0,0 +1,25 @@
+#pylint: skip-file
+from validity.comparator import BaseComparator
+
+
+class Counter(BaseComparator):
+    """
+    Same as GT, but counts calls of is_valid.
+    Counter is private attribute, so counting is not a change of validator (see Base.__setattr__),
+    and counters are compared by operand like GT.
+    """
+    structural = True
+
+    _condition_template = "must be greater than {operand}"
+
+    def __init__(self, operand):
+        super(Counter, self).__init__(operand)
+        self._calls = 0
+
+    @property
+    def calls(self):
+        return self._calls
+
+    def is_valid(self, value):
+        self._calls += 1
+        return value > self.operand
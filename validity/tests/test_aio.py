@@ -0,0 +1,131 @@
+#pylint: skip-file
+import asyncio
+from unittest import TestCase
+from validity.comparator import GT, LT, EQ, TypeIs, Len
+from validity.logical_operator import And, Or, Not
+from validity.cache import Cached
+from validity.aio import AsyncBaseComparator
+
+
+class Lookup(AsyncBaseComparator):
+    _condition_template = "must be in {operand}"
+
+    def __init__(self, operand, delay=0.0, log=None):
+        super(Lookup, self).__init__(operand)
+        self._delay = delay
+        self._log = log if log is not None else []
+
+    async def ais_valid(self, value):
+        self._log.append(('start', self.operand))
+        try:
+            await asyncio.sleep(self._delay)
+        except asyncio.CancelledError:
+            self._log.append(('cancelled', self.operand))
+            raise
+        self._log.append(('done', self.operand))
+        return value in self.operand
+
+
+class Fails(AsyncBaseComparator):
+
+    async def ais_valid(self, value):
+        raise KeyError(value)
+
+
+class Walked(Not):
+
+    def __init__(self, condition, log):
+        super(Walked, self).__init__(condition)
+        self._log = log
+
+    def get_children(self):
+        self._log.append(self)
+        return super(Walked, self).get_children()
+
+
+def run(validator, value):
+    return asyncio.run(validator.ais_valid(value))
+
+
+class TestAsync(TestCase):
+
+    def test_sync_validators(self):
+        self.assertTrue(run(GT(5), 10))
+        self.assertFalse(run(And(TypeIs(int), GT(5)), 'a'))
+        self.assertFalse(GT(5).is_async())
+        self.assertFalse(And(GT(5), Not(EQ(7))).is_async())
+
+    def test_async_comparator(self):
+        test = Lookup((1, 2, 3))
+        self.assertTrue(test.is_async())
+        self.assertTrue(Or(GT(5), Not(test)).is_async())
+        self.assertTrue(run(test, 2))
+        self.assertFalse(run(test, 5))
+        self.assertTrue(test.is_valid(2))
+        self.assertFalse(test(5))
+        self.assertEqual(str(test), "must be in (1, 2, 3)")
+        with self.assertRaises(NotImplementedError):
+            run(AsyncBaseComparator(1), 1)
+
+    def test_is_async_cached(self):
+        log = []
+        test = GT(5)
+        for _ in range(50):
+            test = Walked(test, log)
+        self.assertFalse(test.is_async())
+        walks = len(log)
+        self.assertLessEqual(walks, 100)  # each node is walked once more, when it is registered in nested validator
+        self.assertFalse(test.is_async())
+        self.assertTrue(run(test, 10))  # 50 negations
+        self.assertEqual(len(log), walks)
+        leaf = test
+        while isinstance(leaf.operands[0], Walked):
+            leaf = leaf.operands[0]
+        leaf.operands = (Lookup((1, 2, 3)), )
+        walks = len(log)
+        self.assertTrue(test.is_async())
+        self.assertEqual(len(log), walks + 50)
+        self.assertTrue(run(test, 2))
+        self.assertFalse(run(test, 10))
+
+    def test_concurrent(self):
+        log = []
+        test = And(TypeIs(int), Lookup((1, 2), 0.05, log), Lookup((2, 3), 0.05, log))
+        self.assertTrue(run(test, 2))
+        self.assertEqual([event for event, _ in log], ['start', 'start', 'done', 'done'])
+        log[:] = []
+        self.assertFalse(run(test, 'a'))
+        self.assertEqual(log, [])
+
+    def test_cancel(self):
+        log = []
+        test = Or(Lookup((1, ), 10, log), Lookup((1, ), 0, log), GT(100))
+        self.assertTrue(run(test, 1))
+        self.assertIn(('cancelled', (1, )), log)
+        log[:] = []
+        self.assertTrue(run(test, 200))
+        self.assertEqual(log, [])
+
+        log[:] = []
+        test = And(Lookup((1, ), 10, log), Lookup((2, ), 0, log))
+        self.assertFalse(run(test, 1))
+        self.assertEqual(log[-1], ('cancelled', (1, )))
+
+    def test_nested(self):
+        test = Or(Not(Lookup((1, 2))), Len(Lookup((3, ))), Cached(Lookup((10, ))))
+        self.assertEqual([run(test, value) for value in (1, 'abc', 10, 5)], [False, True, True, True])
+        self.assertFalse(run(Len(Lookup((3, ))), 3))
+        self.assertTrue(run(Len(Lookup((3, ))), (item for item in 'abc')))
+        self.assertFalse(run(Len(Lookup((3, ))), iter('ab')))
+        self.assertEqual(test.filter_values(1, 'abc', 10, 5), (['abc', 10, 5], [1]))
+
+    def test_error(self):
+        with self.assertRaises(KeyError):
+            run(And(Fails(1), Lookup((1, ), 10)), 1)
+
+    def test_running_loop(self):
+        async def check():
+            Lookup((1, )).is_valid(1)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(check())
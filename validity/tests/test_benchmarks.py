@@ -0,0 +1,57 @@
+#pylint: skip-file
+import json
+import os
+import tempfile
+from unittest import TestCase
+from validity.logical_operator import And, Or, Not
+from validity import benchmarks
+
+
+class TestBenchmarks(TestCase):
+
+    def test_measure(self):
+        calls, seconds = benchmarks.measure(lambda: None, min_time=0.001, repeat=2)
+        self.assertGreaterEqual(calls, 1)
+        self.assertGreater(seconds, 0)
+
+    def test_build_tree(self):
+        for operators in ((And, ), (Or, ), (And, Or), (Or, And)):
+            for valid in (True, False):
+                tree = benchmarks.build_tree(operators, 3, 3, valid)
+                self.assertIs(tree.is_valid(0), valid)
+                self.assertIs(type(tree), operators[0])
+                self.assertEqual(len(tree.operands), 3)
+        self.assertTrue(benchmarks.build_not_chain(3).is_valid(0) is False)
+        self.assertTrue(benchmarks.build_not_chain(4).is_valid(0))
+
+    def test_cases(self):
+        for name, comparator, valid, not_valid in benchmarks.comparator_cases():
+            self.assertTrue(comparator.is_valid(valid), name)
+            self.assertFalse(comparator.is_valid(not_valid), name)
+        for name, tree, value, details in benchmarks.tree_cases(depths=(1, 2), widths=(2, 8), max_leaves=16):
+            self.assertLessEqual(details['leaves'], 16)
+
+    def test_run(self):
+        report = benchmarks.run(groups=('batches', 'errors'), sizes=(10, 20), min_time=0.0001, repeat=1)
+        groups = set(result['group'] for result in report['results'])
+        self.assertEqual(groups, {'batches', 'errors'})
+        sizes = set(result['size'] for result in report['results'] if result['group'] == 'batches')
+        self.assertEqual(sizes, {10, 20})
+        for result in report['results']:
+            self.assertEqual(result['per_call'], result['seconds'] / result['calls'])
+        with self.assertRaises(ValueError):
+            benchmarks.run(groups=('unknown', ))
+
+    def test_main(self):
+        handle, path = tempfile.mkstemp(suffix='.json')
+        os.close(handle)
+        try:
+            benchmarks.main(['--groups', 'comparators', '--min-time', '0.0001', '--repeat', '1', '--output', path])
+            with open(path) as source:
+                report = json.load(source)
+        finally:
+            os.remove(path)
+        names = set(result['name'] for result in report['results'])
+        self.assertIn('GT', names)
+        self.assertIn('Count', names)
+        self.assertEqual(report['repeat'], 1)
@@ -0,0 +1,108 @@
+#pylint: skip-file
+import threading
+from unittest import TestCase
+from validity.comparator import BaseComparator, GT, EQ, TypeIs, Len
+from validity.logical_operator import And, Or, Not
+from validity.cache import Cached
+from validity.blocking import set_blocking_executor, get_blocking_executor, iter_results
+
+
+class Waits(BaseComparator):
+    _condition_template = "must be greater than {operand}"
+    blocking = True
+
+    def __init__(self, operand, barrier=None):
+        super(Waits, self).__init__(operand)
+        self._barrier = barrier
+        self._lock = threading.Lock()
+        self._running = 0
+        self._max_running = 0
+        self._threads = set()
+
+    def is_valid(self, value):
+        with self._lock:
+            self._running += 1
+            self._max_running = max(self._max_running, self._running)
+            self._threads.add(threading.current_thread())
+        try:
+            if self._barrier is not None:
+                self._barrier.wait()
+            return value > self.operand
+        finally:
+            with self._lock:
+                self._running -= 1
+
+
+class ThreadOf(BaseComparator):
+
+    def __init__(self):
+        super(ThreadOf, self).__init__(None)
+        self._threads = set()
+
+    def is_valid(self, value):
+        self._threads.add(threading.current_thread())
+        return True
+
+
+class TestBlocking(TestCase):
+
+    def tearDown(self):
+        set_blocking_executor()
+
+    def test_is_blocking(self):
+        self.assertFalse(GT(5).is_blocking())
+        self.assertFalse(And(GT(5), Not(EQ(3))).is_blocking())
+        self.assertTrue(Waits(5).is_blocking())
+        self.assertTrue(Or(GT(5), Not(Waits(5))).is_blocking())
+        self.assertTrue(Len(Waits(5)).is_blocking())
+        self.assertTrue(Cached(Waits(5)).is_blocking())
+
+    def test_inline(self):
+        test = ThreadOf()
+        self.assertEqual(test.filter_values(1, 2, 3), ([1, 2, 3], []))
+        self.assertTrue(test.all_is_valid(1, 2))
+        self.assertEqual(test._threads, {threading.current_thread()})
+
+    def test_concurrent(self):
+        set_blocking_executor(max_workers=4)
+        test = Waits(5, threading.Barrier(4, timeout=5))
+        self.assertEqual(And(TypeIs(int), test).filter_values(3, 10, 7, 1), ([10, 7], [3, 1]))
+        self.assertEqual(test._max_running, 4)
+        self.assertNotIn(threading.current_thread(), test._threads)
+        self.assertTrue(test.all_is_valid(6, 7, 8, 9))
+        self.assertFalse(test.all_is_valid(6, 7, 1, 9))
+
+    def test_bounded(self):
+        set_blocking_executor(max_workers=8, max_pending=2)
+        test = Waits(5)
+        values = list(range(0, 100))
+        self.assertEqual(test.filter_values(*values), (values[6:], values[:6]))
+        self.assertLessEqual(test._max_running, 2)
+        self.assertEqual(get_blocking_executor()[1], 2)
+
+    def test_stop(self):
+        set_blocking_executor(max_workers=1, max_pending=3)
+        test = Waits(5)
+        results = iter_results(test, iter(range(0, 100)))
+        self.assertEqual(next(results), (0, False))
+        results.close()
+        self.assertFalse(test.all_is_valid(*range(0, 100)))
+
+    def test_executor(self):
+        from concurrent.futures import ThreadPoolExecutor
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            set_blocking_executor(executor, max_pending=5)
+            self.assertEqual(get_blocking_executor(), (executor, 5))
+            self.assertEqual(Waits(5).filter_values(1, 7), ([7], [1]))
+        finally:
+            set_blocking_executor()
+            executor.shutdown()
+        with self.assertRaises(ValueError):
+            set_blocking_executor(max_workers=0)
+        with self.assertRaises(ValueError):
+            set_blocking_executor(max_pending=0)
+
+    def test_error(self):
+        with self.assertRaises(TypeError):
+            Waits(5).filter_values(1, 'a', 3)
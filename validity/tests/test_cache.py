@@ -0,0 +1,96 @@
+#pylint: skip-file
+from threading import Thread
+from unittest import TestCase
+from validity.comparator import GT, EQ, Any, TypeIs, Len
+from validity.cache import Cached, CacheInfo
+from validity.tests.helpers import Counter
+
+
+class TestCached(TestCase):
+
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            Cached(42)
+        with self.assertRaises(ValueError):
+            Cached(GT(10), maxsize=0)
+        self.assertIsInstance(GT(10).cached(), Cached)
+        self.assertEqual(GT(10).cached(maxsize=5).maxsize, 5)
+
+    def test_is_valid_method(self):
+        counter = Counter(10)
+        test = counter.cached()
+        self.assertTrue(test.is_valid(20))
+        self.assertTrue(test.is_valid(20))
+        self.assertFalse(test.is_valid(5))
+        self.assertEqual(counter.calls, 2)
+        self.assertEqual(test.cache_info(), CacheInfo(hits=1, misses=2, evictions=0, maxsize=1024, currsize=2))
+
+    def test_value_types(self):
+        test = TypeIs(int).cached()
+        self.assertTrue(test.is_valid(1))
+        self.assertFalse(test.is_valid(True))
+        self.assertFalse(test.is_valid(1.0))
+
+    def test_unhashable_values(self):
+        counter = Counter([1])
+        test = counter.cached()
+        self.assertTrue(test.is_valid([2]))
+        self.assertTrue(test.is_valid([2]))
+        self.assertEqual(counter.calls, 2)
+        self.assertEqual(test.cache_info().currsize, 0)
+
+    def test_eviction(self):
+        counter = Counter(10)
+        test = counter.cached(maxsize=2)
+        test(1)
+        test(2)
+        test(1)
+        test(3)
+        self.assertEqual(test.cache_info(), CacheInfo(hits=1, misses=3, evictions=1, maxsize=2, currsize=2))
+        test(1)
+        self.assertEqual(counter.calls, 3)
+        test(2)
+        self.assertEqual(counter.calls, 4)
+
+    def test_cache_clear_method(self):
+        test = GT(10).cached()
+        test(1)
+        test(1)
+        test.cache_clear()
+        self.assertEqual(test.cache_info(), CacheInfo(hits=0, misses=0, evictions=0, maxsize=1024, currsize=0))
+
+    def test_changed_validator(self):
+        limit = GT(5)
+        test = Cached(Len(limit))
+        self.assertTrue(test.is_valid('abcdef'))
+        limit.operand = 10
+        self.assertFalse(test.is_valid('abcdef'))
+        test.validator = EQ('abcdef')
+        self.assertTrue(test.is_valid('abcdef'))
+        self.assertEqual(test.cache_info().currsize, 1)
+        self.assertEqual(test.cache_info().misses, 3)
+
+    def test_get_error_method(self):
+        test = (GT(10) | EQ(0)).cached()
+        self.assertIsNone(test.get_error(20))
+        self.assertEqual(test.get_error(5), '(must be greater than 10) OR (must be equal to 0)')
+        self.assertEqual(str(Len(EQ(2)) & test), '(length must be equal to 2) AND ((must be greater than 10) OR (must be equal to 0))')
+
+    def test_threads(self):
+        test = Any(*range(0, 100)).cached(maxsize=50)
+        errors = []
+
+        def check():
+            for value in range(0, 300):
+                if test.is_valid(value) != (value < 100):
+                    errors.append(value)
+
+        threads = [Thread(target=check) for _ in range(0, 8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        info = test.cache_info()
+        self.assertEqual(info.hits + info.misses, 8 * 300)
+        self.assertEqual(info.currsize, 50)
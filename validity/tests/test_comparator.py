@@ -1,6 +1,21 @@
 #pylint: skip-file
+import itertools
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Number
 from unittest import TestCase
-from validity.comparator import BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, TypeIs, IsNone, Len, Count
+from validity.comparator import BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, TypeIs, IsNone, Len, Count, \
+    MembershipIndex, InIntervals, TypeIndex
+from validity.interval import IntervalSet
+from validity.logical_operator import Or, And, Not
+
+
+class IsDividableFor(BaseComparator):
+    _condition_template = "value must be dividable by {operand}"
+
+    def is_valid(self, value):
+        return value % self.operand == 0
 
 
 class TestBaseComparator(TestCase):
@@ -174,6 +189,41 @@ class TestAny(TestCase):
         self.assertTrue(Any(10, 42).is_valid(42))
         self.assertFalse(Any(10, 42).is_valid(0))
 
+    def test_is_valid_method_with_index(self):
+        allowed_values = list(range(0, 1000)) + [2000, 'a', (1, 2), [1, 2], 10.5]
+        test = Any(allowed_values)
+        for value in [0, 999, 1000, 2000, 1999, -1, 10.5, 10.0, True, 'a', 'b', (1, 2), [1, 2], [1], None]:
+            self.assertEqual(test.is_valid(value), value in allowed_values)
+
+    def test_operand_replace(self):
+        test = Any(1, 2, 3)
+        self.assertFalse(test.is_valid(4))
+        test.operand = [4, 5]
+        self.assertTrue(test.is_valid(4))
+        self.assertFalse(test.is_valid(1))
+        self.assertEqual(test.operand, [4, 5])  # operand is not replaced by index
+        self.assertIs(test.get_index(), test.get_index())
+
+
+class TestMembershipIndex(TestCase):
+
+    def test_constructor(self):
+        index = MembershipIndex((1, 2, 3, 5, 6, 7, 8, 9, 10, 'a', [1]))
+        self.assertEqual(index.ranges, ((1, 3), (5, 10)))
+        self.assertEqual(index.hashable, frozenset(['a']))
+        self.assertEqual(index.unhashable, ([1], ))
+
+        index = MembershipIndex((1, 3, 5, 7))
+        self.assertEqual(index.ranges, ())
+        self.assertEqual(index.hashable, frozenset([1, 3, 5, 7]))
+
+    def test_contains(self):
+        values = (1, 2, 3, 5, 6, 7, 8, 9, 10, 'a', [1], 2.5, (1, [2]))
+        index = MembershipIndex(values)
+        for value in [0, 1, 3, 4, 5, 10, 11, 1.0, 1.5, 2.5, True, False, 'a', '1', [1], [2], (1, [2]),
+                      None, float('nan'), float('inf')]:
+            self.assertEqual(value in index, value in values, msg=repr(value))
+
 
 class TestBetween(TestCase):
 
@@ -200,6 +250,44 @@ class TestBetween(TestCase):
         self.assertFalse(Between(10, 42).is_valid(50))
 
 
+class TestInIntervals(TestCase):
+
+    def test_constructor(self):
+        with self.assertRaises(TypeError):
+            InIntervals()
+        with self.assertRaises(TypeError):
+            InIntervals([(1, 2)])
+        with self.assertRaises(ValueError):
+            InIntervals(IntervalSet(), 1)
+        self.assertIsNone(InIntervals(IntervalSet()).other)
+
+    def test_get_condition_text_method(self):
+        self.assertEqual(InIntervals(IntervalSet.between(1, 2) | IntervalSet.greater(5)).get_condition_text(),
+                         'must be in [1, 2] or (5, +inf)')
+
+    def test_is_valid_method(self):
+        test = InIntervals(IntervalSet.between(1, 2) | IntervalSet.greater(5))
+        self.assertTrue(test.is_valid(1))
+        self.assertTrue(test.is_valid(1.5))
+        self.assertTrue(test.is_valid(6))
+        self.assertFalse(test.is_valid(0))
+        self.assertFalse(test.is_valid(3))
+        self.assertFalse(test.is_valid(5))
+        self.assertFalse(test.is_valid(float('nan')))
+
+    def test_other(self):
+        intervals = IntervalSet.between(1, 2)
+        self.assertRaises(TypeError, InIntervals(intervals).is_valid, 'a')
+        self.assertTrue(InIntervals(intervals, True).is_valid('a'))
+        self.assertFalse(InIntervals(intervals, False).is_valid(None))
+        self.assertTrue(InIntervals(intervals, False).is_valid(1))
+        self.assertEqual(InIntervals(intervals, True).get_condition_text(), 'must be in [1, 2] (or not a number)')
+        self.assertNotEqual(InIntervals(intervals, True), InIntervals(intervals))
+        self.assertEqual(InIntervals(intervals, False), InIntervals(intervals, False))
+        compiled = InIntervals(intervals, True).compile()
+        self.assertEqual([compiled(value) for value in ('a', 1, 3)], [True, True, False])
+
+
 class TestTypeIs(TestCase):
 
     def test_constructor(self):
@@ -214,10 +302,22 @@ class TestTypeIs(TestCase):
 
         self.assertEqual(TypeIs(int).operand, int)
         self.assertEqual(TypeIs(str).operand, str)
+        self.assertEqual(TypeIs(int, int).operand, int)
+        self.assertEqual(TypeIs(int, str, int).operand, (int, str))
+        self.assertFalse(TypeIs(int).subclasses)
+        self.assertTrue(TypeIs(int, subclasses=1).subclasses)
+
+        with self.assertRaises(TypeError):
+            TypeIs(int, 2)
+
+        with self.assertRaises(TypeError):
+            TypeIs(int, exact=True)
 
     def test_get_condition_text_method(self):
         self.assertEqual(TypeIs(int).get_condition_text(), 'must be int')
         self.assertEqual(TypeIs(str).get_condition_text(), 'must be str')
+        self.assertEqual(TypeIs(str, int).get_condition_text(), 'must be str or int')
+        self.assertEqual(TypeIs(Number, subclasses=True).get_condition_text(), 'must be instance of Number')
 
     def test_is_valid_method(self):
         self.assertTrue(TypeIs(int).is_valid(42))
@@ -231,6 +331,56 @@ class TestTypeIs(TestCase):
         self.assertFalse(TypeIs(str).is_valid(42))
         self.assertFalse(TypeIs(tuple).is_valid(42))
         self.assertFalse(TypeIs(tuple).is_valid([0, 42]))
+
+    def test_many_types(self):
+        test = TypeIs(int, float, Decimal)
+        for value in [1, 1.5, Decimal(1), True, '1', None, Fraction(1, 2)]:
+            self.assertEqual(test.is_valid(value), type(value) in (int, float, Decimal), msg=value)
+        self.assertEqual(test.get_types(), (int, float, Decimal))
+        self.assertEqual(TypeIs(int).get_types(), (int, ))
+
+    def test_subclasses(self):
+        test = TypeIs(Number, str, subclasses=True)
+        for _ in range(2):  # second time results are cached
+            for value in [1, 1.5, Decimal(1), True, '1', None, Fraction(1, 2), [], b'1']:
+                self.assertEqual(test.is_valid(value), isinstance(value, (Number, str)), msg=value)
+        self.assertTrue(TypeIs(int, subclasses=True).is_valid(True))
+        self.assertFalse(TypeIs(int).is_valid(True))
+
+        class SmallIndex(TypeIndex):
+            __slots__ = ()
+            max_cached_types = 2
+
+        index = SmallIndex(int, subclasses=True)
+        self.assertEqual([value_type in index for value_type in (int, bool, str, float, bool)],
+                         [True, True, False, False, True])
+        self.assertLessEqual(len(index._results), 2)
+
+    def test_index(self):
+        test = TypeIs(int, str)
+        self.assertIs(test.get_index(), test.get_index())
+        test.operand = (float, )
+        self.assertTrue(test.is_valid(1.5))
+        self.assertFalse(test.is_valid(1))
+        test.subclasses = True
+        self.assertTrue(test.get_index().subclasses)
+        restored = pickle.loads(pickle.dumps(TypeIs(int, str)))
+        self.assertTrue(restored.is_valid('a'))
+        self.assertFalse(restored.is_valid(1.5))
+
+    def test_structure(self):
+        self.assertEqual(TypeIs(int, str), TypeIs(int, str))
+        self.assertEqual(hash(TypeIs(int, str)), hash(TypeIs(int, str)))
+        # order of types is shown in condition text
+        self.assertNotEqual(TypeIs(int, str), TypeIs(str, int))
+        self.assertNotEqual(TypeIs(int), TypeIs(int, subclasses=True))
+        self.assertNotEqual(TypeIs(int), TypeIs(int, str))
+
+    def test_compile(self):
+        for test in (TypeIs(int), TypeIs(int, str), TypeIs(Number, subclasses=True)):
+            compiled = test.compile()
+            for value in [1, 1.5, True, '1', None]:
+                self.assertEqual(compiled(value), test.is_valid(value))
         self.assertFalse(TypeIs(list).is_valid((0, 42,)))
 
 
@@ -296,3 +446,76 @@ class TestCount(TestCase):
         self.assertEqual(Count(Between(1, 50)).get_condition_text(), 'items count must be between 1 and 50')
         self.assertEqual(Count(GT(1).and_valid(LT(10))).get_condition_text(),
                          'items count (must be greater than 1) AND (must be less than 10)')
+
+    def test_iterables(self):
+        consumed = []
+
+        def items(count):
+            for item in range(0, count):
+                consumed.append(item)
+                yield item
+
+        for validator in (Count(LT(5)), Count(Between(2, 5)), Count(GT(3)), Len(Or(LT(2), EQ(4))), Count(Not(EQ(3))),
+                          Count(IsDividableFor(2)), Count(And(GT(10), LT(5)))):
+            for count in range(0, 9):
+                del consumed[:]
+                self.assertEqual(validator.is_valid(items(count)), validator.is_valid(list(range(0, count))),
+                                 msg=(str(validator), count))
+                self.assertEqual(validator.compile()(items(count)), validator.is_valid(list(range(0, count))))
+        self.assertFalse(Count(LT(5)).is_valid(itertools.count()))
+        self.assertTrue(Count(GTE(5)).is_valid(itertools.count()))
+        self.assertFalse(Count(LT(5)).is_valid(42))
+        self.assertTrue(Len(EQ(2)).is_valid(iter('ab')))
+
+        del consumed[:]
+        self.assertFalse(Count(LT(5)).is_valid(items(100)))
+        self.assertEqual(len(consumed), 5)
+        del consumed[:]
+        self.assertTrue(Count(GT(5)).is_valid(items(100)))
+        self.assertEqual(len(consumed), 6)
+        del consumed[:]
+        self.assertTrue(Count(IsDividableFor(2)).is_valid(items(100)))
+        self.assertEqual(len(consumed), 100)
+
+    def test_count_limit(self):
+        self.assertEqual(Count(LT(5)).get_count_limit(), (5, False))
+        self.assertEqual(Count(LTE(5)).get_count_limit(), (6, False))
+        self.assertEqual(Count(GT(5.5)).get_count_limit(), (6, True))
+        self.assertEqual(Count(GTE(-3)).get_count_limit(), (0, True))
+        self.assertEqual(Count(Or(LT(3), GT(10))).get_count_limit(), (11, True))
+        self.assertEqual(Count(LT(-1)).get_count_limit(), (0, False))
+        self.assertIsNone(Count(TypeIs(int)).get_count_limit())
+        validator = Count(LT(5))
+        validator.operand = GT(2)
+        self.assertEqual(validator.get_count_limit(), (3, True))
+        str(validator)  # changes of rendered validators are tracked
+        validator.operand.operand = 7
+        self.assertEqual(validator.get_count_limit(), (8, True))
+        restored = pickle.loads(pickle.dumps(validator))
+        self.assertEqual(restored.get_count_limit(), (8, True))
+
+    def test_count_limit_follows_changes(self):
+        validator = Count(LT(5))
+        self.assertFalse(validator.is_valid(iter(range(10))))
+        validator.operand.operand = 100  # validator is not rendered or hashed
+        self.assertEqual(validator.get_count_limit(), (100, False))
+        self.assertTrue(validator.is_valid(iter(range(10))))
+        self.assertEqual(validator.is_valid(iter(range(10))), validator.is_valid(list(range(10))))
+        validator.operand = Or(LT(2), GT(20))
+        self.assertFalse(validator.is_valid(iter(range(10))))
+        validator.operand.operands = (LT(20), )
+        self.assertTrue(validator.is_valid(iter(range(10))))
+
+    def test_tee(self):
+        valid, items = Count(LT(5)).tee(iter(range(0, 10)))
+        self.assertFalse(valid)
+        self.assertEqual(list(items), list(range(0, 10)))
+        valid, items = Count(Between(1, 5)).tee(x * 2 for x in range(0, 3))
+        self.assertTrue(valid)
+        self.assertEqual(list(items), [0, 2, 4])
+        value = [1, 2]
+        self.assertEqual(Count(LT(5)).tee(value), (True, value))
+        self.assertEqual(Count(LT(5)).tee(42), (False, 42))
+        valid, items = Count(GT(2)).tee(itertools.count())
+        self.assertTrue(valid)
+        self.assertEqual(list(itertools.islice(items, 0, 5)), [0, 1, 2, 3, 4])
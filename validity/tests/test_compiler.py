@@ -0,0 +1,91 @@
+#pylint: skip-file
+from unittest import TestCase
+from validity.comparator import BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, TypeIs, IsNone, Len, Count
+from validity.logical_operator import Base, Or, And, Not
+from validity.compiler import Compiler
+
+
+VALUES = [None, -10, 0, 5, 10, 15, 20, 42, 100, 10.5, '', '42', 'forty two', [], [1, 2], (1, 2, 3), {}]
+
+
+class IsDividableFor(BaseComparator):
+    _condition_template = "value must be dividable by {operand}"
+
+    def is_valid(self, value):
+        return value % self.operand == 0
+
+
+class StrictGT(GT):
+
+    def is_valid(self, value):
+        return type(value) is int and value > self.operand
+
+
+class TestCompiler(TestCase):
+
+    def assertSameResults(self, validator, values):
+        compiled = validator.compile()
+        for value in values:
+            self.assertEqual(compiled(value), validator.is_valid(value), msg="{0!r} for {1}".format(value, validator))
+
+    def test_bind(self):
+        compiler = Compiler()
+        name = compiler.bind(42)
+        self.assertEqual(compiler.namespace[name], 42)
+        self.assertNotEqual(compiler.bind(42), name)
+
+    def test_comparators(self):
+        numbers = [-10, 0, 5, 10, 15, 20, 42, 100, 10.5]
+        for comparator in [GT, GTE, LT, LTE, EQ, NotEQ]:
+            self.assertSameResults(comparator(10), numbers)
+        self.assertSameResults(EQ('42'), VALUES)
+        self.assertSameResults(NotEQ('42'), VALUES)
+        self.assertSameResults(Between(5, 20), numbers)
+        self.assertSameResults(TypeIs(int), VALUES)
+        self.assertSameResults(TypeIs(str), VALUES)
+        self.assertSameResults(IsNone(), VALUES)
+
+    def test_any(self):
+        self.assertSameResults(Any(0, 42, '42', [1, 2]), VALUES)
+
+    def test_len(self):
+        self.assertSameResults(Len(Between(1, 2)), VALUES)
+        self.assertSameResults(Count(EQ(3) | EQ(0)), VALUES)
+        self.assertSameResults(Len(Len(EQ(2))), VALUES)
+
+    def test_logical_operators(self):
+        numbers = range(0, 50)
+        self.assertSameResults(Or(GT(40), LT(5), EQ(20)), numbers)
+        self.assertSameResults(And(GT(5), LT(40), NotEQ(20)), numbers)
+        self.assertSameResults(Not(Between(10, 20)), numbers)
+        self.assertSameResults(And(Between(9, 18), Not(Between(13, 15))).or_valid(EQ(14)), numbers)
+        self.assertSameResults(And(TypeIs(int), GT(5)), [3, 10, 10.5, True])
+
+    def test_logical_operators_return_bool(self):
+        class Truthy(BaseComparator):
+            def is_valid(self, value):
+                return value
+
+        for validator in [Or(Truthy(None), Truthy(None)), And(Truthy(None), Truthy(None))]:
+            compiled = validator.compile()
+            self.assertIs(compiled(42), validator.is_valid(42))
+            self.assertIs(compiled(0), validator.is_valid(0))
+
+    def test_custom_comparator(self):
+        self.assertSameResults(IsDividableFor(3), range(0, 20))
+        self.assertSameResults(IsDividableFor(2) | And(IsDividableFor(3), NotEQ(9)), range(0, 20))
+
+    def test_overridden_is_valid(self):
+        self.assertSameResults(StrictGT(10), [5, 10, 15, 15.5, True])
+        self.assertNotIn('>', StrictGT(10).compile().source)
+
+    def test_not_implemented(self):
+        with self.assertRaises(NotImplementedError):
+            Base().compile()(42)
+
+    def test_operands_are_bound(self):
+        validator = GT(10)
+        compiled = validator.compile()
+        validator.operand = 100
+        self.assertTrue(compiled(50))
+        self.assertEqual(compiled.__doc__, 'must be greater than 10')
@@ -0,0 +1,194 @@
+#pylint: skip-file
+from unittest import TestCase
+import random
+from validity.comparator import BaseComparator, GT, LT, EQ, Any, TypeIs, Len
+from validity.logical_operator import _MISSING, And, Or, Not
+from validity.cache import Cached
+from validity.error import Error, Explanation
+
+
+class Renders(BaseComparator):
+    _condition_template = "must be greater than {operand}"
+
+    def __init__(self, operand):
+        super(Renders, self).__init__(operand)
+        self._rendered = 0
+
+    def get_condition_text(self):
+        self._rendered += 1
+        return super(Renders, self).get_condition_text()
+
+    def is_valid(self, value):
+        return value > self.operand
+
+
+class TestError(TestCase):
+
+    def tearDown(self):
+        Error.max_length = None
+
+    def test_get_error_lazy(self):
+        test = And(GT(0), Renders(10))
+        self.assertIsNone(test.get_error(20, lazy=True))
+        error = test.get_error(5, lazy=True)
+        self.assertIsInstance(error, Error)
+        self.assertIs(error.validator, test)
+        self.assertEqual(error.value, 5)
+        self.assertEqual(test.operands[1]._rendered, 0)
+        self.assertEqual(str(error), test.get_error(5))
+        self.assertEqual(str(error), "(must be greater than 0) AND (must be greater than 10)")
+        self.assertIn("value=5", repr(error))
+
+    def test_rendered_once(self):
+        test = Renders(10)
+        errors = [test.get_error(value, lazy=True) for value in range(0, 10)]
+        self.assertEqual(test._rendered, 0)
+        self.assertEqual(set(str(error) for error in errors), {"must be greater than 10"})
+        self.assertEqual(test._rendered, 1)
+
+    def test_max_length(self):
+        error = Any(list(range(0, 100000))).get_error(-1, lazy=True)
+        self.assertEqual(error.get_text(max_length=20), "must be any of (0...")
+        self.assertEqual(len(error.get_text(max_length=20)), 20)
+        self.assertEqual(error.get_text(max_length=2), "..")
+        self.assertTrue(str(error).endswith("99999)"))
+        Error.max_length = 30
+        self.assertEqual(len(str(error)), 30)
+        self.assertEqual(error.get_text(max_length=1000000000), error.validator.get_condition_text())
+        self.assertEqual(GT(10).get_error(5, lazy=True).get_text(), "must be greater than 10")
+
+    def test_max_length_renders_prefix(self):
+        test = Any(list(range(0, 100000)))
+        self.assertEqual(test.get_error(-1, lazy=True).get_text(max_length=20), "must be any of (0...")
+        self.assertIs(test._get_cached('text'), _MISSING)
+        self.assertLess(len(test.get_limited_condition_text(20)), 40)
+        self.assertEqual(test.get_limited_condition_text(1000000000), test.get_condition_text())
+
+        class Custom(Any):
+            def get_condition_text(self):
+                return "custom"
+
+        self.assertEqual(Custom(1, 2, 3).get_limited_condition_text(1), "custom")
+
+    def test_max_length_of_operators(self):
+        large = Any(list(range(0, 100000)))
+        self.assertTrue(And(GT(0), large).get_error(-1, lazy=True).get_text(40).endswith('...'))
+        self.assertIs(large._get_cached('text'), _MISSING)
+        validators = [And(GT(0), Or(EQ(5), large)), Not(Or(large, EQ('a'))), Or(Not(GT(1)), large, Renders(3)),
+                      And(TypeIs(int), Len(LT(2)), Cached(large))]
+        for validator in validators:
+            full = validator.get_condition_text()
+            for max_length in [0, 1, 5, 20, 30, 45, 60, 100, len(full) - 1, len(full), 10 ** 6]:
+                limited = validator.get_limited_condition_text(max_length)
+                self.assertTrue(limited == full or (len(limited) > max_length
+                                                    and limited[:max_length] == full[:max_length]), limited)
+                self.assertEqual(Error(validator, None).get_text(max_length), self._truncate(full, max_length))
+
+    def _truncate(self, text, max_length):
+        if len(text) <= max_length:
+            return text
+        return text[:max_length - 3] + '...' if max_length > 3 else '...'[:max_length]
+
+    def test_cached(self):
+        test = Cached(GT(10))
+        error = test.get_error(5, lazy=True)
+        self.assertIs(error.validator, test)
+        self.assertEqual(str(error), "must be greater than 10")
+        self.assertIsNone(test.get_error(20, lazy=True))
+
+
+class TestAnyMaxTextValues(TestCase):
+
+    def test_instance(self):
+        test = Any(1, 2, 3, 4, 5)
+        self.assertEqual(str(test), "must be any of (1, 2, 3, 4, 5)")
+        test.max_text_values = 2
+        self.assertEqual(str(test), "must be any of (1, 2, ... 3 more)")
+        self.assertEqual(test.get_error(0), "must be any of (1, 2, ... 3 more)")
+        test.max_text_values = 5
+        self.assertEqual(str(test), "must be any of (1, 2, 3, 4, 5)")
+
+    def test_default(self):
+        test = Any(1, 2)
+        self.assertIsNone(test.max_text_values)
+        self.assertEqual(test.__getstate__(), {'operand': (1, 2)})
+        test.max_text_values = 1
+        self.assertEqual(test.__getstate__(), {'operand': (1, 2), 'max_text_values': 1})
+        self.assertEqual(Any('a', 'b', 'c').get_error('d', lazy=True).get_text(), "must be any of (a, b, c)")
+        self.assertRaises(AttributeError, getattr, test, 'other')
+
+
+class Counted(GT):
+    calls = [0]
+
+    def is_valid(self, value):
+        Counted.calls[0] += 1
+        return value > self.operand
+
+
+class StrictOr(Or):
+
+    def is_valid(self, value):
+        return all(operand.is_valid(value) for operand in self.operands)
+
+
+def random_tree(rnd, depth):
+    if depth == 0 or rnd.random() < 0.3:
+        return rnd.choice([GT, LT, EQ, Counted])(rnd.randint(0, 5))
+    operator = rnd.choice([And, Or, Not])
+    if operator is Not:
+        return Not(random_tree(rnd, depth - 1))
+    return operator(*[random_tree(rnd, depth - 1) for _ in range(rnd.randint(1, 3))])
+
+
+class TestExplanation(TestCase):
+
+    def test_and(self):
+        test = And(TypeIs(int), Or(LT(0), GT(10)), Not(EQ(42)))
+        explanation = test.explain(5)
+        self.assertIsInstance(explanation, Explanation)
+        self.assertFalse(explanation.valid)
+        self.assertEqual(explanation.get_texts(), ['must be less than 0', 'must be greater than 10'])
+        self.assertEqual([error.validator for error in explanation.get_errors()], list(test.operands[1].operands))
+        self.assertEqual(str(test.explain('a')), 'must be int')
+        self.assertEqual(str(test.explain(42)), 'NOT(must be equal to 42)')
+        self.assertEqual(repr(test.explain(42)), '<Explanation value=42 valid=False reasons=1>')
+
+    def test_valid(self):
+        test = And(TypeIs(int), Or(LT(0), GT(10)))
+        explanation = test.explain(20)
+        self.assertTrue(explanation.valid)
+        self.assertEqual(explanation.get_errors(), [])
+        self.assertEqual(str(explanation), '')
+        self.assertEqual([validator for validator, _ in explanation.reasons], [test.operands[0], test.operands[1].operands[1]])
+
+    def test_negated(self):
+        test = Not(And(GT(0), LT(10)))
+        self.assertEqual(test.explain(5).get_texts(), ['NOT(must be greater than 0)', 'NOT(must be less than 10)'])
+        self.assertEqual(test.explain(5).reasons, [(test.operands[0].operands[0], True), (test.operands[0].operands[1], True)])
+        self.assertEqual(Not(Not(GT(5))).explain(1).get_texts(), ['must be greater than 5'])
+        self.assertEqual(Not(Or(GT(5), Not(LT(3)))).explain(4).get_texts(), ['must be less than 3'])
+
+    def test_leaves(self):
+        test = And(Len(GT(2)), Cached(Or(EQ('abc'), EQ('def'))))
+        self.assertEqual(test.explain('ab').get_texts(), ['length must be greater than 2'])
+        self.assertEqual(test.explain('abcd').get_texts(), ['(must be equal to `abc`) OR (must be equal to `def`)'])
+        test = And(GT(0), StrictOr(GT(2), LT(5)))
+        self.assertEqual(test.explain(1).get_texts(), ['(must be greater than 2) OR (must be less than 5)'])
+        self.assertEqual(test.explain(1).get_errors()[0].get_text(max_length=10), '(must b...')
+
+    def test_random_trees(self):
+        rnd = random.Random(19)
+        for _ in range(300):
+            validator = random_tree(rnd, 4)
+            for value in range(-1, 7):
+                Counted.calls[0] = 0
+                expected = bool(validator.is_valid(value))
+                calls = Counted.calls[0]
+                Counted.calls[0] = 0
+                explanation = validator.explain(value)
+                self.assertEqual(explanation.valid, expected)
+                self.assertLessEqual(Counted.calls[0], calls)
+                self.assertTrue(explanation.reasons)
+                for leaf, negated in explanation.reasons:
+                    self.assertEqual(bool(leaf.is_valid(value)), expected != negated)
@@ -0,0 +1,189 @@
+#pylint: skip-file
+import gc
+from unittest import TestCase
+from validity.comparator import BaseComparator, GT, LT, EQ, Any, Between, InIntervals, TypeIs, IsNone, Len, Count
+from validity.interval import IntervalSet
+from validity.logical_operator import Base, And, Or, Not, get_structure
+from validity.cache import Cached
+from validity.intern import InternPool, Shared
+from validity.tests.helpers import Counter
+
+
+class Custom(Base):
+
+    def is_valid(self, value):
+        return True
+
+
+class Near(BaseComparator):
+    _condition_template = "must be near {operand}"
+
+    def __init__(self, operand, tol):
+        super(Near, self).__init__(operand)
+        self.tol = tol
+
+    def is_valid(self, value):
+        return abs(value - self.operand) <= self.tol
+
+
+class Between5(GT):
+
+    def is_valid(self, value):
+        return self.operand < value < 5
+
+
+class TestStructuralEquality(TestCase):
+
+    def test_comparators(self):
+        self.assertEqual(GT(5), GT(5))
+        self.assertNotEqual(GT(5), GT(6))
+        self.assertNotEqual(GT(5), LT(5))
+        self.assertNotEqual(EQ(1), EQ(True))
+        self.assertEqual(Any(1, 2, 3), Any([1, 2, 3]))
+        self.assertEqual(Between(1, 5), Between(1, 5))
+        self.assertNotEqual(Between(1, 5), Between(1, 6))
+        # types of nested operand items are compared too
+        self.assertNotEqual(Between(1, 2), Between(1.0, 2.0))
+        self.assertNotEqual(Any(1, 2), Any(1.0, 2.0))
+        self.assertNotEqual(Any(True), Any(1))
+        self.assertNotEqual(Any((1, 2)), Any((1.0, 2.0)))
+        self.assertNotEqual(InIntervals(IntervalSet.greater(1)), InIntervals(IntervalSet.greater(1.0)))
+        self.assertNotEqual(hash(Any(1, 2)), hash(Any(1.0, 2.0)))
+        self.assertEqual(TypeIs(int), TypeIs(int))
+        self.assertNotEqual(TypeIs(int), TypeIs(bool))
+        self.assertEqual(IsNone(), IsNone())
+        self.assertNotEqual(IsNone(), IsNone("custom"))
+        self.assertEqual(Len(GT(5)), Len(GT(5)))
+        self.assertNotEqual(Len(GT(5)), Count(GT(5)))
+        self.assertNotEqual(GT(5), 5)
+        self.assertFalse(GT(5) != GT(5))
+
+    def test_logical_operators(self):
+        self.assertEqual(And(TypeIs(int), GT(5)), TypeIs(int) & GT(5))
+        self.assertNotEqual(And(TypeIs(int), GT(5)), And(GT(5), TypeIs(int)))
+        self.assertNotEqual(And(GT(5)), Or(GT(5)))
+        self.assertEqual(Not(EQ(5)), ~EQ(5))
+        self.assertNotEqual(Or(GT(5), LT(0)), Or(GT(5), LT(0), adaptive=True))
+
+    def test_identity(self):
+        self.assertEqual(Counter(5), Counter(5))
+        self.assertNotEqual(Custom(), Custom())
+        self.assertNotEqual(Cached(GT(5)), Cached(GT(5)))
+        test = Cached(GT(5))
+        self.assertEqual(test, test)
+        self.assertEqual(len({Cached(GT(5)), Cached(GT(5))}), 2)
+
+    def test_not_inherited(self):
+        self.assertNotEqual(Near(5, tol=1), Near(5, tol=10))
+        self.assertNotEqual(Near(5, tol=1), Near(5, tol=1))
+        self.assertNotEqual(Between5(1), Between5(1))
+        self.assertNotEqual(Between5(1), GT(1))
+        self.assertIsNone(get_structure(Near(5, tol=1)))
+        self.assertEqual(get_structure(GT(1)), GT(1).get_structure())
+        pool = InternPool()
+        near = pool.intern(Near(5, tol=1))
+        self.assertIsNot(pool.intern(Near(5, tol=10)), near)
+        self.assertTrue(pool.intern(Or(Near(5, tol=1), Near(5, tol=10))).is_valid(12))
+
+    def test_hash(self):
+        self.assertEqual(hash(GT(5)), hash(GT(5)))
+        self.assertEqual(hash(Or(GT(5), Len(EQ(2)))), hash(Or(GT(5), Len(EQ(2)))))
+        self.assertEqual(len({GT(5), GT(5), GT(6), And(GT(5)), And(GT(5))}), 3)
+        self.assertEqual(len({EQ([1, 2]), EQ([1, 2]), EQ([1, 3])}), 2)
+        self.assertEqual(hash(EQ([1, 2])), hash(EQ([1, 3])))
+
+    def test_changed_operand(self):
+        test = GT(5)
+        first = hash(test)
+        test.operand = 6
+        self.assertEqual(hash(test), hash(GT(6)))
+        self.assertNotEqual(hash(test), first)
+        self.assertEqual(test, GT(6))
+
+
+class TestInternPool(TestCase):
+
+    def test_intern(self):
+        pool = InternPool()
+        rule_1 = pool.intern(And(TypeIs(int), GT(5), LT(10)))
+        rule_2 = pool.intern(Or(And(TypeIs(int), GT(5), LT(10)), GT(5)))
+        self.assertIs(rule_2.operands[0], rule_1)
+        self.assertIs(rule_2.operands[1], rule_1.operands[1])
+        self.assertIs(pool.intern(GT(5)), rule_1.operands[1])
+        self.assertIs(pool.intern(rule_2), rule_2)
+        self.assertEqual(len(pool), 5)
+        self.assertEqual(str(rule_2), "((must be int) AND (must be greater than 5) AND (must be less than 10)) "
+                                      "OR (must be greater than 5)")
+        for value in (0, 7, 7.5, 20):
+            self.assertEqual(rule_2.is_valid(value), value > 5)
+
+    def test_intern_keeps_text(self):
+        pool = InternPool()
+        pool.intern(Between(1, 2))
+        self.assertEqual(str(pool.intern(Between(1.0, 2.0))), "must be between 1.0 and 2.0")
+        pool.intern(TypeIs(int, str))
+        self.assertEqual(str(pool.intern(TypeIs(str, int))), "must be str or int")
+
+    def test_nested_in_identity_nodes(self):
+        pool = InternPool()
+        first = pool.intern(Cached(Len(EQ(2))))
+        second = pool.intern(Cached(Len(EQ(2))))
+        self.assertIsNot(first, second)
+        self.assertIs(first.validator, second.validator)
+        self.assertTrue(first.is_valid("ab"))
+
+    def test_unhashable(self):
+        pool = InternPool()
+        test = EQ([1, 2])
+        self.assertIs(pool.intern(test), test)
+        self.assertEqual(len(pool), 0)
+        rule = pool.intern(And(EQ([1, 2]), GT(5)))
+        self.assertIs(pool.intern(And(EQ([1, 2]), GT(5))), rule)
+        self.assertEqual(len(pool), 2)
+
+    def test_adaptive_kept(self):
+        pool = InternPool()
+        test = pool.intern(Or(Len(EQ(1)), Len(EQ(2)), adaptive=10))
+        self.assertEqual(test.adaptive, 10)
+        self.assertIs(test.operands[0].operand, pool.intern(EQ(1)))
+
+    def test_weak_references(self):
+        pool = InternPool()
+        rule = pool.intern(And(GT(5), LT(10)))
+        self.assertEqual(len(pool), 3)
+        del rule
+        gc.collect()
+        self.assertEqual(len(pool), 0)
+        pool.intern(GT(5))
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+
+
+class TestShared(TestCase):
+
+    def test_evaluate(self):
+        pool = InternPool(share_results=True)
+        counter = Counter(5)
+        rules = [pool.intern(Or(And(counter, LT(10)), EQ(index))) for index in range(0, 20)]
+        self.assertIsInstance(rules[0], Shared)
+        self.assertIs(rules[0].validator.operands[0], rules[1].validator.operands[0])
+        self.assertIsInstance(rules[0].validator.operands[0], Shared)
+
+        results = pool.evaluate(rules, 7)
+        self.assertEqual(results, [True] * 20)
+        self.assertEqual(counter.calls, 1)
+        results = pool.evaluate(rules, 3)
+        self.assertEqual(results, [index == 3 for index in range(0, 20)])
+        self.assertEqual(counter.calls, 2)
+
+        self.assertTrue(rules[0].is_valid(7))
+        self.assertTrue(rules[1].is_valid(7))
+        self.assertEqual(counter.calls, 4)
+        self.assertIsNone(pool.round)
+
+    def test_text(self):
+        pool = InternPool(share_results=True)
+        test = pool.intern(Not(And(GT(5), LT(10))))
+        self.assertEqual(str(test), "NOT((must be greater than 5) AND (must be less than 10))")
+        self.assertEqual(test.get_error(7), "NOT((must be greater than 5) AND (must be less than 10))")
+        self.assertEqual(test.filter_values(*range(0, 12)), ([0, 1, 2, 3, 4, 5, 10, 11], [6, 7, 8, 9]))
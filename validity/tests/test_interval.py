@@ -0,0 +1,208 @@
+#pylint: skip-file
+import random
+from decimal import Decimal
+from unittest import TestCase
+from validity.comparator import BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, TypeIs, Len, InIntervals
+from validity.logical_operator import Or, And, Not
+from validity.interval import IntervalSet, is_orderable, is_number, get_intervals, get_other_result
+
+
+NAN = float('nan')
+INF = float('inf')
+VALUES = [-INF, -100, -1, 0, 0.5, 1, 2, 3, 4, 4.5, 5, 6, 9, 10, 10.5, 11, 20, 100, INF, NAN]
+OTHER_VALUES = ['a', None, (1, )]
+
+
+class StrictGT(GT):
+
+    def is_valid(self, value):
+        return value > self.operand + 1
+
+
+def random_tree(rnd, depth):
+    if depth == 0 or rnd.random() < 0.3:
+        comparator = rnd.choice([GT, GTE, LT, LTE, EQ, NotEQ, Between])
+        if comparator is Between:
+            return Between(rnd.randint(-5, 15), rnd.randint(-5, 15))
+        return comparator(rnd.randint(-5, 15))
+    operator = rnd.choice([And, Or, Not])
+    if operator is Not:
+        return Not(random_tree(rnd, depth - 1))
+    return operator(*[random_tree(rnd, depth - 1) for _ in range(rnd.randint(1, 4))])
+
+
+class TestIntervalSet(TestCase):
+
+    def test_is_orderable(self):
+        self.assertTrue(is_orderable(1))
+        self.assertTrue(is_orderable(1.5))
+        self.assertTrue(is_orderable(Decimal('1.5')))
+        self.assertFalse(is_orderable(NAN))
+        self.assertFalse(is_orderable('1'))
+        self.assertFalse(is_orderable(None))
+
+    def test_is_number(self):
+        self.assertTrue(is_number(1))
+        self.assertTrue(is_number(True))
+        self.assertTrue(is_number(NAN))
+        self.assertTrue(is_number(Decimal('1.5')))
+        self.assertFalse(is_number('1'))
+        self.assertFalse(is_number(None))
+
+    def test_constructor(self):
+        intervals = IntervalSet([((5, 0), (9, 1)), ((1, 0), (5, 1)), ((20, 0), (10, 1))])
+        self.assertEqual(intervals.intervals, (((1, 0), (9, 1)), ))
+        self.assertEqual(len(IntervalSet([((1, 0), (5, 0)), ((5, 1), (9, 1))])), 2)
+        self.assertEqual(len(IntervalSet([((1, 0), (5, 1)), ((5, 1), (9, 1))])), 1)
+
+    def test_contains(self):
+        intervals = IntervalSet.less(0) | IntervalSet.between(10, 20) | IntervalSet.greater(100)
+        for value in VALUES:
+            self.assertEqual(value in intervals, value < 0 or 10 <= value <= 20 or value > 100)
+        self.assertIn(NAN, ~intervals)
+        self.assertTrue('a' in IntervalSet.everything())
+        self.assertFalse('a' in IntervalSet())
+
+    def test_operations(self):
+        self.assertEqual(IntervalSet.greater(5) & IntervalSet.less(5), IntervalSet())
+        self.assertEqual(IntervalSet.greater(5) | IntervalSet.less(5, closed=True), IntervalSet.everything() & ~IntervalSet([], True))
+        self.assertEqual(~~IntervalSet.between(1, 2), IntervalSet.between(1, 2))
+        self.assertTrue((IntervalSet.greater(5) | ~IntervalSet.greater(5)).is_everything())
+        self.assertTrue((IntervalSet.greater(5) & ~IntervalSet.greater(5)).is_empty())
+
+    def test_get_text(self):
+        self.assertEqual(IntervalSet().get_text(), 'nothing')
+        self.assertEqual(IntervalSet.everything().get_text(), '(-inf, +inf) or NaN')
+        self.assertEqual((IntervalSet.less(0) | IntervalSet.between(1, 2) | IntervalSet.greater(3)).get_text(),
+                         '(-inf, 0) or [1, 2] or (3, +inf)')
+
+    def test_to_validator(self):
+        self.assertEqual(str(IntervalSet.greater(5).to_validator()), 'must be greater than 5')
+        self.assertEqual(str(IntervalSet.greater(5, True).to_validator()), 'must be greater than or equal to 5')
+        self.assertEqual(str(IntervalSet.less(5).to_validator()), 'must be less than 5')
+        self.assertEqual(str(IntervalSet.less(5, True).to_validator()), 'must be less than or equal to 5')
+        self.assertEqual(str(IntervalSet.between(5, 5).to_validator()), 'must be equal to 5')
+        self.assertEqual(str(IntervalSet.between(5, 6).to_validator()), 'must be between 5 and 6')
+        self.assertEqual(str((~IntervalSet.between(5, 5)).to_validator()), 'must NOT be equal to 5')
+        self.assertIsInstance(IntervalSet().to_validator(), InIntervals)
+
+    def test_to_validator_other(self):
+        self.assertEqual(IntervalSet.greater(5).to_validator(None), GT(5))
+        self.assertEqual(IntervalSet.between(5, 5).to_validator(False), EQ(5))
+        self.assertEqual(IntervalSet.between(5, 5).to_validator(None), InIntervals(IntervalSet.between(5, 5)))
+        self.assertEqual(IntervalSet.greater(5).to_validator(True), InIntervals(IntervalSet.greater(5), True))
+
+
+class TestGetIntervals(TestCase):
+
+    def test_comparators(self):
+        self.assertEqual(get_intervals(GT(5)), IntervalSet.greater(5))
+        self.assertEqual(get_intervals(NotEQ(5)), ~IntervalSet.between(5, 5))
+        self.assertIsNone(get_intervals(GT('5')))
+        self.assertIsNone(get_intervals(EQ(NAN)))
+        self.assertIsNone(get_intervals(Between(1, None)))
+        self.assertIsNone(get_intervals(StrictGT(5)))
+        self.assertIsNone(get_intervals(TypeIs(int)))
+        self.assertIsNone(get_intervals(Any(1, 2)))
+
+    def test_logical_operators(self):
+        self.assertEqual(get_intervals(Or(GT(5), EQ(5))), IntervalSet.greater(5, closed=True))
+        self.assertEqual(get_intervals(And(GT(5), LT(10))), IntervalSet([((5, 1), (10, 0))]))
+        self.assertEqual(get_intervals(Not(GT(5))), IntervalSet.less(5, closed=True) | IntervalSet([], True))
+        self.assertIsNone(get_intervals(And(GT(5), TypeIs(int))))
+
+    def test_get_other_result(self):
+        self.assertIsNone(get_other_result(GT(5)))
+        self.assertFalse(get_other_result(EQ(5)))
+        self.assertTrue(get_other_result(NotEQ(5)))
+        self.assertTrue(get_other_result(Not(EQ(5))))
+        self.assertIsNone(get_other_result(Not(GT(5))))
+        self.assertFalse(get_other_result(Or(EQ(1), EQ(2))))
+        self.assertTrue(get_other_result(Or(EQ(1), NotEQ(2), GT(3))))
+        self.assertIsNone(get_other_result(Or(EQ(1), GT(3), NotEQ(2))))
+        self.assertTrue(get_other_result(And(NotEQ(0), NotEQ(1))))
+        self.assertTrue(get_other_result(InIntervals(IntervalSet(), True)))
+
+
+class TestSimplify(TestCase):
+
+    def assertSameResults(self, validator, simplified, values=VALUES):
+        for value in values:
+            self.assertEqual(bool(simplified.is_valid(value)), bool(validator.is_valid(value)),
+                             msg="{0!r}: {1} -> {2}".format(value, validator, simplified))
+
+    def assertSameOtherResults(self, validator, simplified):
+        # simplified validator can skip comparison, that raises, but it must not raise instead of result
+        for check in (simplified.is_valid, simplified.compile()):
+            for value in OTHER_VALUES:
+                try:
+                    expected = validator.is_valid(value)
+                except TypeError:
+                    continue
+                self.assertEqual(bool(check(value)), bool(expected),
+                                 msg="{0!r}: {1} -> {2}".format(value, validator, simplified))
+
+    def test_simplify_method(self):
+        self.assertEqual(str(Or(Between(1, 5), Between(4, 9)).simplify()), 'must be between 1 and 9')
+        self.assertEqual(str(And(GT(5), GT(10)).simplify()), 'must be greater than 10')
+        self.assertEqual(str(And(GT(10), LT(5)).simplify()), 'must be in nothing')
+        self.assertEqual(str(Not(Not(GT(10))).simplify()), 'must be greater than 10')
+        self.assertEqual(str(Not(EQ(10)).simplify()), 'must NOT be equal to 10')
+        self.assertEqual(str(Len(Or(Between(1, 5), Between(4, 9))).simplify()), 'length must be between 1 and 9')
+
+    def test_partial_simplify(self):
+        validator = And(TypeIs(int), GT(5), GT(10), LT(20))
+        simplified = validator.simplify()
+        self.assertEqual(str(simplified), '(must be int) AND (must be in (10, 20))')
+        self.assertSameResults(validator, simplified, [5, 11, 11.5, 20, 19])
+
+        # merged operands compare values with numbers, so they are not moved before TypeIs
+        self.assertEqual(str(And(TypeIs(int), GT(10), LT(5)).simplify()), '(must be int) AND (must be in nothing)')
+        self.assertEqual(str(And(TypeIs(int), EQ(10), EQ(5)).simplify()), 'must be in nothing')
+        self.assertEqual(str(Or(TypeIs(str), GT(10), LTE(10), NotEQ(3)).simplify()),
+                         '(must be str) OR (must be in (-inf, +inf) or NaN)')
+        self.assertTrue(Or(TypeIs(str), GT(10), LTE(10), NotEQ(3)).simplify().is_valid('a'))
+        self.assertEqual(str(Or(TypeIs(str), GT(10), Not(TypeIs(int))).simplify()),
+                         '(must be str) OR (must be greater than 10) OR NOT(must be int)')
+
+        validator = And(NotEQ(0), TypeIs(int), LT(10))
+        self.assertEqual(str(validator.simplify()), str(validator))
+        self.assertFalse(validator.simplify().is_valid('a'))
+
+        validator = TypeIs(int)
+        self.assertIs(validator.simplify(), validator)
+
+    def test_not_numbers(self):
+        self.assertFalse(Or(EQ(1), EQ(2)).is_valid('a'))
+        self.assertFalse(Or(EQ(1), EQ(2)).simplify().is_valid('a'))
+        self.assertTrue(And(NotEQ(0), NotEQ(1)).simplify().is_valid('a'))
+        self.assertEqual(str(And(NotEQ(0), NotEQ(1)).simplify()),
+                         'must be in (-inf, 0) or (0, 1) or (1, +inf) or NaN (or not a number)')
+        self.assertRaises(TypeError, And(GT(0), LT(10)).simplify().is_valid, 'a')
+        for validator in (Or(EQ(1), EQ(2)), And(NotEQ(0), NotEQ(1)), Or(TypeIs(str), EQ(1), EQ(2)),
+                          And(TypeIs(str), NotEQ(0), NotEQ(1), Len(GT(0))), Or(EQ(1), Not(And(GT(0), LT(5))))):
+            self.assertSameOtherResults(validator, validator.simplify())
+
+    def test_decimal_bounds_and_nan(self):
+        # ordering comparison of NaN with Decimal raises InvalidOperation, merged interval checks NaN first
+        nan = float('nan')
+        for validator in (And(GT(0), GT(Decimal(2))), And(GT(0), Between(Decimal(1), 2)), And(GT(0), LT(Decimal(5)))):
+            self.assertFalse(validator.is_valid(nan))
+            simplified = validator.simplify()
+            self.assertIsInstance(simplified, InIntervals)
+            for value in (nan, 0, 1, Decimal('1.5'), 2, 2.5, 3, 10):
+                self.assertEqual(simplified.is_valid(value), validator.is_valid(value), (str(validator), value))
+        self.assertEqual(IntervalSet.between(Decimal(1), Decimal(1)).to_validator(), EQ(Decimal(1)))
+
+    def test_random_trees(self):
+        rnd = random.Random(42)
+        for _ in range(300):
+            validator = random_tree(rnd, 4)
+            simplified = validator.simplify()
+            self.assertSameResults(validator, simplified)
+            self.assertSameOtherResults(validator, simplified)
+            mixed = And(Not(TypeIs(tuple)), validator)
+            self.assertSameOtherResults(mixed, mixed.simplify())
+            compiled = simplified.compile()
+            for value in VALUES:
+                self.assertEqual(bool(compiled(value)), bool(validator.is_valid(value)))
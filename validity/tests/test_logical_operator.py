@@ -1,7 +1,7 @@
 #pylint: skip-file
 from unittest import TestCase
-from validity.comparator import GT, LT, GTE, LTE, EQ, NotEQ, Any, Between, TypeIs
-from validity.logical_operator import Base, BaseLogicalOperator, Or, And, Not
+from validity.comparator import BaseComparator, GT, LT, GTE, LTE, EQ, NotEQ, Any, Between, TypeIs
+from validity.logical_operator import Base, BaseLogicalOperator, Or, And, Not, AdaptiveOrder
 
 
 class TestBase(TestCase):
@@ -74,6 +74,57 @@ class TestBase(TestCase):
         self.assertEqual(not_valid, list(range(0, 11)))
         self.assertEqual(valid, list(range(11, 20)))
 
+    def test_iter_partition_method(self):
+        values = (value for value in range(0, 20))
+        result = GT(10).iter_partition(values)
+        self.assertEqual(next(result), (0, False))
+        self.assertEqual(next(values), 1)
+        self.assertEqual(list(result), [(value, value > 10) for value in range(2, 20)])
+
+    def test_iter_valid_method(self):
+        self.assertEqual(list(GT(10).iter_valid(iter(range(0, 20)))), list(range(11, 20)))
+        self.assertEqual(list(GT(10).iter_valid([])), [])
+
+    def test_iter_invalid_method(self):
+        self.assertEqual(list(GT(10).iter_invalid(iter(range(0, 20)))), list(range(0, 11)))
+
+    def test_route_values_method(self):
+        valid, not_valid = [], []
+        self.assertEqual(GT(10).route_values(iter(range(0, 20)), valid.append, not_valid.append), (9, 11))
+        self.assertEqual(valid, list(range(11, 20)))
+        self.assertEqual(not_valid, list(range(0, 11)))
+
+        valid = []
+        self.assertEqual(GT(10).route_values(range(0, 20), valid_sink=valid.append), (9, 11))
+        self.assertEqual(valid, list(range(11, 20)))
+
+    def test_get_cached_condition_text_method(self):
+        class Counter(Base):
+            calls = 0
+
+            def get_condition_text(self):
+                self.calls += 1
+                return 'counter'
+
+        counter = Counter()
+        test = And(GT(10), counter)
+        self.assertEqual(test.get_cached_condition_text(), '(must be greater than 10) AND (counter)')
+        self.assertEqual(str(test), '(must be greater than 10) AND (counter)')
+        self.assertEqual(test.get_error(5), '(must be greater than 10) AND (counter)')
+        self.assertEqual(counter.calls, 1)
+
+        self.assertEqual(str(test.or_valid(EQ(0))), '((must be greater than 10) AND (counter)) OR (must be equal to 0)')
+        self.assertEqual(str(~test), 'NOT((must be greater than 10) AND (counter))')
+        self.assertEqual(counter.calls, 1)
+
+    def test_get_cached_condition_text_invalidation(self):
+        operand = GT(10)
+        test = Or(And(operand, LT(20)), EQ(0))
+        self.assertEqual(str(test), '((must be greater than 10) AND (must be less than 20)) OR (must be equal to 0)')
+        operand.operand = 15
+        self.assertEqual(str(test), '((must be greater than 15) AND (must be less than 20)) OR (must be equal to 0)')
+        self.assertEqual(test.get_error(100), '((must be greater than 15) AND (must be less than 20)) OR (must be equal to 0)')
+
     def test_all_is_valid_method(self):
         with self.assertRaises(NotImplementedError):
             Base().all_is_valid(1, 2, 3, 4, 5)
@@ -88,6 +139,82 @@ class TestBase(TestCase):
             Base().get_condition_text()
 
 
+class Counting(GT):
+
+    def __init__(self, operand):
+        super(Counting, self).__init__(operand)
+        self.calls = 0
+
+    def is_valid(self, value):
+        self.calls += 1
+        return super(Counting, self).is_valid(value)
+
+
+class TestInvalidation(TestCase):
+
+    def test_unrelated(self):
+        test = Or(And(GT(0), LT(10), adaptive=5), EQ(42), Any(1, 2), TypeIs(int, str), Not(Between(3, 4)))
+        test.is_valid(5)
+        text = test.get_cached_condition_text()
+        evaluated = test._evaluated
+        other = GT(5)
+        str(Not(other))
+        other.operand = 6
+        self.assertIs(test.get_cached_condition_text(), text)
+        self.assertIs(test._evaluated, evaluated)
+
+    def test_nested(self):
+        leaf = GT(0)
+        middle = And(leaf, LT(10))
+        test = Or(middle, EQ(42))
+        sibling = Or(*[EQ(value) for value in range(100, 120)])
+        root = And(test, sibling)
+        self.assertFalse(root.is_valid(-1))
+        str(root)
+        evaluated = sibling._evaluated
+        leaf.operand = -5
+        self.assertTrue(test.is_valid(-1))
+        self.assertEqual(str(test), "((must be greater than -5) AND (must be less than 10)) OR (must be equal to 42)")
+        self.assertIs(sibling._evaluated, evaluated)
+        middle.operands = (LT(0), )
+        self.assertFalse(test.is_valid(5))
+        middle.operands[0].operand = 10
+        self.assertTrue(test.is_valid(5))
+        self.assertEqual(str(root).split(' AND ')[0], "(((must be less than 10)) OR (must be equal to 42))")
+
+    def test_mutable_state(self):
+        counting = Counting(0)
+        merged = Or(*[EQ(value) for value in range(0, 100)])
+        test = And(counting, merged)
+        self.assertTrue(test.is_valid(5))
+        evaluated = merged._evaluated
+        for value in range(0, 10):
+            self.assertTrue(test.is_valid(value + 1))
+        self.assertEqual(counting.calls, 11)
+        self.assertIs(merged._evaluated, evaluated)
+
+    def test_in_place_change(self):
+        listed = Listed([1])
+        test = Not(listed)
+        self.assertEqual(str(test), "NOT(must be in [1])")
+        listed.values.append(2)
+        self.assertEqual(str(test), "NOT(must be in [1])")
+        listed.invalidate()
+        self.assertEqual(str(test), "NOT(must be in [1, 2])")
+
+
+class Listed(Base):
+
+    def __init__(self, values):
+        self.values = values
+
+    def is_valid(self, value):
+        return value in self.values
+
+    def get_condition_text(self):
+        return "must be in {values}".format(values=self.values)
+
+
 class TestBaseLogicalOperator(TestCase):
 
     def test_constructor(self):
@@ -165,6 +292,90 @@ class TestOr(TestCase):
         self.assertEqual(Or(GT(100), LT(0), EQ(42)).get_operands_text(),
                          '(must be greater than 100) OR (must be less than 0) OR (must be equal to 42)')
 
+    def test_optimize_operands_method(self):
+        operands = (EQ(1), EQ(2), Any(3, 4), EQ('5'), GT(100), EQ(6), Any(7))
+        test = Or(*operands)
+        self.assertEqual(test.operands, operands)
+        ordered = test.get_ordered_operands()
+        self.assertEqual(len(ordered), 4)
+        self.assertEqual(ordered[0], Any(1, 2, 3, 4, '5'))
+        self.assertEqual(ordered[1:], operands[4:])
+        for value in [0, 1, 2, 3, 4, '5', 5, 6, 7, 101, 2.0]:
+            self.assertEqual(test.is_valid(value), any(operand.is_valid(value) for operand in operands))
+        self.assertEqual(test.get_condition_text(),
+                         '(must be equal to 1) OR (must be equal to 2) OR (must be any of (3, 4)) OR '
+                         '(must be equal to `5`) OR (must be greater than 100) OR (must be equal to 6) OR '
+                         '(must be any of (7))')
+
+        operands = (EQ(1), GT(100))
+        self.assertEqual(Or(*operands).get_ordered_operands(), operands)
+
+    def test_merge_threshold(self):
+        operands = (EQ(1), EQ(2), EQ(3))
+        self.assertEqual(Or(*operands).get_ordered_operands(), operands)
+        self.assertEqual(Or(*(operands + (EQ(4), ))).get_ordered_operands(), (Any(1, 2, 3, 4), ))
+
+        class MergingOr(Or):
+            merge_threshold = 2
+
+        self.assertEqual(MergingOr(EQ(1), EQ(2)).get_ordered_operands(), (Any(1, 2), ))
+
+    def test_merge_adjacent_operands(self):
+        # custom operand between equality checks is checked before the following of them
+
+        class Raising(Base):
+            def is_valid(self, value):
+                raise ValueError(value)
+
+            def get_condition_text(self):
+                return 'raises'
+
+        operands = (EQ(1), EQ(2), EQ(3), EQ(4), Raising(), EQ(5), EQ(6), EQ(7), EQ(8))
+        test = Or(*operands)
+        self.assertEqual(test.get_ordered_operands(), (Any(1, 2, 3, 4), operands[4], Any(5, 6, 7, 8)))
+        self.assertTrue(test.is_valid(4))
+        self.assertRaises(ValueError, test.is_valid, 5)
+        self.assertEqual(test.compile()(4), True)
+        self.assertRaises(ValueError, test.compile(), 5)
+
+    def test_optimized_operands_follow_changes(self):
+        first = EQ(1)
+        test = Or(first, EQ(2))
+        first.operand = 5
+        self.assertTrue(test.is_valid(5))
+        self.assertFalse(test.is_valid(1))
+        self.assertEqual(str(test), '(must be equal to 5) OR (must be equal to 2)')
+
+        first = TypeIs(int)
+        test = Or(first, TypeIs(str), adaptive=5)
+        first.operand = float
+        self.assertTrue(test.is_valid(1.5))
+        self.assertFalse(test.is_valid(1))
+        self.assertEqual(test.compile()(1.5), True)
+
+        test = Or(EQ(1), EQ(2))
+        test.operands = (EQ(3), GT(10))
+        self.assertTrue(test.is_valid(3))
+        self.assertFalse(test.is_valid(1))
+
+    def test_optimize_type_operands(self):
+        operands = (TypeIs(int), TypeIs(float), TypeIs(bool), TypeIs(str, bytes), EQ('a'),
+                    TypeIs(int, str, subclasses=True), TypeIs(dict, subclasses=True), TypeIs(list, subclasses=True),
+                    TypeIs(set, subclasses=True), TypeIs(tuple))
+        test = Or(*operands)
+        ordered = test.get_ordered_operands()
+        self.assertEqual(ordered, (TypeIs(int, float, bool, str, bytes), EQ('a'),
+                                   TypeIs(int, str, dict, list, set, subclasses=True), TypeIs(tuple)))
+        self.assertEqual(ordered[0].operand, (int, float, bool, str, bytes))
+        for value in [0, 1.5, True, 'a', 'c', b'a', None, [], {}, set(), ()]:
+            self.assertEqual(test.is_valid(value), any(operand.is_valid(value) for operand in operands))
+            self.assertEqual(test.compile()(value), test.is_valid(value))
+        self.assertEqual(test.get_condition_text().split(' OR ')[:3],
+                         ['(must be int)', '(must be float)', '(must be bool)'])
+
+        operands = (TypeIs(int), TypeIs(str, subclasses=True))
+        self.assertEqual(Or(*operands).get_ordered_operands(), operands)
+
     def test_binary_or_method(self):
         self.assertIsInstance(Or(GT(10), LT(0)) | EQ(42), Or)
         op1 = GT(10)
@@ -278,3 +489,250 @@ class TestNot(TestCase):
 
     def test_get_nested_condition_method(self):
         self.assertEqual(Not(GT(10)).get_condition_text(), Not(GT(10)).get_nested_condition())
+
+
+class Raises(Base):
+
+    def is_valid(self, value):
+        raise AssertionError("must not be evaluated")
+
+    def get_condition_text(self):
+        return 'raises'
+
+
+class TestAdaptiveOrder(TestCase):
+
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            BaseLogicalOperator(GT(10), adaptive=True)
+        with self.assertRaises(TypeError):
+            And(GT(10), LT(20), unknown=True)
+        self.assertIsNone(And(GT(10), LT(20)).adaptive)
+        self.assertEqual(Or(GT(10), LT(20), adaptive=10).adaptive, 10)
+        for adaptive in (0, -5, 1.5, '10'):
+            with self.assertRaises(ValueError):
+                Or(GT(10), LT(20), adaptive=adaptive)
+        self.assertFalse(Or(GT(10), LT(20), adaptive=False).adaptive)
+
+    def test_short_circuit(self):
+        self.assertFalse(And(GT(10), Raises()).is_valid(5))
+        self.assertTrue(Or(GT(10), Raises()).is_valid(50))
+        self.assertFalse(And(GT(10), Raises(), adaptive=True).is_valid(5))
+        self.assertTrue(Or(GT(10), Raises(), adaptive=True).is_valid(50))
+
+    def test_is_valid(self):
+        values = list(range(0, 100)) * 5
+        for operator in [And, Or]:
+            plain = operator(NotEQ(13), Between(0, 80), Any(range(0, 50)), GT(5))
+            adaptive = operator(NotEQ(13), Between(0, 80), Any(range(0, 50)), GT(5), adaptive=7)
+            for value in values:
+                self.assertEqual(adaptive.is_valid(value), plain.is_valid(value))
+            self.assertEqual(adaptive.get_condition_text(), plain.get_condition_text())
+            self.assertEqual(adaptive.compile()(42), plain.is_valid(42))
+
+    def test_reorder(self):
+        never_fails = GTE(0)
+        always_fails = LT(0)
+        test = And(never_fails, always_fails, adaptive=10)
+        self.assertEqual(test.get_ordered_operands(), (never_fails, always_fails))
+        for value in range(0, 10):
+            self.assertFalse(test.is_valid(value))
+        self.assertEqual(test.get_ordered_operands(), (always_fails, never_fails))
+        self.assertEqual(test.operands, (never_fails, always_fails))
+
+        test = Or(always_fails, never_fails, adaptive=10)
+        for value in range(0, 10):
+            self.assertTrue(test.is_valid(value))
+        self.assertEqual(test.get_ordered_operands(), (never_fails, always_fails))
+
+    def test_sampling(self):
+        test = And(GTE(0), LT(100), adaptive=1000)
+        test.get_ordered_operands()
+        order = test._evaluated[1]
+        for value in range(0, 80):
+            self.assertTrue(test.is_valid(value))
+        self.assertEqual(order.evaluations, 80)
+        self.assertEqual(order.calls, [80 // order.sample_period] * 2)
+
+        order = AdaptiveOrder(2, False, 10, sample_period=1)
+        self.assertFalse(order.evaluate((GTE(0), LT(0)), 5))
+        self.assertEqual(order.calls, [1, 1])
+        self.assertEqual(order.decisions, [0, 1])
+
+    def test_logical_wrappers_keep_mode(self):
+        self.assertEqual(Or(GT(10), LT(0), adaptive=5).or_valid(EQ(5)).adaptive, 5)
+        self.assertEqual(And(GT(10), LT(0), adaptive=5).and_valid(EQ(5)).adaptive, 5)
+
+
+class Tagged(GT):
+
+    def __init__(self, operand, tag):
+        super(Tagged, self).__init__(operand)
+        self.tag = tag
+
+
+class Slotted(GT):
+    __slots__ = ('tag', )
+
+    def __init__(self, operand, tag):
+        super(Slotted, self).__init__(operand)
+        self.tag = tag
+
+
+class TestSlots(TestCase):
+
+    def test_no_dict(self):
+        from validity.comparator import GTE, LTE, InIntervals, IsNone, Len, Count
+        from validity.interval import IntervalSet
+        for validator in (GT(5), GTE(5), LT(5), LTE(5), EQ(5), NotEQ(5), Between(1, 5), TypeIs(int),
+                          InIntervals(IntervalSet.greater(5)), IsNone(), Len(EQ(5)), Count(EQ(5)),
+                          Or(GT(5)), And(GT(5)), Not(GT(5))):
+            self.assertFalse(hasattr(validator, '__dict__'), type(validator).__name__)
+            with self.assertRaises(AttributeError):
+                validator.some_attribute = 42
+
+    def test_custom_attributes(self):
+        test = Tagged(5, 'tag')
+        self.assertEqual(test.tag, 'tag')
+        self.assertTrue(test.is_valid(6))
+        test.other = 1
+        self.assertEqual(test.other, 1)
+        test = Slotted(5, 'tag')
+        self.assertFalse(hasattr(test, '__dict__'))
+        self.assertEqual(test.tag, 'tag')
+        test = Any(1, 2, 3)
+        test.max_text_values = 1
+        self.assertEqual(str(test), "must be any of (1, ... 2 more)")
+
+    def test_pickle(self):
+        import pickle
+        for protocol in range(0, pickle.HIGHEST_PROTOCOL + 1):
+            for test in (Tagged(5, 'tag'), Slotted(5, 'tag')):
+                str(test)
+                restored = pickle.loads(pickle.dumps(test, protocol))
+                self.assertIsNone(restored._cache)
+                self.assertEqual((restored.operand, restored.tag, str(restored)), (5, 'tag', str(test)))
+            restored = pickle.loads(pickle.dumps(Or(Any(1, 2), EQ(3)), protocol))
+            self.assertEqual(restored.filter_values(1, 3, 4), ([1, 3], [4]))
+
+    def test_changed_operand(self):
+        test = Slotted(5, 'tag')
+        parent = Not(test)
+        self.assertEqual(str(parent), "NOT(must be greater than 5)")
+        test.operand = 6
+        self.assertEqual(str(parent), "NOT(must be greater than 6)")
+        test = Any(1, 2, 3)
+        parent = Not(test)
+        self.assertEqual(str(parent), "NOT(must be any of (1, 2, 3))")
+        test.max_text_values = 1
+        self.assertEqual(str(parent), "NOT(must be any of (1, ... 2 more))")
+
+    def test_weakref(self):
+        import weakref
+        test = GT(5)
+        self.assertIs(weakref.ref(test)(), test)
+
+
+class Near(BaseComparator):
+    _condition_template = "must be near {operand}"
+
+    def __init__(self, operand, tolerance):
+        super(Near, self).__init__(operand)
+        self.tolerance = tolerance
+
+    def is_valid(self, value):
+        return abs(value - self.operand) <= self.tolerance
+
+
+class EqualsTen(EQ):
+
+    def is_valid(self, value):
+        return value == 10
+
+
+def random_tree(rnd, depth):
+    if depth == 0 or rnd.random() < 0.25:
+        comparator = rnd.choice([GT, LT, EQ, EQ, NotEQ, NotEQ, TypeIs, EqualsTen, Any])
+        if comparator is TypeIs:
+            return TypeIs(rnd.choice([int, str, float]))
+        operands = [0, 1, 2, 3, 'a', 1.0, True, False]
+        if comparator is Any:
+            return Any(rnd.sample(operands, 2))
+        return comparator(rnd.choice(operands))
+    operator = rnd.choice([And, Or, Not, Not])
+    if operator is Not:
+        return Not(random_tree(rnd, depth - 1))
+    operands = [random_tree(rnd, depth - 1) for _ in range(rnd.randint(1, 3))]
+    return operator(*(operands + rnd.sample(operands, rnd.randint(0, len(operands)))))
+
+
+def outcome(validator, value):
+    try:
+        return bool(validator.is_valid(value))
+    except TypeError:
+        return TypeError
+
+
+class TestNormalize(TestCase):
+
+    def test_flatten(self):
+        a, b, c = GT(0), LT(10), NotEQ(5)
+        self.assertEqual(And(And(a, b), c).normalize(), And(a, b, c))
+        self.assertEqual(And(a, And(b, And(c))).normalize(), And(a, b, c))
+        self.assertEqual(Or(Or(a, b), And(c)).normalize(), Or(a, b, c))
+        self.assertEqual(And(Or(a, b), c).normalize(), And(Or(a, b), c))
+        self.assertEqual(And(Or(Or(a), b), c).normalize(), And(Or(a, b), c))
+        self.assertEqual(And(And(a, b, adaptive=True), c).normalize(), And(And(a, b, adaptive=True), c))
+        self.assertEqual(And(And(a, b, adaptive=True), c, adaptive=True).normalize(), And(a, b, c, adaptive=True))
+
+    def test_dedupe(self):
+        self.assertEqual(And(GT(0), LT(10), GT(0)).normalize(), And(GT(0), LT(10)))
+        self.assertEqual(Or(EQ(1), EQ(1)).normalize(), EQ(1))
+        self.assertEqual(Or(EQ(1), EQ(1.0), EQ(True)).normalize(), Or(EQ(1), EQ(1.0), EQ(True)))
+        self.assertEqual(str(Or(EQ([1]), EQ([1])).normalize()), "(must be equal to [1]) OR (must be equal to [1])")
+
+    def test_dedupe_item_types(self):
+        # operands, that differ only in types of items, are kept with their texts
+        for validator in (Or(Any(1, 0), Any(True, False)), Or(Any(1, 2), Any(1.0, 2.0)),
+                          And(Between(1, 2), Between(1.0, 2.0)), Or(TypeIs(int, str), TypeIs(str, int))):
+            normalized = validator.normalize()
+            self.assertEqual(str(normalized), str(validator))
+            self.assertEqual(len(normalized.operands), 2)
+            for value in (0, 1, 1.0, True, False, 1.5, 2, 'a'):
+                self.assertEqual(outcome(normalized, value), outcome(validator, value))
+        self.assertEqual(Or(Any(1, 0), Any(1, 0)).normalize(), Any(1, 0))
+
+    def test_dedupe_custom(self):
+        near, far = Near(5, 1), Near(5, 10)
+        self.assertFalse(near.is_valid(12))
+        self.assertTrue(Or(near, far).normalize().is_valid(12))
+        self.assertEqual(Or(near, far).normalize().operands, (near, far))
+        self.assertIs(Or(near, Or(near, far)).normalize().operands[0], near)
+        self.assertEqual(len(Or(near, Or(near, far)).normalize().operands), 2)
+        self.assertEqual(len(And(EqualsTen(5), EqualsTen(5)).normalize().operands), 2)
+
+    def test_negation(self):
+        self.assertEqual(Not(Not(GT(5))).normalize(), GT(5))
+        self.assertEqual(Not(Not(Not(GT(5)))).normalize(), Not(GT(5)))
+        self.assertEqual(Not(EQ(5)).normalize(), NotEQ(5))
+        self.assertEqual(Not(NotEQ(5)).normalize(), EQ(5))
+        self.assertEqual(Not(EqualsTen(5)).normalize().operands[0].__class__, EqualsTen)
+        self.assertEqual(Not(Or(EQ(1), Not(TypeIs(int)))).normalize(), And(NotEQ(1), TypeIs(int)))
+        self.assertEqual(Not(And(Not(Or(EQ(1), EQ(2))), NotEQ(3))).normalize(), Or(EQ(1), EQ(2), EQ(3)))
+        # De Morgan does not help, if not all operands have simple negation
+        self.assertEqual(Not(Or(EQ(1), GT(5))).normalize(), Not(Or(EQ(1), GT(5))))
+
+    def test_same_instance(self):
+        for validator in (GT(5), And(GT(0), LT(10)), Or(EQ(1), Not(GT(5))), Not(And(GT(0), LT(10)))):
+            self.assertIs(validator.normalize(), validator)
+
+    def test_random_trees(self):
+        # Or.optimize_operands merges only adjacent operands, so normalized validator raises same exceptions
+        import random
+        rnd = random.Random(16)
+        values = [0, 1, 2, 3, 10, 1.0, 2.5, 'a', 'b', None, True]
+        for _ in range(500):
+            validator = random_tree(rnd, 5)
+            normalized = validator.normalize()
+            for value in values:
+                self.assertEqual(outcome(normalized, value), outcome(validator, value), (str(validator), value))
@@ -0,0 +1,131 @@
+#pylint: skip-file
+import pickle
+from unittest import TestCase
+from validity.comparator import BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, InIntervals, \
+    TypeIs, IsNone, Len, Count
+from validity.logical_operator import And, Or, Not
+from validity.cache import Cached
+from validity.intern import InternPool
+from validity.interval import IntervalSet
+from validity.parallel import iter_chunks, iter_partition_parallel, partition_parallel
+
+
+class IsEven(BaseComparator):
+    _condition_template = "must be even"
+
+    def is_valid(self, value):
+        return value % 2 == 0
+
+
+VALUES = [-5, 0, 3, 7, 10, 15.5, 42, None, 'ab', 'abc', [1, 2], True, float('nan')]
+
+
+def check(value, validator):
+    try:
+        return validator.is_valid(value)
+    except TypeError:
+        return 'TypeError'
+
+
+class TestPickle(TestCase):
+
+    def assertSame(self, validator):
+        str(validator)
+        hash(validator)
+        [check(value, validator) for value in VALUES]
+        restored = pickle.loads(pickle.dumps(validator, pickle.HIGHEST_PROTOCOL))
+        self.assertIs(type(restored), type(validator))
+        self.assertEqual(str(restored), str(validator))
+        self.assertEqual([check(value, restored) for value in VALUES], [check(value, validator) for value in VALUES])
+        return restored
+
+    def test_comparators(self):
+        for validator in (GT(5), GTE(5), LT(5), LTE(5), EQ(42), NotEQ(42), Any(1, 'ab', [1, 2]), Between(0, 10),
+                          InIntervals(IntervalSet.greater(10) | IntervalSet.less(0)), TypeIs(str), IsNone(),
+                          IsNone("custom"), Len(EQ(2)), Count(GT(2)), IsEven(0)):
+            self.assertSame(validator)
+
+    def test_logical_operators(self):
+        validator = And(TypeIs(int), Or(Any(list(range(0, 1000, 3))), EQ(1000), EQ(1001), EQ(1002), Between(-5, 5)),
+                        Not(EQ(6)))
+        restored = self.assertSame(validator)
+        self.assertEqual(len(restored.operands[1].get_ordered_operands()), 2)
+        self.assertEqual(restored, validator)
+        restored = self.assertSame(Or(GT(5), LT(0), adaptive=10))
+        self.assertEqual(restored.adaptive, 10)
+        self.assertIsNotNone(restored._evaluated[1])
+
+    def test_compact(self):
+        validator = Any(list(range(0, 10000)))
+        size = len(pickle.dumps(validator, pickle.HIGHEST_PROTOCOL))
+        validator.is_valid(5)
+        str(validator)
+        self.assertEqual(len(pickle.dumps(validator, pickle.HIGHEST_PROTOCOL)), size)
+        self.assertLess(size, len(pickle.dumps(validator.operand, pickle.HIGHEST_PROTOCOL)) + 200)
+
+    def test_wrappers(self):
+        validator = Cached(Len(EQ(2)))
+        validator.is_valid('ab')
+        self.assertEqual(pickle.loads(pickle.dumps(validator)).cache_info(), (0, 0, 0, 1024, 0))
+        self.assertSame(validator)
+        pool = InternPool(share_results=True)
+        validator = pool.intern(Or(And(GT(1), LT(5)), EQ(9)))
+        restored = self.assertSame(validator)
+        self.assertEqual(restored.pool.evaluate([restored], 3), [True])
+
+
+class TestParallel(TestCase):
+
+    def test_iter_chunks(self):
+        self.assertEqual(list(iter_chunks(range(0, 7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(iter_chunks([], 3)), [])
+        with self.assertRaises(ValueError):
+            iter_chunks([1], 0)
+
+    def test_partition_parallel(self):
+        validator = And(TypeIs(int), Or(IsEven(0), Between(10, 20)))
+        values = list(range(0, 1000))
+        expected = [(value, validator.is_valid(value)) for value in values]
+        self.assertEqual(validator.partition_parallel(values, workers=2, chunksize=70), expected)
+        self.assertEqual(validator.partition_parallel(iter(values), workers=1, chunksize=70), expected)
+        self.assertEqual(partition_parallel(validator, [], workers=2), [])
+
+    def test_iter_partition_parallel(self):
+        validator = Or(IsEven(0), Between(10, 20))
+        read = []
+
+        def values():
+            for value in range(0, 1000):
+                read.append(value)
+                yield value
+
+        pairs = validator.iter_partition_parallel(values(), workers=2, chunksize=10)
+        self.assertEqual(read, [])
+        self.assertEqual(next(pairs), (0, True))
+        # only 2 chunks for each of 2 workers are read before first result
+        self.assertEqual(len(read), 40)
+        self.assertEqual(list(pairs), [(value, validator.is_valid(value)) for value in range(1, 1000)])
+        self.assertEqual(len(read), 1000)
+
+    def test_iter_partition_parallel_closed(self):
+        pairs = iter_partition_parallel(GT(5), iter(range(0, 100000)), workers=2, chunksize=10, prefetch=1)
+        self.assertEqual(next(pairs), (0, False))
+        pairs.close()
+        self.assertEqual(list(pairs), [])
+        # invalid arguments are reported on call, without iteration
+        with self.assertRaises(ValueError):
+            iter_partition_parallel(GT(5), [1], workers=2, prefetch=0)
+        with self.assertRaises(ValueError):
+            iter_partition_parallel(GT(5), [1], workers=2, chunksize=0)
+
+    def test_filter_values_parallel(self):
+        validator = Len(Between(2, 3)) | EQ(None)
+        values = ['a', 'ab', None, 'abcd', 'abc', 42, [1, 2]] * 10
+        self.assertEqual(validator.filter_values_parallel(values, workers=2, chunksize=4),
+                         validator.filter_values(*values))
+
+    def test_error(self):
+        with self.assertRaises(TypeError):
+            GT(5).filter_values_parallel([1, 'a', 3], workers=2, chunksize=1)
+        with self.assertRaises(ValueError):
+            GT(5).filter_values_parallel([1], workers=2, chunksize=0)
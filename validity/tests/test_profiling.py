@@ -0,0 +1,113 @@
+#pylint: skip-file
+import time
+from unittest import TestCase
+from validity.comparator import BaseComparator, GT, LT, EQ, TypeIs
+from validity.logical_operator import Base, Or, And, Not
+from validity.profiling import profile, Profile, NodeStats
+
+
+class Slow(BaseComparator):
+    _condition_template = "slow {operand}"
+
+    def is_valid(self, value):
+        time.sleep(0.01)
+        return value == self.operand
+
+
+class LoggedGT(GT):
+
+    def is_valid(self, value):
+        return super(LoggedGT, self).is_valid(value)
+
+
+class TestProfile(TestCase):
+
+    def test_counters(self):
+        rule = And(TypeIs(int), Or(LT(0), GT(10)), Not(EQ(42)))
+        with profile() as report:
+            valid, not_valid = rule.filter_values(-5, 5, 20, 42, 'a')
+        self.assertEqual((valid, not_valid), ([-5, 20], [5, 42, 'a']))
+        stats = report.get_report()
+        self.assertEqual(set(stats), {str(rule), 'must be int', '(must be less than 0) OR (must be greater than 10)',
+                                      'must be less than 0', 'must be greater than 10', 'NOT(must be equal to 42)',
+                                      'must be equal to 42'})
+        self.assertEqual((stats[str(rule)].calls, stats[str(rule)].passed, stats[str(rule)].failed), (5, 2, 3))
+        self.assertEqual((stats['must be int'].passed, stats['must be int'].failed), (4, 1))
+        self.assertEqual((stats['must be greater than 10'].calls, stats['must be greater than 10'].passed), (3, 2))
+        self.assertEqual(stats['NOT(must be equal to 42)'].failed, 1)
+        for item in stats.values():
+            self.assertIsInstance(item, NodeStats)
+            self.assertLessEqual(item.self_time, item.total_time)
+
+    def test_self_time(self):
+        rule = And(TypeIs(int), Not(Slow(1)))
+        with profile() as report:
+            rule.is_valid(2)
+        stats = report.get_stats()
+        self.assertEqual(stats[0].text, 'slow 1')
+        self.assertGreaterEqual(stats[0].self_time, 0.009)
+        by_text = report.get_report()
+        self.assertLess(by_text[str(rule)].self_time, 0.005)
+        self.assertGreaterEqual(by_text[str(rule)].total_time, 0.009)
+        self.assertEqual([item.text for item in report.get_stats(sort_by='total_time')][:3],
+                         [str(rule), 'NOT(slow 1)', 'slow 1'])
+
+    def test_same_text(self):
+        rule = Or(And(GT(0), LT(5)), And(GT(0), LT(10)))
+        with profile() as report:
+            rule.is_valid(7)
+        stats = report.get_report()['must be greater than 0']
+        self.assertEqual((stats.nodes, stats.calls), (2, 2))
+
+    def test_merged_operands(self):
+        rule = Or(EQ(1), EQ(2), EQ(3), EQ(4), GT(10))
+        self.assertTrue(rule.is_valid(3))
+        merged = rule.get_ordered_operands()
+        self.assertEqual(len(merged), 2)
+        with profile() as report:
+            rule.filter_values(1, 3, 5, 20)
+        stats = report.get_report()
+        # operands are profiled as written, not as merged membership check
+        self.assertEqual(set(stats), set([str(rule)] + [str(operand) for operand in rule.operands]))
+        self.assertEqual([stats[str(operand)].calls for operand in rule.operands], [4, 3, 3, 2, 2])
+        self.assertEqual(stats['must be equal to 3'].passed, 1)
+        # operands are merged again after profiling
+        self.assertEqual([type(operand) for operand in rule.get_ordered_operands()], [type(item) for item in merged])
+        self.assertEqual(Or.optimize_operands(rule), merged)
+
+    def test_errors(self):
+        rule = And(GT(5))
+        with profile() as report:
+            with self.assertRaises(TypeError):
+                rule.is_valid('a')
+        stats = report.get_report()
+        self.assertEqual(stats['must be greater than 5'].errors, 1)
+        self.assertEqual(stats[str(rule)].errors, 1)
+
+    def test_super_call(self):
+        rule = Not(LoggedGT(5))
+        with profile() as report:
+            rule.is_valid(7)
+        stats = report.get_report()['must be greater than 5']
+        self.assertEqual((stats.nodes, stats.calls), (1, 1))
+
+    def test_restore(self):
+        originals = (And.is_valid, GT.is_valid, Base.is_valid, LoggedGT.is_valid, Or.optimize_operands)
+        with profile():
+            self.assertIsNot(GT.is_valid, originals[1])
+            self.assertNotEqual(Or.optimize_operands, originals[4])
+            with self.assertRaises(RuntimeError):
+                profile().start()
+        self.assertEqual((And.is_valid, GT.is_valid, Base.is_valid, LoggedGT.is_valid, Or.optimize_operands), originals)
+
+        session = Profile()
+        session.start()
+        try:
+            GT(5).is_valid(6)
+        finally:
+            session.stop()
+        GT(5).is_valid(6)
+        self.assertEqual(session.get_report()['must be greater than 5'].calls, 1)
+        self.assertIn('must be greater than 5', session.format())
+        session.clear()
+        self.assertEqual(session.get_stats(), [])
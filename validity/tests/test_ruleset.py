@@ -0,0 +1,146 @@
+#pylint: skip-file
+import random
+from unittest import TestCase
+from validity.comparator import GT, GTE, LT, EQ, NotEQ, Any, Between, TypeIs, Len, BaseComparator
+from validity.logical_operator import And, Or, Not
+from validity.cache import Cached
+from validity.interval import IntervalSet
+from validity.ruleset import RuleSet, IntervalTree, get_index_entries
+
+
+class IsEven(BaseComparator):
+    _condition_template = "must be even"
+
+    def is_valid(self, value):
+        return value % 2 == 0
+
+
+class StrictEQ(EQ):
+
+    def is_valid(self, value):
+        return type(value) is type(self.operand) and value == self.operand
+
+
+def random_rule(depth=0):
+    choice = random.random()
+    number = lambda: random.randint(-50, 50)
+    if depth < 2 and choice < 0.2:
+        return And(*[random_rule(depth + 1) for _ in range(random.randint(1, 3))])
+    if depth < 2 and choice < 0.35:
+        return Or(*[random_rule(depth + 1) for _ in range(random.randint(1, 3))])
+    if depth < 2 and choice < 0.4:
+        return Not(random_rule(depth + 1))
+    return random.choice([
+        lambda: GT(number()), lambda: LT(number()), lambda: GTE(number()), lambda: NotEQ(number()),
+        lambda: Between(*sorted([number(), number()])), lambda: EQ(number()),
+        lambda: Any(*[number() for _ in range(5)]), lambda: TypeIs(random.choice([int, float, bool])),
+        lambda: TypeIs(*random.sample([int, float, bool, str], 2)), lambda: TypeIs(int, subclasses=True),
+        lambda: Len(EQ(2)), lambda: IsEven(0)])()
+
+
+class TestIndexEntries(TestCase):
+
+    def test_leaves(self):
+        self.assertEqual(get_index_entries(EQ(5)), ([(0, 5)], True))
+        self.assertEqual(get_index_entries(Any(1, 'a')), ([(0, 1), (0, 'a')], True))
+        self.assertEqual(get_index_entries(TypeIs(int)), ([(2, int)], True))
+        self.assertEqual(get_index_entries(TypeIs(int, str)), ([(2, int), (2, str)], True))
+        self.assertIsNone(get_index_entries(TypeIs(int, subclasses=True)))
+        self.assertEqual(get_index_entries(GT(5)), ([(1, IntervalSet.greater(5))], True))
+        self.assertEqual(get_index_entries(Or(GT(5), LT(0))), ([(1, IntervalSet.less(0) | IntervalSet.greater(5))], True))
+        self.assertIsNone(get_index_entries(EQ([1])))
+        self.assertIsNone(get_index_entries(Any([1], 2)))
+        self.assertIsNone(get_index_entries(Len(EQ(2))))
+        self.assertIsNone(get_index_entries(StrictEQ(5)))
+        self.assertIsNone(get_index_entries(Cached(EQ(5))))
+
+    def test_logical_operators(self):
+        self.assertEqual(get_index_entries(Or(EQ('a'), TypeIs(int))), ([(0, 'a'), (2, int)], True))
+        self.assertIsNone(get_index_entries(Or(EQ('a'), Len(EQ(2)))))
+        self.assertEqual(get_index_entries(And(TypeIs(int), GT(5), Any(7, 8))), ([(0, 7), (0, 8)], False))
+        self.assertEqual(get_index_entries(And(TypeIs(str), Len(EQ(2)))), ([(2, str)], False))
+        self.assertEqual(get_index_entries(And(EQ('a'))), ([(0, 'a')], True))
+        self.assertEqual(get_index_entries(And(And(EQ('a'), Len(EQ(1))))), ([(0, 'a')], False))
+        self.assertIsNone(get_index_entries(And(Len(EQ(2)), Not(EQ('a')))))
+
+
+class TestIntervalTree(TestCase):
+
+    def test_query(self):
+        random.seed(3)
+        items = []
+        for index in range(0, 300):
+            start, end = sorted([random.randint(-100, 100), random.randint(-100, 100)])
+            items.append(((start, random.randint(0, 1)), (end, random.randint(0, 1)), index))
+        items = [item for item in items if item[0] < item[1]]
+        tree = IntervalTree(items)
+        for value in range(-102, 102):
+            key = (value, 0)
+            result = set()
+            tree.query(key, result)
+            self.assertEqual(result, set(data for start, end, data in items if start <= key < end))
+
+    def test_empty(self):
+        result = set()
+        IntervalTree([]).query((5, 0), result)
+        self.assertEqual(result, set())
+
+
+class TestRuleSet(TestCase):
+
+    def test_container(self):
+        rules = RuleSet({'a': EQ(1)})
+        rules.add('b', GT(5))
+        rules.add('c', TypeIs(str))
+        self.assertEqual(len(rules), 3)
+        self.assertIn('b', rules)
+        self.assertEqual(list(rules), ['a', 'b', 'c'])
+        self.assertEqual(rules.match(10), ['b'])
+        rules.add('a', EQ(10))
+        self.assertEqual(list(rules), ['b', 'c', 'a'])
+        self.assertEqual(rules.match(10), ['b', 'a'])
+        rules.remove('b')
+        self.assertEqual(rules.match(10), ['a'])
+        self.assertEqual(rules['a'], EQ(10))
+        with self.assertRaises(KeyError):
+            rules.remove('b')
+        with self.assertRaises(ValueError):
+            rules.add('d', 42)
+
+    def test_match(self):
+        rules = RuleSet()
+        rules.add('answer', EQ(42))
+        rules.add('small', And(TypeIs(int), Between(0, 9)))
+        rules.add('big or negative', Or(GT(100), LT(0)))
+        rules.add('short', Len(LT(3)))
+        rules.add('letter', Any('a', 'b', 'c'))
+        rules.add('even', IsEven(0))
+        rules.add('nan', NotEQ(5))
+        self.assertEqual(rules.match(42), ['answer', 'even', 'nan'])
+        self.assertEqual(rules.match(5), ['small'])
+        self.assertEqual(rules.match(-5.5), ['big or negative', 'nan'])
+        self.assertEqual(rules.match('a'), ['short', 'letter', 'nan'])
+        self.assertEqual(rules.match([1, 2, 3]), ['nan'])
+        self.assertEqual(rules.match(float('nan')), ['nan'])
+        self.assertEqual(rules.match(42.0), ['answer', 'even', 'nan'])
+
+    def test_unhashable_value(self):
+        rules = RuleSet({'list': EQ([1, 2]), 'tuple': EQ((1, 2)), 'any': Any((1, 2), 3)})
+        self.assertEqual(rules.match([1, 2]), ['list'])
+        self.assertEqual(sorted(rules.match((1, 2))), ['any', 'tuple'])
+
+    def test_same_as_is_valid(self):
+        random.seed(1)
+        validators = dict((index, random_rule()) for index in range(0, 1000))
+        rules = RuleSet(validators)
+        values = [random.randint(-60, 60) for _ in range(0, 100)] + \
+            [random.uniform(-60, 60) for _ in range(0, 100)] + [True, False, float('inf'), float('-inf'), float('nan')]
+        for value in values:
+            expected = []
+            for name in sorted(validators):
+                try:
+                    if validators[name].is_valid(value):
+                        expected.append(name)
+                except TypeError:
+                    pass
+            self.assertEqual(rules.match(value), expected)
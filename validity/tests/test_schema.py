@@ -0,0 +1,219 @@
+#pylint: skip-file
+import pickle
+from unittest import TestCase
+from validity.comparator import GT, LT, EQ, Any, Between, TypeIs, IsNone, Len
+from validity.logical_operator import Or, And, Not
+from validity.error import Error
+from validity.schema import Key, Optional, Schema, MissingItemError
+from validity.tests.helpers import Counter
+
+
+RECORDS = [
+    {'id': 1, 'type': 'click'},
+    {'id': 1, 'type': 'view', 'comment': 'short'},
+    {'id': 1, 'type': 'view', 'comment': 'x' * 20},
+    {'id': 1, 'type': 'view', 'comment': None},
+    {'id': 0, 'type': 'click'},
+    {'id': '1', 'type': 'click'},
+    {'id': 1, 'type': 'buy'},
+    {'id': 1},
+    {'type': 'click'},
+    {},
+    None,
+    42,
+    'id',
+    [1, 2],
+]
+
+
+class TestKey(TestCase):
+
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            Key('a', 42)
+        with self.assertRaises(ValueError):
+            Optional(42)
+        self.assertTrue(Key('a', GT(0)).is_required())
+        self.assertFalse(Key('a', Optional(GT(0))).is_required())
+
+    def test_is_valid(self):
+        test = Key('a', GT(0))
+        self.assertTrue(test.is_valid({'a': 1}))
+        self.assertFalse(test.is_valid({'a': 0}))
+        self.assertFalse(test.is_valid({}))
+        self.assertFalse(test.is_valid(None))
+        self.assertFalse(test.is_valid([1]))
+        self.assertTrue(Key(0, GT(0)).is_valid([1]))
+        self.assertFalse(Key(5, GT(0)).is_valid([1]))
+
+    def test_optional(self):
+        test = Key('a', Optional(GT(0)))
+        self.assertTrue(test.is_valid({}))
+        self.assertTrue(test.is_valid({'a': 1}))
+        self.assertFalse(test.is_valid({'a': 0}))
+        self.assertFalse(test.is_valid(None))
+        self.assertTrue(Optional(GT(0)).is_valid(1))
+
+    def test_condition_text(self):
+        self.assertEqual(str(Key('a', GT(0))), "item `a` must be greater than 0")
+        self.assertEqual(str(Key(1, Optional(Or(GT(0), IsNone())))),
+                         "item 1 (if present) (must be greater than 0) OR (must be None)")
+        self.assertEqual(Key('a', GT(0)).get_error({'a': 0}), "item `a` must be greater than 0")
+
+    def test_missing(self):
+        test = Key('a', GT(1))
+        self.assertEqual(test.get_error({}), "item `a` must be present")
+        self.assertEqual(Key(1, GT(1)).get_error([0]), "item 1 must be present")
+        self.assertEqual(test.get_error(None), "item `a` must be greater than 1")
+        self.assertIsNone(test.get_error({'a': 2}))
+        self.assertIsNone(Key('a', Optional(GT(1))).get_error({}))
+        error = test.get_error({}, lazy=True)
+        self.assertIsInstance(error, MissingItemError)
+        self.assertIs(error.validator, test)
+        self.assertEqual(str(error), "item `a` must be present")
+        self.assertEqual(error.get_text(max_length=10), "item `a...")
+
+    def test_structure(self):
+        self.assertEqual(Key('a', GT(0)), Key('a', GT(0)))
+        self.assertNotEqual(Key('a', GT(0)), Key('b', GT(0)))
+        self.assertNotEqual(Key(1, GT(0)), Key(True, GT(0)))
+        self.assertNotEqual(Key('a', GT(0)), Key('a', Optional(GT(0))))
+        self.assertEqual(hash(Key('a', Optional(GT(0)))), hash(Key('a', Optional(GT(0)))))
+
+    def test_compile(self):
+        for test in (Key('a', GT(0)), Key('a', Optional(GT(0))), Key(0, And(TypeIs(int), Not(EQ(5))))):
+            compiled = test.compile()
+            for value in [{'a': 1}, {'a': 0}, {}, None, [1], [5], {0: 1}]:
+                self.assertEqual(compiled(value), test.is_valid(value), msg=(str(test), value))
+
+
+class TestSchema(TestCase):
+
+    def setUp(self):
+        self.schema = Schema({
+            'id': And(TypeIs(int), GT(0)),
+            'type': Any('click', 'view'),
+            'comment': Optional(Len(LT(10))),
+        })
+
+    def expected(self, value):
+        if not isinstance(value, dict) or 'id' not in value or 'type' not in value:
+            return False
+        return type(value['id']) is int and value['id'] > 0 and value['type'] in ('click', 'view') and \
+            ('comment' not in value or (value['comment'] is not None and len(value['comment']) < 10))
+
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            Schema({})
+        with self.assertRaises(ValueError):
+            Schema({'a': 42})
+        with self.assertRaises(ValueError):
+            Schema([Key('a', GT(0)), GT(1)])
+        with self.assertRaises(ValueError):
+            Schema([Key('a', GT(0)), Key('a', LT(1))])
+        self.assertEqual(Schema([Key('a', GT(0))]), Schema({'a': GT(0)}))
+        # keys of dict are sorted, required keys are checked first
+        self.assertEqual([key.name for key in self.schema.keys], ['comment', 'id', 'type'])
+        self.assertEqual([key.name for key in self.schema.get_ordered_keys()], ['id', 'type', 'comment'])
+        self.assertEqual([key.name for key in Schema({2: GT(0), 'a': GT(0), 1: GT(0)}).keys], [1, 2, 'a'])
+
+    def test_is_valid(self):
+        for record in RECORDS:
+            self.assertEqual(self.schema.is_valid(record), self.expected(record), msg=record)
+        self.assertTrue(Schema({'a': GT(0)}).is_valid({'a': 1, 'extra': None}))
+        self.assertTrue(Schema({'a': Optional(GT(0))}).is_valid({}))
+        self.assertFalse(Schema({'a': Optional(GT(0))}).is_valid(None))
+        self.assertTrue(Schema({0: GT(0), 1: LT(0)}).is_valid((1, -1)))
+
+    def test_short_circuit(self):
+        first, second = Counter(0), Counter(0)
+        test = Schema({'a': first, 'b': second})
+        self.assertFalse(test.is_valid({'a': 0, 'b': 1}))
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        self.assertFalse(test.is_valid({'a': 1}))
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        self.assertEqual(len(test.get_errors({'a': 0, 'b': 0})), 2)
+        self.assertEqual((first.calls, second.calls), (2, 1))
+
+    def test_compile(self):
+        compiled = self.schema.compile()
+        for record in RECORDS:
+            self.assertEqual(compiled(record), self.schema.is_valid(record), msg=record)
+        for test in (Schema({'a': GT(0)}), Schema({'a': Optional(GT(0))}), Schema({0: GT(0), 1: Optional(LT(0))})):
+            compiled = test.compile()
+            for value in [{'a': 1}, {'a': 0}, {}, None, [1], [1, 2], (1, -1), {0: 1}]:
+                self.assertEqual(compiled(value), test.is_valid(value), msg=(str(test), value))
+
+    def test_errors(self):
+        record = {'id': 0, 'type': 'buy', 'comment': 'ok'}
+        self.assertEqual(self.schema.get_error(record), "item `id` (must be int) AND (must be greater than 0)")
+        self.assertEqual(self.schema.get_errors(record), [
+            "item `id` (must be int) AND (must be greater than 0)",
+            "item `type` must be any of (click, view)",
+        ])
+        self.assertIsNone(self.schema.get_error(RECORDS[0]))
+        self.assertEqual(self.schema.get_errors(RECORDS[0]), [])
+        error = self.schema.get_error({'id': 1}, lazy=True)
+        self.assertIsInstance(error, Error)
+        self.assertIs(error.validator, self.schema.keys[2])
+        self.assertEqual(str(error), "item `type` must be present")
+        self.assertEqual([error.validator for error in self.schema.get_errors({'comment': 1}, lazy=True)],
+                         list(self.schema.get_ordered_keys()))
+        self.assertEqual(self.schema.get_errors({'comment': 1}), [
+            "item `id` must be present",
+            "item `type` must be present",
+            "item `comment` (if present) length must be less than 10",
+        ])
+        self.assertEqual(str(Schema({'id': Optional(GT(1)), 'a': EQ(1)}).get_error({'id': 1})), "item `a` must be present")
+        self.assertEqual(Schema({'a': GT(1)}).get_errors({'a': 0}), ["item `a` must be greater than 1"])
+
+    def test_explain(self):
+        explanation = self.schema.explain({'id': 1, 'type': 'view', 'comment': 'x' * 20})
+        self.assertFalse(explanation.valid)
+        self.assertEqual(explanation.get_texts(), ["item `comment` (if present) length must be less than 10"])
+        self.assertTrue(self.schema.explain(RECORDS[0]).valid)
+        explanation = And(TypeIs(dict), Not(self.schema)).explain(RECORDS[0])
+        self.assertEqual(explanation.get_texts(), ["NOT(item `id` (must be int) AND (must be greater than 0))",
+                                                   "NOT(item `type` must be any of (click, view))",
+                                                   "NOT(item `comment` (if present) length must be less than 10)"])
+
+    def test_condition_text(self):
+        self.assertEqual(str(Schema({'a': GT(0), 'b': Optional(EQ(1))})),
+                         "(item `a` must be greater than 0) AND (item `b` (if present) must be equal to 1)")
+
+    def test_tree(self):
+        test = Schema({'a': Or(Between(0, 5), Between(3, 9)), 'b': Optional(And(And(GT(0), LT(5)), GT(0)))})
+        simplified = test.simplify()
+        self.assertIsInstance(simplified, Schema)
+        self.assertEqual(simplified.keys[0].validator, Between(0, 9))
+        normalized = test.normalize()
+        self.assertEqual(normalized.keys[1].validator, Optional(And(GT(0), LT(5))))
+        self.assertFalse(normalized.keys[1].is_required())
+        self.assertIs(self.schema.normalize(), self.schema)
+        self.assertEqual(test.get_children(), test.keys)
+
+    def test_pickle(self):
+        restored = pickle.loads(pickle.dumps(self.schema))
+        self.assertEqual(restored, self.schema)
+        for record in RECORDS:
+            self.assertEqual(restored.is_valid(record), self.schema.is_valid(record), msg=record)
+
+    def test_replaced_key_validator(self):
+        key = [key for key in self.schema.keys if key.name == 'type'][0]
+        record = {'id': 1, 'type': 'buy'}
+        self.assertFalse(self.schema.is_valid(record))
+        key.validator = Any('click', 'view', 'buy')
+        self.assertTrue(self.schema.is_valid(record))
+        self.assertTrue(self.schema.compile()(record))
+        self.assertEqual(self.schema.get_errors(record), [])
+        self.assertTrue(self.schema.explain(record).valid)
+
+        key.validator = Optional(Any('view'))
+        self.assertTrue(self.schema.is_valid({'id': 1}))
+        self.assertFalse(self.schema.is_valid({'id': 1, 'type': 'click'}))
+        self.assertEqual(self.schema.get_errors({'id': 1, 'type': 'click'}), ['item `type` (if present) must be any of (view)'])
+
+        key = [key for key in self.schema.keys if key.name == 'id'][0]
+        key.validator.operands[1].operand = 10
+        self.assertFalse(self.schema.is_valid({'id': 5}))
+        self.assertTrue(self.schema.is_valid({'id': 15}))
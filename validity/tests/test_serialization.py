@@ -0,0 +1,234 @@
+#pylint: skip-file
+import gc
+import os
+import pickle
+import shutil
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+from validity.comparator import (BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, InIntervals, TypeIs,
+                                 IsNone, Len, Count)
+from validity.logical_operator import Base, Or, And, Not, get_structure
+from validity.cache import Cached
+from validity.schema import Key, Optional, Schema
+from validity.interval import IntervalSet
+from validity.serialization import (dumps, loads, to_data, from_data, register, registry, Registry, LazyValidator,
+                                    DiskCache, MAGIC)
+
+
+class Divisible(BaseComparator):
+    structural = True
+    _condition_template = "must be divisible by {operand}"
+
+    def is_valid(self, value):
+        return value % self.operand == 0
+
+
+class Tagged(GT):
+    __slots__ = ('tag', )
+
+    def __init__(self, operand, tag):
+        super(Tagged, self).__init__(operand)
+        self.tag = tag
+
+
+class Custom(object):
+    pass
+
+
+register(Divisible)
+register(Tagged)
+register(Custom)
+
+VALUES = [-1, 0, 1, 2, 5, 5.5, 10, 'a', 'ab', 'abc', None, [1, 2], (1, 2, 3)]
+
+
+def outcome(validator, value):
+    try:
+        return bool(validator.is_valid(value))
+    except TypeError:
+        return TypeError
+
+
+class TestDumps(TestCase):
+
+    def assertRestored(self, validator):
+        for binary in (False, True):
+            data = dumps(validator, binary=binary)
+            self.assertIsInstance(data, bytes if binary else str)
+            restored = loads(data)
+            self.assertIs(type(restored), type(validator))
+            if get_structure(validator) is not None:  # wrappers are equal only to themselves
+                self.assertEqual(restored, validator)
+            self.assertEqual(str(restored), str(validator))
+            for value in VALUES:
+                self.assertEqual(outcome(restored, value), outcome(validator, value))
+
+    def test_built_in(self):
+        for validator in (GT(5), GTE(5), LT(5.5), LTE(5), EQ('a'), NotEQ(None), Any(1, 'a', 2), Between(1, 5),
+                          InIntervals(IntervalSet.between(1, 5).union(IntervalSet.greater(7))), TypeIs(str),
+                          InIntervals(IntervalSet.greater(7), other=True),
+                          IsNone(), IsNone('custom text'), Len(Between(1, 2)), Count(GT(2)),
+                          TypeIs(int, str), TypeIs(int, tuple, subclasses=True),
+                          Or(EQ(1), EQ(2), Not(TypeIs(int))), And(TypeIs(int), GT(0), adaptive=True),
+                          Or(And(GT(0), LT(3), adaptive=10), EQ(10)), Cached(And(TypeIs(int), GT(1)), maxsize=7)):
+            self.assertRestored(validator)
+        self.assertRestored(Key(0, GT(0)))
+        self.assertRestored(Schema({'a': Or(GT(0), EQ('a')), 0: Optional(Len(LT(5)))}))
+        self.assertTrue(loads(dumps(Schema({'a': GT(0)}))).is_valid({'a': 1}))
+        self.assertEqual(loads(dumps(And(GT(0), adaptive=10))).adaptive, 10)
+        self.assertEqual(loads(dumps(Cached(GT(0), maxsize=7))).maxsize, 7)
+
+    def test_documented_example(self):
+        rule = And(TypeIs(str), Len(Between(1, 3)), Or(Any('a', 'ab'), Any('abc')))
+        self.assertEqual(dumps(rule), '{"data":["And",["TypeIs","str"],["Len",["Between",1,3]],'
+                                      '["Or",["Any","a","ab"],["Any","abc"]]],"format":1}')
+
+    def test_compact(self):
+        self.assertEqual(to_data(And(TypeIs(int), Between(1, 5), Any('a', 'b'), Not(EQ(1)))),
+                         ['And', ['TypeIs', 'int'], ['Between', 1, 5], ['Any', 'a', 'b'], ['Not', ['EQ', 1]]])
+        self.assertEqual(to_data(Or(GT(1), adaptive=True)), ['Or', {'adaptive': True}, ['GT', 1]])
+        self.assertEqual(to_data(TypeIs(int, str, Decimal)), ['TypeIs', 'int', 'str', 'Decimal'])
+        self.assertEqual(to_data(TypeIs(int, subclasses=True)), ['TypeIs', {'subclasses': True}, 'int'])
+        self.assertEqual(from_data(['TypeIs', {'type': 'int'}]), TypeIs(int))
+        self.assertTrue(from_data(['TypeIs', {'subclasses': True}, 'int']).is_valid(True))
+        self.assertEqual(to_data(InIntervals(IntervalSet.greater(1))), ['InIntervals', to_data(IntervalSet.greater(1))])
+        self.assertIsNone(from_data(to_data(InIntervals(IntervalSet.greater(1)))).other)
+        self.assertIn('state', to_data(InIntervals(IntervalSet.greater(1), True))[1])
+        self.assertEqual(to_data(IsNone('text')), ['IsNone', {'state': {'_custom_text': 'text'}}])
+        self.assertEqual(to_data(IsNone()), ['IsNone', None])
+
+    def test_values(self):
+        values = [None, True, 1, 1.5, float('inf'), -float('inf'), 'text', u'text', u'\xe9t\xe9', b'\x00\xff',
+                  Decimal('1.25'),
+                  (1, (2, 3)), [1, [2]], {'a': (1, 2), 3: None}, {1, 2}, frozenset([3]), int, type(None), Custom,
+                  IntervalSet.less(5, closed=True)]
+        for binary in (False, True):
+            restored = loads(dumps(values, binary=binary))
+            self.assertEqual(restored, values)
+            self.assertEqual([type(item) for item in restored], [type(item) for item in values])
+            nan = loads(dumps(float('nan'), binary=binary))
+            self.assertNotEqual(nan, nan)
+        self.assertEqual(loads(dumps(EQ(float('nan')))).get_condition_text(), 'must be equal to nan')
+
+    def test_containers_of_validators(self):
+        rules = {'int': TypeIs(int), 'range': [Between(1, 2), (GT(5), )]}
+        restored = loads(dumps(rules, binary=True))
+        self.assertEqual(restored, rules)
+
+    def test_custom(self):
+        self.assertRestored(Divisible(3))
+        self.assertRestored(And(TypeIs(int), Divisible(3)))
+        restored = loads(dumps(Tagged(5, 'tag')))
+        self.assertEqual((restored.operand, restored.tag), (5, 'tag'))
+        self.assertNotEqual(Tagged(5, 'tag'), Tagged(5, 'other'))
+        test = Any(1, 2, 3)
+        test.max_text_values = 1
+        restored = loads(dumps(test))
+        self.assertEqual(str(restored), 'must be any of (1, ... 2 more)')
+        self.assertTrue(restored.is_valid(3))
+
+    def test_errors(self):
+        class NotRegistered(GT):
+            pass
+
+        with self.assertRaises(TypeError):
+            dumps(NotRegistered(1))
+        with self.assertRaises(TypeError):
+            dumps(EQ(object()))
+        with self.assertRaises(TypeError):
+            dumps(TypeIs(NotRegistered))
+        for data in ('{"format":1,"data":["Unknown",1]}', '{"format":2,"data":["GT",1]}', '{"format":1,"data":["int",1]}',
+                     '{"format":1,"data":["GT"]}', '{"format":1,"data":["And"]}', '{"format":1,"data":{"tag":1}}',
+                     '{"format":1,"data":[[1],2]}', '{"format":1,"data":["TypeIs"]}', 'not json', MAGIC + b'broken'):
+            with self.assertRaises(ValueError):
+                loads(data)
+        self.assertTrue(gc.isenabled())
+
+    def test_registry(self):
+        names = Registry(parent=registry)
+        names.register(Divisible, 'div')
+        self.assertEqual(to_data(Divisible(2), names), ['div', 2])
+        self.assertEqual(from_data(['div', 2], names), Divisible(2))
+        self.assertEqual(from_data(['GT', 2], names), GT(2))
+        with self.assertRaises(ValueError):
+            names.register(Tagged, 'div')
+        with self.assertRaises(ValueError):
+            from_data(['div', 2])
+        self.assertIs(register(Divisible), Divisible)
+
+
+class TestLazy(TestCase):
+
+    def test_lazy(self):
+        rules = {'small': And(TypeIs(int), LT(10)), 'big': And(TypeIs(int), GT(100))}
+        data = dumps(rules, binary=True)
+        restored = loads(data, lazy=True)
+        small, big = restored['small'], restored['big']
+        self.assertIsInstance(small, LazyValidator)
+        self.assertFalse(small.is_loaded())
+        self.assertEqual(loads(dumps(restored, binary=True)), rules)
+        self.assertFalse(small.is_loaded())
+
+        self.assertTrue(small.is_valid(5))
+        self.assertTrue(small.is_loaded())
+        self.assertFalse(big.is_loaded())
+        self.assertEqual(small, rules['small'])
+        self.assertEqual(hash(small), hash(rules['small']))
+        self.assertEqual(str(small), str(rules['small']))
+        self.assertEqual(str(Not(big)), 'NOT((must be int) AND (must be greater than 100))')
+        self.assertTrue(big.compile()(101))
+        self.assertEqual(big.explain(5).get_texts(), ['must be greater than 100'])
+        self.assertEqual(big.normalize(), rules['big'])
+
+    def test_pickle(self):
+        lazy = loads(dumps(GT(5)), lazy=True)
+        self.assertTrue(lazy.is_valid(6))
+        restored = pickle.loads(pickle.dumps(lazy))
+        self.assertFalse(restored.is_loaded())
+        self.assertTrue(restored.is_valid(6))
+        # default registry (with classes registered by other modules) is not pickled
+        self.assertNotIn('_names', lazy.__getstate__())
+        names = Registry(registry)
+        self.assertIs(loads(dumps(GT(5)), names=names, lazy=True).__getstate__()['_names'], names)
+
+
+class TestDiskCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.builds = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def build(self):
+        self.builds += 1
+        return [And(TypeIs(int), GT(5)), Divisible(2)]
+
+    def test_load(self):
+        cache = DiskCache(os.path.join(self.directory, 'rules'))
+        first = cache.load('config', self.build)
+        second = cache.load(u'config', self.build)
+        self.assertEqual(self.builds, 1)
+        self.assertEqual(first, second)
+        lazy = cache.load(b'config', self.build, lazy=True)
+        self.assertIsInstance(lazy[0], LazyValidator)
+        self.assertEqual(lazy, first)
+        cache.load('other config', self.build)
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(len(os.listdir(cache.directory)), 2)
+        cache.clear()
+        self.assertEqual(os.listdir(cache.directory), [])
+        cache.load('config', self.build)
+        self.assertEqual(self.builds, 3)
+
+    def test_broken(self):
+        cache = DiskCache(self.directory)
+        self.assertNotEqual(cache.get_key('a'), cache.get_key('b'))
+        with open(cache.get_path('config'), 'wb') as broken:
+            broken.write(MAGIC + b'broken')
+        self.assertEqual(cache.load('config', self.build)[1], Divisible(2))
+        self.assertEqual(self.builds, 1)
+        cache.load('config', self.build)
+        self.assertEqual(self.builds, 1)
@@ -0,0 +1,141 @@
+#pylint: skip-file
+import pickle
+import random
+from decimal import Decimal
+from unittest import TestCase
+import numpy
+from validity.comparator import GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, InIntervals, TypeIs, BaseComparator
+from validity.logical_operator import And, Or, Not
+from validity.interval import IntervalSet
+from validity.sorted_index import SortedIndex, select
+
+
+class IsEven(BaseComparator):
+    _condition_template = "must be even"
+
+    def is_valid(self, value):
+        return value % 2 == 0
+
+
+def random_validator(depth=0):
+    choice = random.random()
+    number = lambda: random.randint(-50, 50)
+    if depth < 2 and choice < 0.2:
+        return And(*[random_validator(depth + 1) for _ in range(random.randint(1, 3))])
+    if depth < 2 and choice < 0.35:
+        return Or(*[random_validator(depth + 1) for _ in range(random.randint(1, 3))])
+    if depth < 2 and choice < 0.4:
+        return Not(random_validator(depth + 1))
+    return random.choice([
+        lambda: GT(number()), lambda: LT(number()), lambda: GTE(number()), lambda: LTE(number()),
+        lambda: NotEQ(number()), lambda: EQ(number()), lambda: Between(*sorted([number(), number()])),
+        lambda: Any(*[number() for _ in range(3)]), lambda: IsEven(0)])()
+
+
+class TestSortedIndex(TestCase):
+
+    def test_sorting(self):
+        index = SortedIndex([5, 1, 3.5, Decimal(2), 1])
+        self.assertEqual(index.values, [1, 1, Decimal(2), 3.5, 5])
+        self.assertIs(index.keys, index.values)
+        self.assertEqual(index.nan_start, 5)
+        self.assertEqual(len(index), 5)
+
+        index = SortedIndex(['bb', 'a', 'ccc'], key=len)
+        self.assertEqual(index.keys, [1, 2, 3])
+        self.assertEqual(index.values, ['a', 'bb', 'ccc'])
+
+    def test_nan(self):
+        nan = float('nan')
+        index = SortedIndex([3, nan, 1, float('inf'), -float('inf')])
+        self.assertEqual(index.values[:4], [-float('inf'), 1, 3, float('inf')])
+        self.assertEqual(index.nan_start, 4)
+        self.assertEqual(select(index, GT(0)), [1, 3, float('inf')])
+        self.assertEqual(select(index, LT(2)), [-float('inf'), 1])
+        self.assertEqual(len(select(index, NotEQ(3))), 4)
+        self.assertNotEqual(select(index, NotEQ(3))[-1], select(index, NotEQ(3))[-1])
+
+    def test_not_numbers(self):
+        self.assertRaises(TypeError, SortedIndex, [1, 'a'])
+        self.assertRaises(TypeError, SortedIndex, [{'a': None}], key=lambda value: value['a'])
+
+    def test_search(self):
+        index = SortedIndex([1, 2, 2, 2, 3])
+        self.assertEqual(index.search(2), 1)
+        self.assertEqual(index.search(2, after=True), 4)
+        self.assertEqual(index.search(0), 0)
+        self.assertEqual(index.search(10, after=True), 5)
+
+    def test_get_slices(self):
+        index = SortedIndex(range(0, 10))
+        self.assertEqual(index.get_slices(IntervalSet.between(2, 4)), [slice(2, 5)])
+        self.assertEqual(index.get_slices(IntervalSet.greater(4) | IntervalSet.less(2)), [slice(0, 2), slice(5, 10)])
+        self.assertEqual(index.get_slices(IntervalSet.between(20, 30)), [])
+        self.assertEqual(index.take([slice(0, 2), slice(8, 10)]), [0, 1, 8, 9])
+
+    def test_select(self):
+        index = SortedIndex([7, 3.5, 10, 1, 42, 5, 15, 3])
+        self.assertEqual(select(index, Or(LT(3), Between(5, 10))), [1, 5, 7, 10])
+        self.assertEqual(select(index, And(GT(3), Not(EQ(5)))), [3.5, 7, 10, 15, 42])
+        self.assertEqual(select(index, GTE(Decimal('3.5'))), [3.5, 5, 7, 10, 15, 42])
+        self.assertEqual(select(index, And(GT(10), LT(5))), [])
+        self.assertEqual(select(index, InIntervals(IntervalSet.between(3, 5))), [3, 3.5, 5])
+
+    def test_select_records(self):
+        readings = [{'sensor': 'a', 'value': 20.5}, {'sensor': 'b', 'value': 18.0}, {'sensor': 'c', 'value': 25.1}]
+        index = SortedIndex(readings, key=lambda reading: reading['value'])
+        self.assertEqual([reading['sensor'] for reading in select(index, GT(20))], ['a', 'c'])
+        self.assertEqual([reading['sensor'] for reading in select(index, TypeIs(float))], ['b', 'a', 'c'])
+
+    def test_fallback(self):
+        index = SortedIndex([4, 1, 3, 2, 6.5])
+        self.assertEqual(select(index, IsEven(0)), [2, 4])
+        self.assertEqual(select(index, And(TypeIs(int), GT(2))), [3, 4])
+
+    def test_random(self):
+        random.seed(25)
+        values = [random.randint(-60, 60) for _ in range(300)] + [random.random() * 100 - 50 for _ in range(100)]
+        index = SortedIndex(values)
+        ordered = sorted(values)
+        for _ in range(300):
+            validator = random_validator()
+            self.assertEqual(select(index, validator), validator.filter_values(*ordered)[0], validator)
+
+    def test_pickle(self):
+        index = pickle.loads(pickle.dumps(SortedIndex([3, 1, 2])))
+        self.assertEqual(select(index, GT(1)), [2, 3])
+
+
+class TestSortedIndexArray(TestCase):
+
+    def test_array(self):
+        values = numpy.array([7, 3.5, 10, 1, 42, numpy.nan, 5, 15, 3])
+        index = SortedIndex(values)
+        self.assertEqual(index.nan_start, 8)
+        self.assertEqual(select(index, Or(LT(3), Between(5, 10))).tolist(), [1, 5, 7, 10])
+        self.assertEqual(select(index, And(GT(3), Not(EQ(5)))).tolist(), [3.5, 7, 10, 15, 42])
+        self.assertEqual(select(index, GT(100)).tolist(), [])
+        self.assertEqual(len(select(index, NotEQ(5))), 8)
+        self.assertEqual(select(index, Any(1, 3, 5)).tolist(), [1, 3, 5])
+        self.assertEqual(select(index, IsEven(0)).tolist(), [10, 42])
+        self.assertEqual(values[0], 7)  # array is not sorted in place
+
+    def test_integer_array(self):
+        index = SortedIndex(numpy.arange(100, 0, -1))
+        self.assertEqual(index.nan_start, 100)
+        self.assertEqual(select(index, Between(Decimal('9.5'), 12)).tolist(), [10, 11, 12])
+        self.assertEqual(select(index, GTE(99.0)).dtype, index.values.dtype)
+
+    def test_not_supported(self):
+        self.assertRaises(ValueError, SortedIndex, numpy.zeros((2, 2)))
+        self.assertRaises(ValueError, SortedIndex, numpy.array(['a', 'b']))
+        self.assertRaises(TypeError, SortedIndex, numpy.arange(3), key=abs)
+
+    def test_random(self):
+        random.seed(26)
+        values = numpy.array([random.randint(-60, 60) for _ in range(300)], dtype=float)
+        index = SortedIndex(values)
+        ordered = numpy.sort(values)
+        for _ in range(200):
+            validator = random_validator()
+            self.assertEqual(select(index, validator).tolist(), ordered[validator.mask(ordered)].tolist(), validator)
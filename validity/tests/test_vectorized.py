@@ -0,0 +1,168 @@
+#pylint: skip-file
+import os
+import subprocess
+import sys
+from unittest import TestCase, skipIf
+from validity.comparator import BaseComparator, GT, GTE, LT, LTE, EQ, NotEQ, Any, Between, TypeIs, IsNone, Len
+from validity.logical_operator import Or, And, Not
+from validity.vectorized import get_mask, validate_columns, ColumnSchema
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class IsDividableFor(BaseComparator):
+    _condition_template = "value must be dividable by {operand}"
+
+    def is_valid(self, value):
+        return value % self.operand == 0
+
+
+class StrictGT(GT):
+
+    def is_valid(self, value):
+        return value > self.operand + 10
+
+
+class TestImport(TestCase):
+
+    def test_numpy_is_not_imported(self):
+        code = "import sys, validity; validity.Or(validity.EQ(1), validity.GT(5)).is_valid(3); " \
+               "sys.exit('numpy' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(subprocess.call([sys.executable, '-c', code], cwd=root), 0)
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestVectorized(TestCase):
+
+    def assertSameResults(self, validator, values, chunk_size=None):
+        mask = validator.is_valid_array(values, chunk_size=chunk_size)
+        self.assertEqual(mask.dtype, bool)
+        self.assertEqual(mask.shape, numpy.shape(values))
+        expected = [bool(validator.is_valid(value)) for value in numpy.asarray(values).ravel().tolist()]
+        self.assertEqual(mask.ravel().tolist(), expected, msg=str(validator))
+
+    def test_comparators(self):
+        values = numpy.arange(-20, 60)
+        for comparator in [GT, GTE, LT, LTE, EQ, NotEQ]:
+            self.assertSameResults(comparator(10), values)
+            self.assertSameResults(comparator(10.5), values / 2.0)
+        self.assertSameResults(Between(5, 20), values)
+        self.assertSameResults(Any(1, 5, 7, 42), values)
+        self.assertSameResults(Any(1, '5', 7), values)
+        self.assertSameResults(IsNone(), values)
+        self.assertSameResults(Or(LT(0), Between(10, 20), GT(40), Not(LT(50))).simplify(), values)
+        self.assertSameResults(Or(NotEQ(10), GT(40)).simplify(), numpy.array([1.0, 10.0, float('nan'), 50.0]))
+        self.assertSameResults(IsNone(), numpy.array([1, None, 'a', None], dtype=object))
+        self.assertSameResults(Any(b'UA', b'U', b''), numpy.array([b'UA', b'U', b'', b'UAX', b'u'], dtype='S3'))
+        self.assertSameResults(Any(u'a', u'abc', u'\xe9'), numpy.array([u'ab', u'a', u'', u'\xe9'], dtype='U2'))
+        self.assertSameResults(Any(b'a\0', b'a'), numpy.array([b'a', b'a\0b'], dtype='S3'))
+        self.assertSameResults(Any(u'a', b'a'), numpy.array([u'a', u'b'], dtype='U1'))
+
+    def test_trailing_zero_operand(self):
+        # numpy ignores trailing zero characters, python does not
+        strings = numpy.array([u'a', u'b', u''], dtype='U2')
+        for comparator in [GT, GTE, LT, LTE, EQ, NotEQ]:
+            self.assertSameResults(comparator(u'a\0'), strings)
+            self.assertSameResults(comparator(b'a\0'), numpy.array([b'a', b'b'], dtype='S2'))
+        self.assertSameResults(Between(u'a\0', u'b'), strings)
+        self.assertSameResults(Any(u'a\0', u'b'), strings)
+
+    def test_large_integers(self):
+        # numpy compares integers with floats as floats, python compares exact values
+        big = 2 ** 53
+        values = numpy.array([big + 1, big, -big - 1, 5], dtype=numpy.int64)
+        for comparator in [GT, GTE, LT, LTE, EQ, NotEQ]:
+            self.assertSameResults(comparator(float(big)), values)
+            self.assertSameResults(comparator(-float(big)), values)
+            self.assertSameResults(comparator(big + 1), numpy.array([float(big), 5.0]))
+        self.assertSameResults(Between(float(big), float(big) * 2), values)
+        self.assertSameResults(Any(float(big), 5), values)
+        self.assertSameResults(Any(big + 1), numpy.array([float(big), 5.0]))
+        self.assertSameResults(EQ(5.0), numpy.array([], dtype=numpy.int64))
+        self.assertSameResults(EQ(5.0), values[1:])
+
+    def test_fallback(self):
+        values = numpy.arange(0, 30)
+        self.assertSameResults(IsDividableFor(3), values)
+        self.assertSameResults(StrictGT(5), values)
+        self.assertSameResults(TypeIs(int), values)
+        self.assertSameResults(Len(EQ(1)), numpy.array(['a', 'bb', '', 'c']))
+        self.assertSameResults(EQ((1, 2)), numpy.array([(1, 2), (1, 3), None], dtype=object))
+
+    def test_logical_operators(self):
+        values = numpy.arange(0, 50)
+        self.assertSameResults(Or(GT(40), LT(5), EQ(20)), values)
+        self.assertSameResults(And(GT(5), LT(40), NotEQ(20)), values)
+        self.assertSameResults(Not(Between(10, 20)), values)
+        self.assertSameResults(And(Between(9, 18), Not(Between(13, 15))).or_valid(EQ(14)), values)
+        self.assertSameResults(And(GT(100), IsDividableFor(0)), values)
+        self.assertSameResults(Or(LT(100), IsDividableFor(0)), values)
+        self.assertSameResults(And(TypeIs(int), GT(5)), numpy.array([1, 10, 'a', None], dtype=object))
+
+    def test_chunks(self):
+        values = numpy.arange(0, 1000).reshape(10, 100)
+        validator = Or(Between(100, 200), IsDividableFor(7))
+        for chunk_size in [1, 7, 100, 999, 1000, 5000]:
+            self.assertSameResults(validator, values, chunk_size=chunk_size)
+        with self.assertRaises(ValueError):
+            validator.mask(values, chunk_size=0)
+        for chunk_size in [0, -1]:
+            with self.assertRaises(ValueError):
+                validator.mask(numpy.array([]), chunk_size=chunk_size)
+
+    def test_mask(self):
+        values = list(range(38, 53))
+        self.assertEqual(numpy.asarray(values)[(GT(50) | LT(40) | EQ(42)).mask(values)].tolist(), [38, 39, 42, 51, 52])
+        self.assertEqual(get_mask(GT(10), []).tolist(), [])
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestColumns(TestCase):
+
+    def setUp(self):
+        self.table = numpy.array([(1, 20.5, b'UA'), (2, -100.0, b'PL'), (3, 36.6, b'XX'), (4, 70.0, b'')],
+                                 dtype=[('id', 'i8'), ('temperature', 'f8'), ('country', 'S2')])
+        self.rules = {'temperature': Between(-50, 50), 'country': Any(b'UA', b'PL')}
+
+    def test_structured_array(self):
+        result = validate_columns(self.table, self.rules)
+        self.assertEqual(result.mask.tolist(), [True, False, False, False])
+        self.assertEqual(result.failures['temperature'].tolist(), [False, True, False, True])
+        self.assertEqual(result.failures['country'].tolist(), [False, False, True, True])
+        self.assertEqual(sorted(result.failures), ['country', 'temperature'])
+        expected = [all(validator.is_valid(row[field]) for field, validator in self.rules.items())
+                    for row in self.table]
+        self.assertEqual(result.mask.tolist(), expected)
+
+    def test_dict(self):
+        columns = {'id': [1, 2, 3], 'value': numpy.array([5, 50, 15])}
+        result = validate_columns(columns, {'id': GT(1), 'value': Or(LT(10), IsDividableFor(5))})
+        self.assertEqual(result.mask.tolist(), [False, True, True])
+        self.assertEqual(result.failures['id'].tolist(), [True, False, False])
+        self.assertEqual(validate_columns(columns, {}).mask.tolist(), [])
+
+    def test_chunks(self):
+        for chunk_size in [1, 3, 100]:
+            self.assertEqual(validate_columns(self.table, self.rules, chunk_size).mask.tolist(),
+                             [True, False, False, False])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            validate_columns(self.table, {'missing': GT(1)})
+        with self.assertRaises(ValueError):
+            validate_columns({'a': [1, 2], 'b': [1, 2, 3]}, {'a': GT(1), 'b': GT(1)})
+        with self.assertRaises(ValueError):
+            validate_columns(numpy.arange(0, 10), {'a': GT(1)})
+        with self.assertRaises(ValueError):
+            validate_columns({'a': [[1, 2], [3, 4]]}, {'a': GT(1)})
+        with self.assertRaises(ValueError):
+            ColumnSchema({})
+
+    def test_schema(self):
+        schema = ColumnSchema(self.rules)
+        self.assertEqual(schema.mask(self.table).tolist(), [True, False, False, False])
+        self.assertEqual(self.table[~schema.validate(self.table).mask]['id'].tolist(), [2, 3, 4])
@@ -0,0 +1,302 @@
+"""
+
+Vectorized validation of `numpy <http://www.numpy.org/>`_ arrays.
+
+Any *validator* can check whole array with :meth:`~.Base.is_valid_array` (or :meth:`~.Base.mask`).
+Result is boolean mask, where each element is result of :meth:`~.Base.is_valid` for same element of array::
+
+    >>> import numpy
+    >>> from validity import And, GT, LT, EQ, Between, Not
+    >>>
+    >>> working_hours = And(Between(9, 18), Not(Between(13,15))).or_valid(EQ(14))
+    >>> hours = numpy.arange(0, 24)
+    >>> hours[working_hours.mask(hours)]
+    array([ 9, 10, 11, 12, 14, 16, 17, 18])
+
+Comparators :class:`.GT`, :class:`.GTE`, :class:`.LT`, :class:`.LTE`, :class:`.EQ`, :class:`.NotEQ`,
+:class:`.Between`, :class:`.Any` and :class:`.IsNone` are evaluated with numpy operations,
+logical operators combine masks of operands with ``&``, ``|``, ``~``.
+Other validators (including custom comparators) are evaluated element by element (see :meth:`~.Base.get_mask`).
+
+Tables (numpy structured arrays or dicts of arrays) are checked column by column with :func:`.validate_columns`
+(or :class:`.ColumnSchema`), which returns mask of valid rows and failure mask of each field.
+
+numpy is optional dependency, it is required only for vectorized validation,
+so it is imported on first use (``import validity`` does not import it).
+
+"""
+
+import sys
+from collections import namedtuple
+from numbers import Integral, Number, Real
+
+from validity.compiler import overrides_is_valid
+
+__docformat__ = 'reStructuredText'
+
+_EXACT_INTEGER = 2 ** 53
+"""integers, that are not greater than it by absolute value, are converted to float exactly"""
+
+
+def require_numpy():
+    """
+    Import numpy (once, on first vectorized validation).
+
+    :return: numpy module
+    :raises ~exceptions.ImportError: if numpy is not installed
+    """
+    module = sys.modules.get('numpy')
+    if module is not None:
+        return module
+    try:
+        import numpy  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImportError("numpy is required for vectorized validation")
+    return numpy
+
+
+def is_array(values):
+    """
+    Check if values is numpy array, without importing numpy (if numpy is not imported yet,
+    there can not be any arrays).
+
+    :param values: any object
+    :return: True if values is instance of ``numpy.ndarray``
+    :rtype: bool
+    """
+    module = sys.modules.get('numpy')
+    return module is not None and isinstance(values, module.ndarray)
+
+
+def is_scalar(operand):
+    """
+    Check if operand can be compared with array elementwise.
+
+    :param operand: comparator operand
+    :return: True if operand is number or string
+    :rtype: bool
+    """
+    if isinstance(operand, (Number, str, bytes)):
+        return True
+    module = sys.modules.get('numpy')
+    return module is not None and isinstance(operand, module.generic)
+
+
+def is_comparable(values, operand):
+    """
+    Check if array can be compared with operand elementwise, so that results are same as results
+    of python comparison of elements (see :func:`loop_mask`). It is not so, if operand is not scalar
+    (see :func:`is_scalar`), if it is string with trailing zero character (numpy ignores trailing zeros)
+    or if integers and floats are compared, but some of integers are not converted to float exactly
+    (numpy compares them as floats, python compares exact values).
+
+    :param values: one dimensional array
+    :type values: numpy.ndarray
+    :param operand: comparator operand
+    :return: True if array can be compared with operand
+    :rtype: bool
+    """
+    if isinstance(operand, bytes):
+        return not operand.endswith(b'\0')
+    if isinstance(operand, str):
+        return not operand.endswith(u'\0')
+    if not is_scalar(operand):
+        return False
+    kind = values.dtype.kind
+    if kind in 'iu' and isinstance(operand, Real) and not isinstance(operand, Integral):
+        return not len(values) or (-_EXACT_INTEGER <= values.min() and values.max() <= _EXACT_INTEGER)
+    if kind == 'f' and isinstance(operand, Integral):
+        return -_EXACT_INTEGER <= operand <= _EXACT_INTEGER
+    return True
+
+
+def is_numeric(values):
+    """
+    Check if array contains numbers (not objects or strings).
+
+    :param values: array to check
+    :type values: numpy.ndarray
+    :rtype: bool
+    """
+    return values.dtype.kind in 'biuf'
+
+
+def loop_mask(validator, values):
+    """
+    Get mask of one dimensional array, calling :meth:`~.Base.is_valid` for each element.
+    Elements are converted to python objects before check (as they are returned by ``values.tolist()``).
+
+    :param validator: validator to check elements with
+    :type validator: Base
+    :param values: one dimensional array
+    :type values: numpy.ndarray
+    :return: boolean mask
+    :rtype: numpy.ndarray
+    """
+    numpy = require_numpy()
+    is_valid = validator.is_valid
+    return numpy.fromiter((bool(is_valid(value)) for value in values.tolist()), dtype=bool, count=len(values))
+
+
+def operand_mask(validator, values):
+    """
+    Get boolean mask of one dimensional array with :meth:`~.Base.get_mask`.
+    If validator class overrides :meth:`~.Base.is_valid`, but inherits :meth:`~.Base.get_mask`,
+    elements are checked with :func:`loop_mask`.
+
+    :param validator: validator to check elements with
+    :type validator: Base
+    :param values: one dimensional array
+    :type values: numpy.ndarray
+    :return: boolean mask
+    :rtype: numpy.ndarray
+    """
+    if overrides_is_valid(validator, 'get_mask'):
+        return loop_mask(validator, values)
+    return require_numpy().asarray(validator.get_mask(values), dtype=bool)
+
+
+def get_mask(validator, values, chunk_size=None):
+    """
+    Get boolean mask of valid elements of array.
+
+    :param validator: validator to check elements with
+    :type validator: Base
+    :param values: array or any sequence, that can be converted to array
+    :param chunk_size: if given, array is checked by chunks of this size, so temporary arrays are not larger than chunk
+    :type chunk_size: int
+    :return: boolean mask with same shape as values
+    :rtype: numpy.ndarray
+    :raises ~exceptions.ImportError: if numpy is not installed
+    :raises ~exceptions.ValueError: if chunk_size is not positive
+    """
+    numpy = require_numpy()
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    values = numpy.asarray(values)
+    flat = values.ravel()
+    if chunk_size is None or chunk_size >= len(flat):
+        return operand_mask(validator, flat).reshape(values.shape)
+
+    mask = numpy.empty(len(flat), dtype=bool)
+    for start in range(0, len(flat), chunk_size):
+        mask[start:start + chunk_size] = operand_mask(validator, flat[start:start + chunk_size])
+    return mask.reshape(values.shape)
+
+
+ColumnsMask = namedtuple('ColumnsMask', ['mask', 'failures'])
+"""Result of :func:`validate_columns`: row mask (True for valid rows) and dict of failure masks by field name
+(True for rows, where field is not valid)"""
+
+
+def get_columns(columns, fields):
+    """
+    Get one dimensional arrays of fields.
+
+    :param columns: numpy structured array or dict of one dimensional arrays (or sequences) with same length
+    :param fields: names of fields
+    :type fields: list
+    :return: (length, dict of arrays by field name)
+    :rtype: tuple
+    :raises ~exceptions.ImportError: if numpy is not installed
+    :raises ~exceptions.ValueError: if field is not found or columns are not one dimensional arrays with same length
+    """
+    numpy = require_numpy()
+    if isinstance(columns, numpy.ndarray):
+        if columns.dtype.names is None or columns.ndim != 1:
+            raise ValueError("columns must be one dimensional structured array or dict of arrays")
+        available = columns.dtype.names
+    else:
+        available = columns
+    result = {}
+    length = None
+    for field in fields:
+        if field not in available:
+            raise ValueError("field '{field}' is not found in columns".format(field=field))
+        column = numpy.asarray(columns[field])
+        if column.ndim != 1:
+            raise ValueError("field '{field}' must be one dimensional".format(field=field))
+        if length is None:
+            length = len(column)
+        elif len(column) != length:
+            raise ValueError("all fields must have same length")
+        result[field] = column
+    if length is None and isinstance(columns, numpy.ndarray):
+        length = len(columns)
+    return length or 0, result
+
+
+def validate_columns(columns, rules, chunk_size=None):
+    """
+    Check columns of table with validators of fields. Each column is checked with :func:`get_mask`,
+    so values are not converted to python objects (unless validator is not vectorized)::
+
+        >>> import numpy
+        >>> from validity import Between, Any
+        >>> from validity.vectorized import validate_columns
+        >>>
+        >>> table = numpy.array([(1, 20.5, b'UA'), (2, -1.0, b'PL'), (3, 36.6, b'XX')],
+        ...                     dtype=[('id', 'i8'), ('temperature', 'f8'), ('country', 'S2')])
+        >>> result = validate_columns(table, {'temperature': Between(-50, 50), 'country': Any(b'UA', b'PL')})
+        >>> result.mask
+        array([ True,  True, False])
+        >>> result.failures['country']
+        array([False, False,  True])
+        >>> table[~result.mask]['id']
+        array([3])
+
+    :param columns: numpy structured array or dict of one dimensional arrays with same length
+    :param rules: validators by field name
+    :type rules: dict
+    :param chunk_size: if given, each column is checked by chunks of this size (see :func:`get_mask`)
+    :type chunk_size: int
+    :return: row mask and failure masks of fields
+    :rtype: ColumnsMask
+    :raises ~exceptions.ImportError: if numpy is not installed
+    :raises ~exceptions.ValueError: if field is not found or columns are not one dimensional arrays with same length
+    """
+    length, arrays = get_columns(columns, list(rules))
+    mask = require_numpy().ones(length, dtype=bool)
+    failures = {}
+    for field, validator in rules.items():
+        failed = ~get_mask(validator, arrays[field], chunk_size)
+        mask &= ~failed
+        failures[field] = failed
+    return ColumnsMask(mask, failures)
+
+
+class ColumnSchema(object):
+    """
+    Validators of table fields, that can check numpy structured arrays (or dicts of arrays)
+    with :func:`validate_columns`.
+    """
+
+    def __init__(self, rules):
+        """
+        :param rules: validators by field name
+        :type rules: dict
+        :raises ~exceptions.ValueError: if rules is empty
+        """
+        if not rules:
+            raise ValueError("at least one field must be specified")
+        self.rules = dict(rules)
+
+    def validate(self, columns, chunk_size=None):
+        """
+        :param columns: numpy structured array or dict of one dimensional arrays with same length
+        :param chunk_size: if given, each column is checked by chunks of this size
+        :type chunk_size: int
+        :return: row mask and failure masks of fields (see :func:`validate_columns`)
+        :rtype: ColumnsMask
+        """
+        return validate_columns(columns, self.rules, chunk_size)
+
+    def mask(self, columns, chunk_size=None):
+        """
+        :param columns: numpy structured array or dict of one dimensional arrays with same length
+        :param chunk_size: if given, each column is checked by chunks of this size
+        :type chunk_size: int
+        :return: row mask (True for valid rows)
+        :rtype: numpy.ndarray
+        """
+        return validate_columns(columns, self.rules, chunk_size).mask